@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: p50/p99 latency of concurrent ARKResourceClient.a_get calls.
+
+Compares the previous implementation (the sync kubernetes client pushed onto the
+default thread pool with asyncio.to_thread) against the kubernetes_asyncio-backed
+a_get, both talking to the same local fake apiserver.
+
+Usage (with the generated ark_sdk installed):
+    python benchmarks/async_get_latency.py --concurrency 500 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from fake_apiserver import FakeAPIServer, make_query
+
+NAMES = [f"bench-query-{i}" for i in range(50)]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_batch(call: Callable[[str], Awaitable[object]], concurrency: int) -> List[float]:
+    """Fire `concurrency` calls at once and return per-call latencies in ms"""
+    async def timed(i: int) -> float:
+        start = time.perf_counter()
+        await call(NAMES[i % len(NAMES)])
+        return (time.perf_counter() - start) * 1000
+
+    return await asyncio.gather(*(timed(i) for i in range(concurrency)))
+
+
+def report(label: str, samples: List[float], wall: float) -> None:
+    print(
+        f"{label:<22} p50={percentile(samples, 50):8.2f}ms  p99={percentile(samples, 99):8.2f}ms  "
+        f"max={max(samples):8.2f}ms  mean={statistics.mean(samples):8.2f}ms  wall={wall * 1000:8.1f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Imported after the fake apiserver has exported KUBECONFIG
+    from ark_sdk.versions import ARKClientV1alpha1, close_async_api_client
+
+    client = ARKClientV1alpha1(namespace="default")
+
+    async def thread_get(name: str):
+        return await asyncio.to_thread(client.queries.get, name)
+
+    async def native_get(name: str):
+        return await client.queries.a_get(name)
+
+    for label, call in (("to_thread(sync get)", thread_get), ("native a_get", native_get)):
+        await run_batch(call, min(args.concurrency, 50))  # warm up pools and config
+        samples: List[float] = []
+        wall = 0.0
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            samples.extend(await run_batch(call, args.concurrency))
+            wall += time.perf_counter() - start
+        report(label, samples, wall / args.rounds)
+
+    await close_async_api_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated apiserver latency per request")
+    args = parser.parse_args()
+
+    with FakeAPIServer([make_query(name) for name in NAMES], latency=args.latency_ms / 1000):
+        asyncio.run(main(args))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: seeding a namespace with Queries one at a time versus a_create_many.
+
+Creates the same number of Queries against the local fake apiserver, first with
+serial a_create calls and then with a_create_many at the given concurrency.
+
+Usage (with the generated ark_sdk installed):
+    python benchmarks/bulk_create.py --count 2000 --concurrency 50 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import time
+
+from fake_apiserver import FakeAPIServer, make_query
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Imported after the fake apiserver has exported KUBECONFIG
+    from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
+    from ark_sdk.versions import ARKClientV1alpha1, close_async_api_client
+
+    queries = ARKClientV1alpha1(namespace="default").queries
+
+    def build(prefix: str):
+        return [QueryV1alpha1(**make_query(f"{prefix}-{i}")) for i in range(args.count)]
+
+    serial = build("serial")
+    start = time.perf_counter()
+    for query in serial:
+        await queries.a_create(query)
+    serial_wall = time.perf_counter() - start
+    print(f"{'serial a_create':<28} {serial_wall:8.2f}s  {args.count / serial_wall:8.0f} objects/s")
+
+    bulk = build("bulk")
+    start = time.perf_counter()
+    results = await queries.a_create_many(bulk, concurrency=args.concurrency)
+    bulk_wall = time.perf_counter() - start
+    failed = sum(1 for result in results if not result.ok)
+    print(
+        f"{f'a_create_many ({args.concurrency})':<28} {bulk_wall:8.2f}s  {args.count / bulk_wall:8.0f} objects/s  "
+        f"failed={failed}"
+    )
+
+    await close_async_api_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated apiserver latency per request")
+    args = parser.parse_args()
+
+    with FakeAPIServer(latency=args.latency_ms / 1000):
+        asyncio.run(main(args))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-request cost of obtaining an ARK client.
+
+Compares the previous behaviour of `with_ark_client` (a fresh ARKClientV1alpha1 whose
+constructor eagerly built one ARKResourceClient, and so one kubernetes ApiClient, per
+CRD plural) against the cached registry with lazily created resource clients. Reports
+ApiClient allocations, traced memory and wall time per simulated request.
+
+Usage (with the generated ark_sdk installed):
+    python benchmarks/client_allocation.py --requests 2000
+"""
+
+import argparse
+import functools
+import time
+import tracemalloc
+
+from fake_apiserver import FakeAPIServer
+
+api_client_inits = 0
+
+
+def count_api_clients() -> None:
+    """Wrap kubernetes.client.ApiClient.__init__ to count allocations"""
+    from kubernetes import client as k8s_client
+
+    original_init = k8s_client.ApiClient.__init__
+
+    def counting_init(self, *args, **kwargs):
+        global api_client_inits
+        api_client_inits += 1
+        original_init(self, *args, **kwargs)
+
+    k8s_client.ApiClient.__init__ = counting_init
+
+
+def legacy_request(namespace: str):
+    """Reproduce the previous per-request construction: every plural eagerly gets its own ApiClient"""
+    from kubernetes import client as k8s_client
+    from ark_sdk.versions import ARKClientV1alpha1, ARKResourceClient
+
+    ark_client = ARKClientV1alpha1(namespace)
+    for name, attr in vars(ARKClientV1alpha1).items():
+        if not isinstance(attr, functools.cached_property):
+            continue
+        resource_client = getattr(ark_client, name)
+        if isinstance(resource_client, ARKResourceClient):
+            # What the old ARKResourceClient.__init__ did for every plural
+            resource_client.api_client = k8s_client.ApiClient()
+            resource_client.custom_api = k8s_client.CustomObjectsApi(resource_client.api_client)
+    return ark_client.queries
+
+
+def registry_request(namespace: str):
+    """Current per-request path: cached client, one resource client touched"""
+    from ark_sdk.client import get_client
+
+    return get_client(namespace, "v1alpha1").queries.custom_api
+
+
+def measure(label: str, func, requests: int) -> None:
+    global api_client_inits
+    func("default")  # warm up imports and config loading
+    api_client_inits = 0
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(requests):
+        func("default")
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<28} {api_client_inits / requests:6.2f} ApiClients/request  "
+        f"{elapsed / requests * 1e6:10.1f}us/request  peak traced memory {peak / 1024:10.1f} KiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    with FakeAPIServer():
+        # kubernetes resolves KUBECONFIG at import time, so only import it once the server is up
+        count_api_clients()
+        measure("eager client per request", legacy_request, args.requests)
+        measure("cached registry (lazy)", registry_request, args.requests)
+
+
+if __name__ == "__main__":
+    main()
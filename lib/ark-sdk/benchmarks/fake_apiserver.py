@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Minimal in-process Kubernetes API server for SDK benchmarks.
+
+Serves namespaced custom objects over plain HTTP so that the real kubernetes and
+kubernetes_asyncio clients can be exercised end to end without a cluster. A
+temporary kubeconfig pointing at the server is written and exported via KUBECONFIG.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+KUBECONFIG_TEMPLATE = """apiVersion: v1
+kind: Config
+clusters:
+- name: bench
+  cluster:
+    server: http://127.0.0.1:{port}
+contexts:
+- name: bench
+  context:
+    cluster: bench
+    user: bench
+    namespace: {namespace}
+current-context: bench
+users:
+- name: bench
+  user:
+    token: bench
+"""
+
+
+def make_query(name: str, namespace: str = "default", input_size: int = 64) -> Dict[str, Any]:
+    """Build a realistic Query object as returned by the apiserver"""
+    return {
+        "apiVersion": "ark.mckinsey.com/v1alpha1",
+        "kind": "Query",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": f"00000000-0000-0000-0000-{abs(hash(name)) % 10**12:012d}",
+            "resourceVersion": "1",
+            "creationTimestamp": "2025-01-01T00:00:00Z",
+            "labels": {"app": "bench"},
+        },
+        "spec": {
+            "type": "user",
+            "input": "x" * input_size,
+            "target": {"type": "agent", "name": "bench-agent"},
+            "timeout": "5m",
+        },
+        "status": {
+            "phase": "done",
+            "response": {"content": "y" * input_size, "target": {"type": "agent", "name": "bench-agent"}},
+            "tokenUsage": {"promptTokens": 10, "completionTokens": 20, "totalTokens": 30},
+        },
+    }
+
+
+class FakeAPIServer:
+    """Serve objects for GET/LIST/POST on /apis/{group}/{version}/namespaces/{ns}/{plural}"""
+
+    def __init__(self, objects: Optional[List[Dict[str, Any]]] = None, latency: float = 0.0, namespace: str = "default"):
+        self.objects = {obj["metadata"]["name"]: obj for obj in (objects or [])}
+        self.latency = latency
+        self.namespace = namespace
+        self.requests = 0
+        self.port: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._kubeconfig: Optional[str] = None
+        self._old_kubeconfig: Optional[str] = None
+        self._list_body: Optional[bytes] = None
+
+    async def _handle_get(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        obj = self.objects.get(request.match_info["name"])
+        if obj is None:
+            return web.json_response({"kind": "Status", "code": 404, "reason": "NotFound"}, status=404)
+        return web.json_response(obj)
+
+    async def _handle_list(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._list_body is None:
+            self._list_body = json.dumps({
+                "apiVersion": "ark.mckinsey.com/v1alpha1",
+                "kind": "QueryList",
+                "metadata": {"resourceVersion": "1"},
+                "items": list(self.objects.values()),
+            }).encode()
+        return web.Response(body=self._list_body, content_type="application/json")
+
+    async def _handle_create(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        obj = await request.json()
+        name = obj["metadata"]["name"]
+        if name in self.objects:
+            return web.json_response({"kind": "Status", "code": 409, "reason": "AlreadyExists"}, status=409)
+        obj["metadata"].setdefault("namespace", request.match_info["namespace"])
+        obj["metadata"]["resourceVersion"] = "1"
+        self.objects[name] = obj
+        self._list_body = None
+        return web.json_response(obj, status=201)
+
+    async def _start(self, ready: threading.Event) -> None:
+        app = web.Application()
+        base = "/apis/{group}/{version}/namespaces/{namespace}/{plural}"
+        app.router.add_get(base, self._handle_list)
+        app.router.add_post(base, self._handle_create)
+        app.router.add_get(base + "/{name}", self._handle_get)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        ready.set()
+
+    def _run(self, ready: threading.Event) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._start(ready))
+        self._loop.run_forever()
+
+    def __enter__(self) -> "FakeAPIServer":
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+        self._thread.start()
+        ready.wait()
+
+        fd, self._kubeconfig = tempfile.mkstemp(suffix=".kubeconfig")
+        with os.fdopen(fd, "w") as f:
+            f.write(KUBECONFIG_TEMPLATE.format(port=self.port, namespace=self.namespace))
+        self._old_kubeconfig = os.environ.get("KUBECONFIG")
+        os.environ["KUBECONFIG"] = self._kubeconfig
+        # Benchmarks measure client overhead, so client-side rate limiting is off unless requested
+        os.environ.setdefault("ARK_SDK_QPS", "0")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._old_kubeconfig is None:
+            os.environ.pop("KUBECONFIG", None)
+        else:
+            os.environ["KUBECONFIG"] = self._old_kubeconfig
+        if self._kubeconfig:
+            os.unlink(self._kubeconfig)
+        if self._loop and self._runner:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread:
+            self._thread.join()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold import time of the ark_sdk package and its entry points.
+
+Each module is imported in a fresh interpreter with `python -X importtime` and
+the cumulative time of the module itself is reported, along with the number of
+modules it loaded. Importing ark_sdk resolves models, versioned clients and
+execution engine types lazily (PEP 562), so only what is used is loaded.
+
+Usage (with the generated ark_sdk installed):
+    python benchmarks/import_time.py --rounds 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = (
+    "ark_sdk",
+    "ark_sdk.models.query_v1alpha1",
+    "ark_sdk.client",
+    "ark_sdk.versions",
+    "ark_sdk.executor_app",
+)
+
+
+def import_once(module: str) -> tuple:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    lines = [line for line in result.stderr.splitlines() if line.startswith("import time:")]
+    # Last line is the requested module; the first is the column header
+    cumulative_us = int(lines[-1].split("|")[1])
+    return cumulative_us / 1000, len(lines) - 1
+
+
+def main(args: argparse.Namespace) -> None:
+    for module in MODULES:
+        samples = [import_once(module) for _ in range(args.rounds)]
+        millis = statistics.median(ms for ms, _ in samples)
+        print(f"{module:<32} {millis:8.1f}ms  modules={samples[0][1]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: decoding a large Query list with and without the fast JSON path.
+
+Lists a ~5 MB QueryList (sized with --size-mb) through the default kubernetes
+client deserialization and through ARKResourceClient.fast_json, which reads the
+undecoded body and decodes it with orjson (when installed) before validating
+items with model_validate. CPU time is reported per list call for typed and raw
+listing, async and sync.
+
+Usage (with the generated ark_sdk installed, orjson optional):
+    python benchmarks/json_decode.py --size-mb 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Callable, Awaitable, List
+
+from fake_apiserver import FakeAPIServer, make_query
+
+# Typical completed Query: a few hundred characters of input and response
+INPUT_SIZE = 300
+
+
+async def measure(label: str, call: Callable[[], Awaitable[List[Any]]], rounds: int, items: int) -> None:
+    result = await call()  # warm up
+    assert len(result) == items, f"expected {items} items, got {len(result)}"
+    walls, cpus = [], []
+    for _ in range(rounds):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        await call()
+        walls.append((time.perf_counter() - wall_start) * 1000)
+        cpus.append((time.process_time() - cpu_start) * 1000)
+    print(f"{label:<36} wall={statistics.median(walls):8.1f}ms  cpu={statistics.median(cpus):8.1f}ms")
+
+
+async def main(args: argparse.Namespace, items: int) -> None:
+    # Imported after the fake apiserver has exported KUBECONFIG
+    from ark_sdk.versions import ARKClientV1alpha1, close_async_api_client, orjson
+
+    queries = ARKClientV1alpha1(namespace="default").queries
+    print(f"decoder for fast_json: {'orjson' if orjson is not None else 'json (orjson not installed)'}")
+
+    for fast_json in (False, True):
+        queries.fast_json = fast_json
+        suffix = " fast_json" if fast_json else ""
+
+        async def sync_list():
+            return await asyncio.to_thread(queries.list)
+
+        for label, call in (
+            ("a_list" + suffix, queries.a_list),
+            ("a_list_raw" + suffix, queries.a_list_raw),
+            ("list" + suffix, sync_list),
+        ):
+            await measure(label, call, args.rounds, items)
+
+    await close_async_api_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=5.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    item_size = len(json.dumps(make_query("bench-query-0", input_size=INPUT_SIZE)))
+    items = int(args.size_mb * 1024 * 1024 / item_size)
+    print(f"{items} Queries, ~{items * item_size / 1024 / 1024:.1f} MB per list")
+
+    with FakeAPIServer([make_query(f"bench-query-{i}", input_size=INPUT_SIZE) for i in range(items)]):
+        asyncio.run(main(args, items))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing a large number of Queries with and without model hydration.
+
+Compares what the ark-api list routes used to do (a_list, then .to_dict() on every
+pydantic model before picking a handful of fields) against a_list_raw and a_list_raw
+with a field projection. Wall and CPU time are reported per list call.
+
+Usage (with the generated ark_sdk installed):
+    python benchmarks/list_hydration.py --items 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Callable, Awaitable, Dict, List
+
+from fake_apiserver import FakeAPIServer, make_query
+
+FIELDS = ["metadata.name", "metadata.namespace", "spec.input", "status.phase"]
+
+
+def summarize(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the fields a list route typically returns"""
+    return {
+        "name": item["metadata"]["name"],
+        "namespace": item["metadata"]["namespace"],
+        "input": item["spec"].get("input"),
+        "phase": (item.get("status") or {}).get("phase"),
+    }
+
+
+async def measure(label: str, call: Callable[[], Awaitable[List[Dict[str, Any]]]], rounds: int, items: int) -> None:
+    result = await call()  # warm up
+    assert len(result) == items, f"expected {items} items, got {len(result)}"
+    walls, cpus = [], []
+    for _ in range(rounds):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        await call()
+        walls.append((time.perf_counter() - wall_start) * 1000)
+        cpus.append((time.process_time() - cpu_start) * 1000)
+    print(f"{label:<32} wall={statistics.median(walls):8.1f}ms  cpu={statistics.median(cpus):8.1f}ms")
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Imported after the fake apiserver has exported KUBECONFIG
+    from ark_sdk.versions import ARKClientV1alpha1, close_async_api_client
+
+    queries = ARKClientV1alpha1(namespace="default").queries
+
+    async def hydrated():
+        return [summarize(query.to_dict()) for query in await queries.a_list()]
+
+    async def raw():
+        return [summarize(query) for query in await queries.a_list_raw()]
+
+    async def projected():
+        return [summarize(query) for query in await queries.a_list_raw(fields=FIELDS)]
+
+    for label, call in (("a_list + to_dict", hydrated), ("a_list_raw", raw), ("a_list_raw(fields=...)", projected)):
+        await measure(label, call, args.rounds, args.items)
+
+    await close_async_api_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with FakeAPIServer([make_query(f"bench-query-{i}") for i in range(args.items)]):
+        asyncio.run(main(args))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pydantic models versus the generated msgspec structs.
+
+Decodes a QueryList body of --items Queries into ark_sdk.models.QueryV1alpha1
+(json.loads, then model_validate per item, as a_list does) and into
+ark_sdk.structs.QueryV1alpha1 (msgspec decoding the bytes directly, as a_list does
+with structs=True). Reports decode time, memory retained by the decoded list, and
+the time to read a nested attribute from every item. Also times a_list end to end
+against the fake apiserver for both model types.
+
+Usage (with the generated ark_sdk and msgspec installed):
+    python benchmarks/struct_models.py --items 10000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from fake_apiserver import FakeAPIServer, make_query
+
+
+def timed(call: Callable[[], Any], rounds: int) -> float:
+    """Median milliseconds per call"""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def retained_bytes(call: Callable[[], List[Any]]) -> int:
+    """Bytes still allocated while the result of call() is alive"""
+    gc.collect()
+    tracemalloc.start()
+    result = call()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def read_targets(items: List[Any]) -> int:
+    return sum(1 for item in items if item.spec.target.name == "bench-agent" and item.status.phase == "done")
+
+
+async def a_list_times(rounds: int) -> None:
+    from ark_sdk.versions import ARKClientV1alpha1, close_async_api_client
+
+    for label, structs in (("a_list pydantic", False), ("a_list structs", True)):
+        queries = ARKClientV1alpha1(namespace="default", structs=structs).queries
+        await queries.a_list()  # warm up
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await queries.a_list()
+            samples.append((time.perf_counter() - start) * 1000)
+        print(f"{label:<24} {statistics.median(samples):9.1f}ms")
+    await close_async_api_client()
+
+
+def main(args: argparse.Namespace) -> None:
+    # Imported after the fake apiserver has exported KUBECONFIG
+    from ark_sdk import structs
+    from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
+    from ark_sdk.versions import struct_decoder, struct_list_type
+
+    body = json.dumps({"items": [make_query(f"bench-query-{i}") for i in range(args.items)]}).encode()
+    decoder = struct_decoder(struct_list_type(structs.QueryV1alpha1))
+    print(f"{args.items} Queries, {len(body) / 1024 / 1024:.1f} MB body")
+
+    def decode_pydantic() -> List[Any]:
+        return [QueryV1alpha1.model_validate(item) for item in json.loads(body)["items"]]
+
+    def decode_structs() -> List[Any]:
+        return decoder.decode(body).items
+
+    for label, decode in (("pydantic", decode_pydantic), ("structs", decode_structs)):
+        items = decode()
+        assert read_targets(items) == args.items
+        print(
+            f"{label:<10} decode={timed(decode, args.rounds):8.1f}ms"
+            f"  retained={retained_bytes(decode) / 1024 / 1024:7.1f}MB"
+            f"  attribute access={timed(lambda: read_targets(items), args.rounds):6.2f}ms"
+        )
+
+    asyncio.run(a_list_times(args.rounds))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with FakeAPIServer([make_query(f"bench-query-{i}") for i in range(args.items)]):
+        main(args)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark: 1,000 sequential a_get calls from synchronous code.
+
+Compares the previous async_compat fallback (asyncio.run per call, which builds a new
+event loop and a new async API client every time) against the shared background loop.
+
+Usage (with the generated ark_sdk installed):
+    python benchmarks/sync_a_get.py --calls 1000
+"""
+
+import argparse
+import asyncio
+import time
+
+from fake_apiserver import FakeAPIServer, make_query
+
+
+def report(label: str, calls: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed:8.2f}s total  {elapsed / calls * 1000:8.2f}ms/call")
+
+
+def main(args: argparse.Namespace) -> None:
+    # Imported after the fake apiserver has exported KUBECONFIG
+    from ark_sdk.versions import ARKClientV1alpha1, close_async_api_client
+
+    queries = ARKClientV1alpha1(namespace="default").queries
+
+    async def legacy_get(name: str):
+        try:
+            return await queries.a_get(name)
+        finally:
+            await close_async_api_client()
+
+    start = time.perf_counter()
+    for _ in range(args.calls):
+        asyncio.run(legacy_get("bench-query"))
+    report("asyncio.run per call", args.calls, time.perf_counter() - start)
+
+    queries.a_get("bench-query")  # start the background loop
+    start = time.perf_counter()
+    for _ in range(args.calls):
+        queries.a_get("bench-query")
+    report("shared background loop", args.calls, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000)
+    args = parser.parse_args()
+
+    with FakeAPIServer([make_query("bench-query")]):
+        main(args)
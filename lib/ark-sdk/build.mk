@@ -41,12 +41,15 @@ $(ARK_SDK_OPENAPI): $(ARK_SDK_CRD_FILES) | $(OUT)
 	cd $(ARK_SDK_LIB_DIR) && uv run python crd_to_openapi.py $(addprefix $(BUILD_ROOT)/,$(ARK_SDK_CRD_FILES)) > $@
 
 # Build Python wheel in $(OUT) directory
-$(ARK_SDK_WHL): $(ARK_SDK_OPENAPI) $(ARK_SDK_LIB_DIR)/generate_ark_clients.py $(ARK_SDK_LIB_DIR)/pyproject.toml $(ARK_SDK_OVERLAY_FILES) | $(OUT)
+$(ARK_SDK_WHL): $(ARK_SDK_OPENAPI) $(ARK_SDK_LIB_DIR)/generate_ark_clients.py $(ARK_SDK_LIB_DIR)/lazy_init.py $(ARK_SDK_LIB_DIR)/pyproject.toml $(ARK_SDK_OVERLAY_FILES) | $(OUT)
 	@mkdir -p $(ARK_SDK_OUT)/py-sdk
 	cd $(ARK_SDK_LIB_DIR) && PATH="$(BUILD_EXTRA_PATH)" npx --yes @openapitools/openapi-generator-cli generate -i $(ARK_SDK_OPENAPI) -g python -o $(ARK_SDK_OUT)/py-sdk --package-name ark_sdk
 	cd $(ARK_SDK_LIB_DIR) && tar -cf - -C gen_sdk/overlay/python . | tar -xf - -C $(ARK_SDK_OUT)/py-sdk
 	cd $(ARK_SDK_LIB_DIR) && uv run python generate_ark_clients.py -v $(ARK_SDK_OPENAPI) > $(ARK_SDK_OUT)/py-sdk/ark_sdk/versions.py
+	cd $(ARK_SDK_LIB_DIR) && uv run python generate_ark_clients.py -s $(ARK_SDK_OPENAPI) > $(ARK_SDK_OUT)/py-sdk/ark_sdk/structs.py
 	cd $(ARK_SDK_LIB_DIR) && uv run python generate_ark_clients.py -t $(ARK_SDK_OPENAPI) > $(ARK_SDK_OUT)/py-sdk/test/test_ark_client.py
+	cd $(ARK_SDK_LIB_DIR) && uv run python lazy_init.py --overlay-exports $(ARK_SDK_OUT)/py-sdk/ark_sdk/__init__.py
+	cd $(ARK_SDK_LIB_DIR) && uv run python lazy_init.py $(ARK_SDK_OUT)/py-sdk/ark_sdk/models/__init__.py
 	cd $(ARK_SDK_LIB_DIR) && uv sync
 	cd $(ARK_SDK_OUT)/py-sdk && uv run python -m build .
 
@@ -0,0 +1,107 @@
+"""Admission control and execution metrics for execution engines.
+
+An AdmissionController caps the number of executions running at once and queues a
+bounded number of further requests; anything beyond that is rejected so the server
+can answer 503 with Retry-After instead of accepting unbounded work.
+"""
+
+import asyncio
+import bisect
+import time
+from typing import Dict, List, Optional, Sequence
+
+# Latency histogram buckets in seconds, sized for LLM calls
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class Overloaded(Exception):
+    """Raised when all execution slots and queue places are taken."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Executor overloaded, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class Histogram:
+    """Cumulative histogram in the Prometheus exposition model."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str = "") -> List[str]:
+        """Prometheus text lines for this histogram; `labels` is e.g. 'engine="x"'."""
+        prefix = f"{labels}," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.sum}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class AdmissionController:
+    """Limits concurrent executions with a bounded wait queue.
+
+    A max_concurrent of 0 or less disables the limit. Must be used from a single
+    event loop (one controller per worker process).
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, retry_after: int = 1):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max(0, max_queue)
+        self.retry_after = retry_after
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.queue_wait = Histogram()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def limited(self) -> bool:
+        return self.max_concurrent > 0
+
+    async def acquire(self) -> None:
+        """Wait for an execution slot, or raise Overloaded if the queue is full."""
+        if not self.limited:
+            self.active += 1
+            return
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        if self.active >= self.max_concurrent and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise Overloaded(self.retry_after)
+
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.queue_wait.observe(time.perf_counter() - start)
+        self.active += 1
+
+    def release(self) -> None:
+        self.active -= 1
+        if self.limited and self._semaphore is not None:
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+        }
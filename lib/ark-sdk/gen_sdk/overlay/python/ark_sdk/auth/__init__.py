@@ -5,7 +5,7 @@ This module provides authentication functionality for ARK services.
 
 from .exceptions import AuthenticationError, TokenValidationError
 from .config import AuthConfig
-from .validator import TokenValidator
+from .validator import TokenValidator, JWKSCache, VerifiedTokenCache
 from .basic import BasicAuthValidator
 
 __all__ = [
@@ -13,5 +13,7 @@ __all__ = [
     "TokenValidationError",
     "AuthConfig",
     "TokenValidator",
+    "JWKSCache",
+    "VerifiedTokenCache",
     "BasicAuthValidator",
 ]
@@ -1,30 +1,186 @@
-"""Token validation for ARK SDK."""
+"""Token validation for ARK SDK.
 
+Signing keys are cached process-wide per JWKS URL and refetched only when they expire
+or a token names an unknown key ID. Successfully
+validated tokens are remembered until their `exp` claim, so repeated requests with the
+same bearer token skip signature verification.
+"""
+
+import asyncio
+import hashlib
 import logging
 import os
-import json
-from typing import Optional, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Awaitable, Callable
 from jose import jwt, jwk
+from jose.backends.base import Key
 from jose.exceptions import JWTError, ExpiredSignatureError, JWTClaimsError
-import requests
+import httpx
 
 from .exceptions import TokenValidationError, InvalidTokenError as AuthInvalidTokenError, ExpiredTokenError
 from .config import AuthConfig
 
 logger = logging.getLogger(__name__)
 
+# Signing keys are refetched from the JWKS endpoint after this many seconds
+JWKS_TTL_SECONDS = float(os.getenv("ARK_AUTH_JWKS_TTL_SECONDS", "3600"))
+# A token with an unknown kid triggers a refetch at most this often, so random kids
+# cannot force a JWKS request per call
+JWKS_MIN_REFRESH_SECONDS = 30.0
+JWKS_FETCH_TIMEOUT_SECONDS = 10.0
+# Number of verified tokens remembered until they expire
+VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("ARK_AUTH_TOKEN_CACHE_SIZE", "1024"))
+
+
+class JWKSCache:
+    """Signing keys per JWKS URL, shared by all validators in the process.
+
+    Keys are constructed once per fetch. Concurrent refreshes of one URL share a single
+    request, and if a refresh fails while keys are cached the previous keys stay in use
+    until the next refresh attempt.
+    """
+
+    def __init__(
+        self,
+        ttl: float = JWKS_TTL_SECONDS,
+        min_refresh_interval: float = JWKS_MIN_REFRESH_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._clock = clock
+        self._keys: Dict[str, Dict[str, Key]] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.fetches = 0
+
+    async def get_signing_key(
+        self,
+        jwks_url: str,
+        kid: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        algorithm: str
+    ) -> Key:
+        """Return the key for `kid`, fetching the key set with `fetch` when needed."""
+        keys = self._keys.get(jwks_url)
+        age = self._clock() - self._fetched_at.get(jwks_url, float("-inf"))
+        if keys is not None and age < self.ttl and kid in keys:
+            return keys[kid]
+        if keys is None or age >= self.ttl or age >= self.min_refresh_interval:
+            keys = await self._refresh(jwks_url, fetch, algorithm)
+        if kid not in keys:
+            raise TokenValidationError(f"Unable to find key with kid: {kid}")
+        return keys[kid]
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._fetched_at.clear()
+
+    async def _refresh(self, jwks_url: str, fetch: Callable[[], Awaitable[Dict[str, Any]]], algorithm: str) -> Dict[str, Key]:
+        pending = self._pending.get(jwks_url)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(jwks_url, fetch, algorithm))
+            self._pending[jwks_url] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(jwks_url, None))
+        return await asyncio.shield(pending)
+
+    async def _load(self, jwks_url: str, fetch: Callable[[], Awaitable[Dict[str, Any]]], algorithm: str) -> Dict[str, Key]:
+        self.fetches += 1
+        try:
+            jwks = await fetch()
+        except TokenValidationError:
+            stale = self._keys.get(jwks_url)
+            if stale is None:
+                raise
+            logger.warning(f"Using cached JWKS for {jwks_url} after refresh failure")
+            # Retry no sooner than an unknown-kid refresh would
+            self._fetched_at[jwks_url] = self._clock() - max(0.0, self.ttl - self.min_refresh_interval)
+            return stale
+
+        keys = {}
+        for key in jwks.get('keys', []):
+            kid = key.get('kid')
+            if not kid:
+                continue
+            try:
+                keys[kid] = jwk.construct(key, key.get('alg', algorithm))
+            except Exception as e:
+                logger.debug(f"Skipping JWKS key {kid}: {e}")
+        self._keys[jwks_url] = keys
+        self._fetched_at[jwks_url] = self._clock()
+        return keys
+
+
+class VerifiedTokenCache:
+    """LRU of validated token payloads, each kept until the token's `exp` claim.
+
+    Entries are keyed by a SHA-256 of the token and the validation settings, so the
+    raw token is never stored. Tokens without a numeric `exp` are not cached.
+    """
+
+    def __init__(self, maxsize: int = VERIFIED_TOKEN_CACHE_SIZE, clock: Callable[[], float] = time.time):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            payload, exp = entry
+            if self._clock() >= exp:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(payload)
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        exp = payload.get('exp')
+        if self.maxsize <= 0 or not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self._entries[key] = (dict(payload), exp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_jwks_cache = JWKSCache()
+_verified_tokens = VerifiedTokenCache()
+
 
 class TokenValidator:
     """Validates JWT tokens using JWKS."""
     
-    def __init__(self, config: Optional[AuthConfig] = None):
+    def __init__(
+        self,
+        config: Optional[AuthConfig] = None,
+        jwks_cache: Optional[JWKSCache] = None,
+        token_cache: Optional[VerifiedTokenCache] = None
+    ):
         if config is None:
             self.config = self._create_config_from_env()
         else:
             self.config = config
-        self._jwks_cache: Optional[Dict[str, Any]] = None
-        self._cache_expiry: Optional[float] = None
-
+        # Shared by default so that validators created per request still hit the caches
+        self._jwks_cache = _jwks_cache if jwks_cache is None else jwks_cache
+        self._token_cache = _verified_tokens if token_cache is None else token_cache
     
     def _create_config_from_env(self) -> AuthConfig:
         """Create AuthConfig from environment variables."""
@@ -44,27 +200,22 @@ class TokenValidator:
             jwks_url=jwks_url
         )
     
-    def _fetch_jwks(self) -> Dict[str, Any]:
+    async def _fetch_jwks(self) -> Dict[str, Any]:
         """Fetch JWKS from the configured URL."""
         if not self.config.jwks_url:
             raise TokenValidationError("JWKS URL not configured")
         
         try:
-            response = requests.get(self.config.jwks_url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            async with httpx.AsyncClient(timeout=JWKS_FETCH_TIMEOUT_SECONDS) as client:
+                response = await client.get(self.config.jwks_url)
+                response.raise_for_status()
+                return response.json()
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(f"Failed to fetch JWKS: {e}")
             raise TokenValidationError(f"Failed to fetch JWKS: {e}")
     
-    def _get_jwks(self) -> Dict[str, Any]:
-        """Get JWKS with caching."""
-        if self._jwks_cache is None:
-            self._jwks_cache = self._fetch_jwks()
-        return self._jwks_cache
-    
-    def _get_signing_key(self, token: str) -> str:
-        """Get the signing key for a JWT token from JWKS."""
+    async def _get_signing_key(self, token: str) -> Key:
+        """Get the signing key for a JWT token from the cached JWKS."""
         try:
             # Decode header to get kid (key ID)
             unverified_header = jwt.get_unverified_header(token)
@@ -72,22 +223,28 @@ class TokenValidator:
             
             if not kid:
                 raise TokenValidationError("Token header does not contain 'kid'")
+            if not self.config.jwks_url:
+                raise TokenValidationError("JWKS URL not configured")
             
-            # Get JWKS
-            jwks = self._get_jwks()
-            
-            # Find the key with matching kid
-            for key in jwks.get('keys', []):
-                if key.get('kid') == kid:
-                    # Construct the key
-                    return jwk.construct(key).to_pem().decode('utf-8')
-            
-            raise TokenValidationError(f"Unable to find key with kid: {kid}")
+            return await self._jwks_cache.get_signing_key(
+                self.config.jwks_url, kid, self._fetch_jwks, self.config.jwt_algorithm
+            )
             
         except Exception as e:
             logger.error(f"Failed to get signing key: {e}")
             raise TokenValidationError(f"Failed to get signing key: {e}")
     
+    def _token_cache_key(self, token: str) -> str:
+        """Hash of the token and the settings it was validated against."""
+        material = "\0".join((
+            self.config.jwks_url or "",
+            self.config.issuer or "",
+            self.config.audience or "",
+            self.config.jwt_algorithm,
+            token,
+        ))
+        return hashlib.sha256(material.encode()).hexdigest()
+    
     async def validate_token(self, token: str) -> Dict[str, Any]:
         """
         Validate a JWT token.
@@ -101,9 +258,14 @@ class TokenValidator:
         Raises:
             TokenValidationError: If token validation fails
         """
+        cache_key = self._token_cache_key(token)
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Get the signing key
-            signing_key = self._get_signing_key(token)
+            signing_key = await self._get_signing_key(token)
 
             # Use issuer and audience from configuration
             audience = self.config.audience
@@ -127,6 +289,7 @@ class TokenValidator:
                 options=options
             )
 
+            self._token_cache.put(cache_key, payload)
             return payload
 
         except ExpiredSignatureError as e:
@@ -1,28 +1,56 @@
+import functools
+import importlib
 from contextlib import asynccontextmanager
 from typing import Optional
 
 from ark_sdk import versions
 from ark_sdk.k8s import get_context
-from ark_sdk.executor import (
-    Parameter,
-    Model,
-    AgentConfig,
-    ToolDefinition,
-    Message,
-    ExecutionEngineRequest,
-    ExecutionEngineResponse,
-    BaseExecutor,
-)
-from ark_sdk.executor_app import ExecutorApp
+
+# Execution engine types are re-exported here but only imported on first use,
+# so API clients do not pay for loading FastAPI and uvicorn
+_EXECUTOR_EXPORTS = {
+    "Parameter": "ark_sdk.executor",
+    "Model": "ark_sdk.executor",
+    "AgentConfig": "ark_sdk.executor",
+    "ToolDefinition": "ark_sdk.executor",
+    "Message": "ark_sdk.executor",
+    "ExecutionEngineRequest": "ark_sdk.executor",
+    "ExecutionEngineResponse": "ark_sdk.executor",
+    "ExecutionEngineStreamEvent": "ark_sdk.executor",
+    "MessageDelta": "ark_sdk.executor",
+    "BaseExecutor": "ark_sdk.executor",
+    "ExecutorApp": "ark_sdk.executor_app",
+}
+
+def __getattr__(name):
+    module = _EXECUTOR_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
 V1_ALPHA1 = "v1alpha1"
 V1_PREALPHA1 = "v1prealpha1"
 
+# Upper bound on cached (namespace, version) clients
+CLIENT_CACHE_SIZE = 256
+
 def get_client(namespace: Optional[str], version: str):
+    """
+    Get the process-wide ARK client for a namespace and API version.
+
+    Clients are cached per (namespace, version); their resource clients are
+    created lazily and share one Kubernetes connection pool, so calling this
+    on every request is cheap.
+    """
     # If namespace is None, get it from context
     if namespace is None:
         namespace = get_context()["namespace"]
+    return _cached_client(namespace, version)
 
+@functools.lru_cache(maxsize=CLIENT_CACHE_SIZE)
+def _cached_client(namespace: str, version: str):
     clazz = {
         V1_ALPHA1: versions.ARKClientV1alpha1,
         V1_PREALPHA1: versions.ARKClientV1prealpha1
@@ -31,6 +59,10 @@ def get_client(namespace: Optional[str], version: str):
         raise Exception(f"No client for {version}")
     return clazz(namespace)
 
+def clear_client_cache() -> None:
+    """Drop all cached ARK clients (e.g. after switching kube contexts)."""
+    _cached_client.cache_clear()
+
 @asynccontextmanager
 async def with_ark_client(namespace: Optional[str], version: str):
     """
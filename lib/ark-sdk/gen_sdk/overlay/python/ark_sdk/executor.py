@@ -2,7 +2,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Union
 from pydantic import BaseModel
 
 
@@ -64,6 +64,36 @@ class ExecutionEngineResponse(BaseModel):
     error: str = ""
 
 
+class MessageDelta(BaseModel):
+    """Incremental content of the message being generated."""
+    content: str
+    role: str = "assistant"
+
+
+class ExecutionEngineStreamEvent(BaseModel):
+    """Event sent by the streaming execute endpoint.
+
+    `delta` events carry a MessageDelta's content, `message` events a complete
+    message, and the final `done` event the full response (including any error).
+    """
+    type: str
+    content: Optional[str] = None
+    message: Optional[Message] = None
+    response: Optional[ExecutionEngineResponse] = None
+
+
+StreamItem = Union[MessageDelta, Message]
+
+
+def collect_messages(items: List[StreamItem]) -> List[Message]:
+    """Final messages of a stream: the complete messages, or the joined deltas if there were none."""
+    messages = [item for item in items if isinstance(item, Message)]
+    if messages:
+        return messages
+    content = "".join(item.content for item in items if isinstance(item, MessageDelta))
+    return [Message(role="assistant", content=content)] if content else []
+
+
 class BaseExecutor(ABC):
     """Abstract base class for execution engines."""
 
@@ -87,6 +117,27 @@ class BaseExecutor(ABC):
         """
         pass
 
+    async def stream_agent(self, request: ExecutionEngineRequest) -> AsyncIterator[StreamItem]:
+        """Execute an agent, yielding output as it is generated.
+
+        Override to yield MessageDelta chunks as tokens arrive, followed by the
+        complete response Messages. The default implementation adapts
+        execute_agent and yields its messages once execution finishes.
+
+        Args:
+            request: The execution request containing agent config and user input
+
+        Yields:
+            MessageDelta chunks and complete Messages
+        """
+        for message in await self.execute_agent(request):
+            yield message
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether this executor overrides stream_agent to stream incrementally."""
+        return type(self).stream_agent is not BaseExecutor.stream_agent
+
     def _resolve_prompt(self, agent_config, base_prompt: str = None) -> str:
         """Resolve agent prompt with parameter substitution."""
         prompt = base_prompt or agent_config.prompt or "You are a helpful assistant."
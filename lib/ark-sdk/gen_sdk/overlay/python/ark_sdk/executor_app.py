@@ -1,15 +1,37 @@
 """Common FastAPI application setup for execution engines."""
 
 import logging
-from typing import Type
-from fastapi import FastAPI
+import os
+import time
+from typing import AsyncIterator, Callable, List, Optional, Type
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import ValidationError
 import uvicorn
 
-from .executor import BaseExecutor, ExecutionEngineRequest, ExecutionEngineResponse
+from .admission import AdmissionController, Histogram, Overloaded
+from .executor import (
+    BaseExecutor,
+    ExecutionEngineRequest,
+    ExecutionEngineResponse,
+    ExecutionEngineStreamEvent,
+    Message,
+    MessageDelta,
+    StreamItem,
+    collect_messages,
+)
 
 logger = logging.getLogger(__name__)
 
+# Executions allowed to run at once per worker process; 0 means unlimited
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("EXECUTOR_MAX_CONCURRENCY", "0"))
+# Requests allowed to wait for a slot before new ones are rejected with 503
+DEFAULT_MAX_QUEUE = int(os.getenv("EXECUTOR_MAX_QUEUE", "100"))
+# Retry-After sent with 503 responses, in seconds
+DEFAULT_RETRY_AFTER_SECONDS = int(os.getenv("EXECUTOR_RETRY_AFTER_SECONDS", "5"))
+# Worker processes started by ExecutorApp.run when an app factory is given
+DEFAULT_WORKERS = int(os.getenv("EXECUTOR_WORKERS", "1"))
+
 
 class HealthFilter(logging.Filter):
     """Filter to exclude health check logs."""
@@ -17,19 +39,50 @@ class HealthFilter(logging.Filter):
         return not (hasattr(record, "getMessage") and "/health" in record.getMessage())
 
 
+class _AdmittedStreamingResponse(StreamingResponse):
+    """StreamingResponse that gives its execution slot back once sending ends."""
+
+    def __init__(self, *args, on_close: Callable[[], None], **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._on_close()
+
+
 class ExecutorApp:
     """Base FastAPI application for execution engines."""
 
-    def __init__(self, executor: BaseExecutor, engine_name: str):
+    def __init__(
+        self,
+        executor: BaseExecutor,
+        engine_name: str,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        retry_after: Optional[int] = None
+    ):
         """Initialize the FastAPI app with an executor.
         
         Args:
             executor: The executor instance to handle requests
             engine_name: Name of the execution engine (for title and health check)
+            max_concurrency: Executions run at once (default EXECUTOR_MAX_CONCURRENCY, 0 = unlimited)
+            max_queue: Requests waiting for a slot before 503 (default EXECUTOR_MAX_QUEUE)
+            retry_after: Retry-After seconds on 503 (default EXECUTOR_RETRY_AFTER_SECONDS)
         """
         self.app = FastAPI(title=f"{engine_name.title()} Executor", version="1.0.0")
         self.executor = executor
         self.engine_name = engine_name.lower()
+        self.admission = AdmissionController(
+            DEFAULT_MAX_CONCURRENCY if max_concurrency is None else max_concurrency,
+            DEFAULT_MAX_QUEUE if max_queue is None else max_queue,
+            DEFAULT_RETRY_AFTER_SECONDS if retry_after is None else retry_after,
+        )
+        self.execution_latency = Histogram()
+        self.executions = {"success": 0, "error": 0}
         self.setup_routes()
         self._setup_logging()
         logger.info(f"{engine_name} application initialized")
@@ -49,35 +102,178 @@ class ExecutorApp:
             """Health check endpoint."""
             return {"status": "healthy", "engine": self.engine_name}
 
+        @self.app.get("/metrics", response_class=PlainTextResponse)
+        async def metrics():
+            """Admission and execution metrics in Prometheus text format."""
+            return self.render_metrics()
+
         @self.app.post("/execute", response_model=ExecutionEngineResponse)
         async def execute(request: ExecutionEngineRequest):
             """Execute agent and return response messages."""
             try:
-                logger.info(
-                    f"Processing execution request for agent: {request.agent.name}"
-                )
+                await self.admission.acquire()
+            except Overloaded as e:
+                return self._overloaded_response(e)
 
-                response_messages = await self.executor.execute_agent(request)
+            start = time.perf_counter()
+            try:
+                response = await self._execute(request)
+            finally:
+                self.admission.release()
+                self.execution_latency.observe(time.perf_counter() - start)
+            self.executions["error" if response.error else "success"] += 1
+            return response
 
-                logger.info(
-                    f"Execution successful, returned {len(response_messages)} messages"
-                )
+        @self.app.post("/execute/stream")
+        async def execute_stream(request: ExecutionEngineRequest, http_request: Request):
+            """Execute agent and stream message deltas, messages and the final response.
 
-                return ExecutionEngineResponse(messages=response_messages, error="")
+            Responds with Server-Sent Events, or newline-delimited JSON when the
+            client accepts application/x-ndjson.
+            """
+            try:
+                await self.admission.acquire()
+            except Overloaded as e:
+                return self._overloaded_response(e)
 
-            except ValidationError as e:
-                error_msg = f"Request validation failed for agent {request.agent.name}: {str(e)}"
-                logger.error(error_msg)
-                return ExecutionEngineResponse(messages=[], error=error_msg)
-            except Exception as e:
-                error_msg = (
-                    f"{self.engine_name.title()} execution failed for agent {request.agent.name}: {str(e)}"
+            logger.info(
+                f"Processing streaming execution request for agent: {request.agent.name}"
+            )
+            if "application/x-ndjson" in http_request.headers.get("accept", ""):
+                return _AdmittedStreamingResponse(
+                    self._encode_ndjson(self._stream_events(request)),
+                    media_type="application/x-ndjson",
+                    on_close=self.admission.release,
                 )
-                logger.error(error_msg, exc_info=True)
-                return ExecutionEngineResponse(messages=[], error=error_msg)
+            return _AdmittedStreamingResponse(
+                self._encode_sse(self._stream_events(request)),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                on_close=self.admission.release,
+            )
+
+    async def _execute(self, request: ExecutionEngineRequest) -> ExecutionEngineResponse:
+        """Run execute_agent, reporting failures in the response body."""
+        try:
+            logger.info(
+                f"Processing execution request for agent: {request.agent.name}"
+            )
+
+            response_messages = await self.executor.execute_agent(request)
 
-    def run(self, host: str = "0.0.0.0", port: int = 8000):
-        """Run the FastAPI server."""
+            logger.info(
+                f"Execution successful, returned {len(response_messages)} messages"
+            )
+
+            return ExecutionEngineResponse(messages=response_messages, error="")
+
+        except ValidationError as e:
+            error_msg = f"Request validation failed for agent {request.agent.name}: {str(e)}"
+            logger.error(error_msg)
+            return ExecutionEngineResponse(messages=[], error=error_msg)
+        except Exception as e:
+            error_msg = (
+                f"{self.engine_name.title()} execution failed for agent {request.agent.name}: {str(e)}"
+            )
+            logger.error(error_msg, exc_info=True)
+            return ExecutionEngineResponse(messages=[], error=error_msg)
+
+    def _overloaded_response(self, error: Overloaded) -> JSONResponse:
+        logger.warning(f"Rejecting execution request: {error}")
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(error)},
+            headers={"Retry-After": str(error.retry_after)},
+        )
+
+    def render_metrics(self) -> str:
+        """Metrics of this worker process in Prometheus text format."""
+        engine = f'engine="{self.engine_name}"'
+        stats = self.admission.stats()
+        lines = [
+            "# HELP executor_executions_in_flight Executions currently running.",
+            "# TYPE executor_executions_in_flight gauge",
+            f"executor_executions_in_flight{{{engine}}} {stats['active']}",
+            "# HELP executor_queue_depth Requests waiting for an execution slot.",
+            "# TYPE executor_queue_depth gauge",
+            f"executor_queue_depth{{{engine}}} {stats['waiting']}",
+            "# HELP executor_max_concurrency Configured execution slots (0 = unlimited).",
+            "# TYPE executor_max_concurrency gauge",
+            f"executor_max_concurrency{{{engine}}} {stats['max_concurrent']}",
+            "# HELP executor_rejected_total Requests rejected with 503 because the queue was full.",
+            "# TYPE executor_rejected_total counter",
+            f"executor_rejected_total{{{engine}}} {stats['rejected']}",
+            "# HELP executor_executions_total Completed /execute requests by outcome.",
+            "# TYPE executor_executions_total counter",
+        ]
+        for status, count in self.executions.items():
+            lines.append(f'executor_executions_total{{{engine},status="{status}"}} {count}')
+        lines += [
+            "# HELP executor_execution_duration_seconds Time spent executing /execute requests.",
+            "# TYPE executor_execution_duration_seconds histogram",
+            *self.execution_latency.render("executor_execution_duration_seconds", engine),
+            "# HELP executor_queue_wait_seconds Time requests waited for an execution slot.",
+            "# TYPE executor_queue_wait_seconds histogram",
+            *self.admission.queue_wait.render("executor_queue_wait_seconds", engine),
+        ]
+        return "\n".join(lines) + "\n"
+
+    async def _stream_events(self, request: ExecutionEngineRequest) -> AsyncIterator[ExecutionEngineStreamEvent]:
+        """Run the executor's stream_agent and convert its output to stream events."""
+        items: List[StreamItem] = []
+        error = ""
+        try:
+            async for item in self.executor.stream_agent(request):
+                items.append(item)
+                if isinstance(item, MessageDelta):
+                    yield ExecutionEngineStreamEvent(type="delta", content=item.content)
+                elif isinstance(item, Message):
+                    yield ExecutionEngineStreamEvent(type="message", message=item)
+        except Exception as e:
+            error = f"{self.engine_name.title()} execution failed for agent {request.agent.name}: {str(e)}"
+            logger.error(error, exc_info=True)
+
+        messages = [] if error else collect_messages(items)
+        if not error:
+            logger.info(f"Streaming execution successful, returned {len(messages)} messages")
+        yield ExecutionEngineStreamEvent(
+            type="done", response=ExecutionEngineResponse(messages=messages, error=error)
+        )
+
+    @staticmethod
+    async def _encode_sse(events: AsyncIterator[ExecutionEngineStreamEvent]) -> AsyncIterator[str]:
+        async for event in events:
+            yield f"event: {event.type}\ndata: {event.model_dump_json(exclude_none=True)}\n\n"
+
+    @staticmethod
+    async def _encode_ndjson(events: AsyncIterator[ExecutionEngineStreamEvent]) -> AsyncIterator[str]:
+        async for event in events:
+            yield event.model_dump_json(exclude_none=True) + "\n"
+
+    def run(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        workers: Optional[int] = None,
+        factory: Optional[str] = None
+    ):
+        """Run the FastAPI server.
+
+        With more than one worker (default EXECUTOR_WORKERS), `factory` must be the
+        import string of a function returning the app, e.g. "my_engine.app:create_app";
+        each worker process imports it and builds its own executor, admission limits
+        and metrics.
+        """
+        workers = DEFAULT_WORKERS if workers is None else workers
+        if workers > 1:
+            if not factory:
+                raise ValueError("Running more than one worker requires an app factory import string")
+            logger.info(f"Starting {self.engine_name} execution server on {host}:{port} with {workers} workers")
+            uvicorn.run(
+                factory, factory=True, host=host, port=port, workers=workers,
+                access_log=True, log_level="info"
+            )
+            return
         logger.info(f"Starting {self.engine_name} execution server on {host}:{port}")
         uvicorn.run(self.app, host=host, port=port, access_log=True, log_level="info")
 
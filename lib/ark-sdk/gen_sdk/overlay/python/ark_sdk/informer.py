@@ -0,0 +1,447 @@
+"""Watch-backed informer cache for ARK custom resources.
+
+An informer performs an initial list followed by a resourceVersion-resumed watch for a
+single (namespace, plural) pair and keeps the objects in a local indexed store, so that
+reads are served from memory instead of round-tripping to the API server.
+
+Example:
+    factory = InformerFactory()
+    agents = factory.informer_for(ARKClientV1alpha1("default").agents)
+    agents.add_index("model", field_index("spec.modelRef.name"))
+    await factory.start()
+
+    agent = await agents.a_get("my-agent")
+    using_gpt = agents.by_index("model", "gpt-4")
+"""
+
+import asyncio
+import inspect
+import logging
+import random
+import re
+from typing import Any, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+from kubernetes_asyncio import client, watch
+from kubernetes_asyncio.client.rest import ApiException
+
+from ark_sdk.versions import ARKResourceClient, get_async_api_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+IndexFunc = Callable[[Dict[str, Any]], List[str]]
+EventHandler = Callable[..., Any]
+
+# Server-side watch timeout; the watch is resumed from the last resourceVersion afterwards
+DEFAULT_WATCH_TIMEOUT_SECONDS = 300
+# Reconnect backoff after unexpected watch/list failures
+INITIAL_BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 30.0
+
+_SET_REQUIREMENT = re.compile(r'^\s*([^\s!=]+)\s+(in|notin)\s+\(([^)]*)\)\s*$')
+
+
+def _get_path(obj: Dict[str, Any], path: str) -> Any:
+    """Resolve a dotted path such as 'spec.modelRef.name' in a nested dict."""
+    value: Any = obj
+    for part in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def label_index(label: str) -> IndexFunc:
+    """Index objects by the value of a label."""
+    def index(obj: Dict[str, Any]) -> List[str]:
+        value = (obj.get('metadata', {}).get('labels') or {}).get(label)
+        return [value] if value is not None else []
+    return index
+
+
+def field_index(path: str) -> IndexFunc:
+    """Index objects by the value at a dotted field path, e.g. 'spec.modelRef.name'."""
+    def index(obj: Dict[str, Any]) -> List[str]:
+        value = _get_path(obj, path)
+        if value is None:
+            return []
+        if isinstance(value, list):
+            return [str(v) for v in value]
+        return [str(value)]
+    return index
+
+
+def _split_selector(selector: str) -> List[str]:
+    """Split a label selector on commas that are not inside parentheses."""
+    parts, depth, current = [], 0, ''
+    for char in selector:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    parts.append(current)
+    return [p.strip() for p in parts if p.strip()]
+
+
+def matches_label_selector(labels: Optional[Dict[str, str]], selector: Optional[str]) -> bool:
+    """Evaluate a Kubernetes label selector against a set of labels.
+
+    Supports equality (=, ==, !=), existence (key, !key) and set-based (in, notin) requirements.
+    """
+    if not selector:
+        return True
+    labels = labels or {}
+    for requirement in _split_selector(selector):
+        set_match = _SET_REQUIREMENT.match(requirement)
+        if set_match:
+            key, op, values = set_match.groups()
+            allowed = {v.strip() for v in values.split(',') if v.strip()}
+            if op == 'in' and labels.get(key) not in allowed:
+                return False
+            if op == 'notin' and key in labels and labels[key] in allowed:
+                return False
+        elif '!=' in requirement:
+            key, value = (s.strip() for s in requirement.split('!=', 1))
+            if labels.get(key) == value:
+                return False
+        elif '=' in requirement:
+            key, value = (s.strip() for s in requirement.replace('==', '=').split('=', 1))
+            if labels.get(key) != value:
+                return False
+        elif requirement.startswith('!'):
+            if requirement[1:].strip() in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
+
+
+class Informer(Generic[T]):
+    """List+watch cache for one resource type in one namespace.
+
+    Objects are stored as the raw dicts returned by the API server. Typed models are built
+    lazily on first read and reused until the object changes, so callers must treat
+    returned models as read-only.
+    """
+
+    def __init__(
+        self,
+        resource_client: ARKResourceClient[T],
+        namespace: Optional[str] = None,
+        resync_period: Optional[float] = None,
+        watch_timeout_seconds: int = DEFAULT_WATCH_TIMEOUT_SECONDS,
+    ):
+        self.resource_client = resource_client
+        self.namespace = namespace or resource_client.namespace
+        self.resync_period = resync_period
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.resource_version: Optional[str] = None
+
+        self._store: Dict[str, Dict[str, Any]] = {}
+        self._models: Dict[str, T] = {}
+        self._indexers: Dict[str, IndexFunc] = {}
+        self._indices: Dict[str, Dict[str, Set[str]]] = {}
+        self._handlers: List[Tuple[Optional[EventHandler], Optional[EventHandler], Optional[EventHandler]]] = []
+        # Created on first use: before Python 3.10 an Event binds to the loop current at construction
+        self._synced: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    # Configuration
+
+    def add_index(self, name: str, index_func: IndexFunc) -> None:
+        """Register a secondary index; existing objects are indexed immediately."""
+        self._indexers[name] = index_func
+        self._indices[name] = {}
+        for key, obj in self._store.items():
+            self._index_object(name, key, obj)
+
+    def add_event_handler(
+        self,
+        on_add: Optional[EventHandler] = None,
+        on_update: Optional[EventHandler] = None,
+        on_delete: Optional[EventHandler] = None,
+    ) -> None:
+        """Register callbacks invoked with raw objects; handlers may be sync or async.
+
+        on_add(obj), on_update(old_obj, new_obj) and on_delete(obj) are called for watch
+        events, relist differences and (for on_update) periodic resyncs.
+        """
+        self._handlers.append((on_add, on_update, on_delete))
+
+    # Lifecycle
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the initial list has completed."""
+        return self._synced is not None and self._synced.is_set()
+
+    async def wait_for_sync(self, timeout: Optional[float] = None) -> None:
+        """Wait until the initial list has populated the store.
+
+        Raises asyncio.TimeoutError when `timeout` seconds pass first, e.g. because the
+        list keeps failing.
+        """
+        await asyncio.wait_for(self._sync_event().wait(), timeout)
+
+    async def start(self) -> None:
+        """Start the list/watch loop (and resync loop) as background tasks."""
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._run()))
+        if self.resync_period:
+            self._tasks.append(asyncio.create_task(self._resync_loop()))
+
+    async def stop(self) -> None:
+        """Stop background tasks. The store keeps its last known contents."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Reads
+
+    def get_raw(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get the raw object by name, or None if it is not in the store."""
+        return self._store.get(name)
+
+    def list_raw(self, label_selector: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List raw objects, optionally filtered by a label selector."""
+        return [
+            obj for obj in self._store.values()
+            if matches_label_selector(obj.get('metadata', {}).get('labels'), label_selector)
+        ]
+
+    def get(self, name: str) -> T:
+        """Get a typed object by name from the store."""
+        if name not in self._store:
+            raise Exception(f"{self.resource_client.kind} '{name}' not found in namespace '{self.namespace}'")
+        return self._model(name)
+
+    def list(self, label_selector: Optional[str] = None) -> List[T]:
+        """List typed objects from the store, optionally filtered by a label selector."""
+        return [self._model(obj['metadata']['name']) for obj in self.list_raw(label_selector)]
+
+    def by_index(self, index_name: str, value: str) -> List[T]:
+        """List typed objects whose index function produced the given value."""
+        if index_name not in self._indices:
+            raise KeyError(f"Unknown index '{index_name}'")
+        return [self._model(name) for name in sorted(self._indices[index_name].get(value, ()))]
+
+    async def a_get(self, name: str, timeout: Optional[float] = None) -> T:
+        """Get a typed object by name once the initial list has completed.
+
+        Raises asyncio.TimeoutError when the list has not completed within `timeout` seconds.
+        """
+        await self.wait_for_sync(timeout)
+        return self.get(name)
+
+    async def a_list(self, label_selector: Optional[str] = None, timeout: Optional[float] = None) -> List[T]:
+        """List typed objects once the initial list has completed.
+
+        Raises asyncio.TimeoutError when the list has not completed within `timeout` seconds.
+        """
+        await self.wait_for_sync(timeout)
+        return self.list(label_selector)
+
+    # Store maintenance
+
+    def _sync_event(self) -> asyncio.Event:
+        if self._synced is None:
+            self._synced = asyncio.Event()
+        return self._synced
+
+    def _model(self, name: str) -> T:
+        model = self._models.get(name)
+        if model is None:
+            model = self.resource_client._dict_to_model(self._store[name])
+            self._models[name] = model
+        return model
+
+    def _index_object(self, index_name: str, key: str, obj: Dict[str, Any]) -> None:
+        for value in self._indexers[index_name](obj):
+            self._indices[index_name].setdefault(value, set()).add(key)
+
+    def _unindex_object(self, key: str, obj: Dict[str, Any]) -> None:
+        for index_name, index_func in self._indexers.items():
+            index = self._indices[index_name]
+            for value in index_func(obj):
+                keys = index.get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[value]
+
+    def _put(self, obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = obj['metadata']['name']
+        old = self._store.get(key)
+        if old is not None:
+            self._unindex_object(key, old)
+        self._store[key] = obj
+        self._models.pop(key, None)
+        for index_name in self._indexers:
+            self._index_object(index_name, key, obj)
+        return old
+
+    def _remove(self, key: str) -> Optional[Dict[str, Any]]:
+        old = self._store.pop(key, None)
+        self._models.pop(key, None)
+        if old is not None:
+            self._unindex_object(key, old)
+        return old
+
+    async def _dispatch(self, kind: str, *args: Dict[str, Any]) -> None:
+        position = {'add': 0, 'update': 1, 'delete': 2}[kind]
+        for handlers in self._handlers:
+            handler = handlers[position]
+            if handler is None:
+                continue
+            try:
+                result = handler(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"{self.resource_client.kind} informer {kind} handler failed: {e}")
+
+    # API access
+
+    async def _custom_api(self) -> client.CustomObjectsApi:
+        return client.CustomObjectsApi(await get_async_api_client())
+
+    async def _list_objects(self) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List all objects, returning the items and the list resourceVersion."""
+        custom_api = await self._custom_api()
+        result = await custom_api.list_namespaced_custom_object(
+            group=self.resource_client.group,
+            version=self.resource_client.version,
+            namespace=self.namespace,
+            plural=self.resource_client.plural,
+        )
+        return result.get('items', []), result.get('metadata', {}).get('resourceVersion')
+
+    async def _watch_events(self, resource_version: Optional[str]):
+        """Yield watch events (type, raw object) starting from a resourceVersion."""
+        custom_api = await self._custom_api()
+        w = watch.Watch()
+        try:
+            async for event in w.stream(
+                custom_api.list_namespaced_custom_object,
+                group=self.resource_client.group,
+                version=self.resource_client.version,
+                namespace=self.namespace,
+                plural=self.resource_client.plural,
+                resource_version=resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=self.watch_timeout_seconds,
+            ):
+                yield event['type'], event['raw_object']
+        finally:
+            await w.close()
+
+    async def _relist(self) -> None:
+        """Replace the store with a fresh list, dispatching the differences."""
+        items, resource_version = await self._list_objects()
+        seen = set()
+        for obj in items:
+            key = obj['metadata']['name']
+            seen.add(key)
+            old = self._put(obj)
+            if old is None:
+                await self._dispatch('add', obj)
+            elif old.get('metadata', {}).get('resourceVersion') != obj['metadata'].get('resourceVersion'):
+                await self._dispatch('update', old, obj)
+        for key in [k for k in self._store if k not in seen]:
+            old = self._remove(key)
+            if old is not None:
+                await self._dispatch('delete', old)
+        self.resource_version = resource_version
+        self._sync_event().set()
+        logger.debug(f"{self.resource_client.kind} informer listed {len(items)} objects in {self.namespace}")
+
+    async def _handle_event(self, event_type: str, obj: Dict[str, Any]) -> None:
+        resource_version = obj.get('metadata', {}).get('resourceVersion')
+        if resource_version:
+            self.resource_version = resource_version
+        if event_type == 'BOOKMARK':
+            return
+        if event_type in ('ADDED', 'MODIFIED'):
+            old = self._put(obj)
+            if old is None:
+                await self._dispatch('add', obj)
+            else:
+                await self._dispatch('update', old, obj)
+        elif event_type == 'DELETED':
+            old = self._remove(obj['metadata']['name'])
+            await self._dispatch('delete', old or obj)
+
+    async def _run(self) -> None:
+        backoff = INITIAL_BACKOFF_SECONDS
+        while True:
+            try:
+                if self.resource_version is None:
+                    await self._relist()
+                async for event_type, obj in self._watch_events(self.resource_version):
+                    await self._handle_event(event_type, obj)
+                backoff = INITIAL_BACKOFF_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion is too old; start over with a full relist
+                    logger.info(f"{self.resource_client.kind} informer watch expired in {self.namespace}, relisting")
+                    self.resource_version = None
+                    continue
+                logger.warning(f"{self.resource_client.kind} informer error in {self.namespace}: {e}")
+                await asyncio.sleep(backoff * (1 + random.random()))
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+            except Exception as e:
+                logger.warning(f"{self.resource_client.kind} informer error in {self.namespace}: {e}")
+                await asyncio.sleep(backoff * (1 + random.random()))
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+    async def resync(self) -> None:
+        """Replay every stored object to on_update handlers."""
+        for obj in list(self._store.values()):
+            await self._dispatch('update', obj, obj)
+
+    async def _resync_loop(self) -> None:
+        await self._sync_event().wait()
+        while True:
+            await asyncio.sleep(self.resync_period)
+            await self.resync()
+
+
+class InformerFactory:
+    """Shares one informer per (namespace, plural) across callers."""
+
+    def __init__(self, resync_period: Optional[float] = None):
+        self.resync_period = resync_period
+        self._informers: Dict[Tuple[str, str], Informer] = {}
+
+    def informer_for(self, resource_client: ARKResourceClient[T], namespace: Optional[str] = None) -> Informer[T]:
+        """Get or create the informer for a resource client's plural in a namespace."""
+        ns = namespace or resource_client.namespace
+        key = (ns, resource_client.plural)
+        informer = self._informers.get(key)
+        if informer is None:
+            informer = Informer(resource_client, namespace=ns, resync_period=self.resync_period)
+            self._informers[key] = informer
+        return informer
+
+    async def start(self) -> None:
+        """Start every informer created so far."""
+        for informer in self._informers.values():
+            await informer.start()
+
+    async def wait_for_sync(self, timeout: Optional[float] = None) -> None:
+        """Wait until every informer has completed its initial list."""
+        await asyncio.gather(*(i.wait_for_sync(timeout) for i in self._informers.values()))
+
+    async def stop(self) -> None:
+        """Stop every informer."""
+        await asyncio.gather(*(i.stop() for i in self._informers.values()))
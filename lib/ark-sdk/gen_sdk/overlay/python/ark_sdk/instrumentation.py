@@ -0,0 +1,318 @@
+"""Instrumentation of Kubernetes API calls made through the SDK.
+
+Every request sent by the SDK's shared API clients is described by an ApiCall
+(resource, verb, namespace, status, duration and response size) and handed to the
+registered hooks once it completes, including rate limiter waits and retries. With
+no hooks registered a request is passed straight through.
+
+Two hooks are built in:
+
+    from ark_sdk import instrumentation
+    metrics = instrumentation.enable_metrics()  # latency histograms and counters
+    instrumentation.enable_tracing()            # one OpenTelemetry span per call
+    print(metrics.render())                     # Prometheus text format
+
+Set ARK_SDK_METRICS=1 or ARK_SDK_TRACING=1 to enable them at import time. Any
+callable taking an ApiCall can be registered with add_hook.
+"""
+
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .admission import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, matching client-go's rest_client_request_duration_seconds
+LATENCY_BUCKETS = (0.005, 0.025, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+
+
+@dataclass
+class ApiCall:
+    """A completed Kubernetes API request."""
+    method: str
+    verb: str
+    resource: str
+    namespace: str
+    name: str
+    status: Optional[int]  # None when no response was received
+    duration: float
+    start_time_ns: int
+    response_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def code(self) -> str:
+        """Status as a metric label, "error" for connection failures"""
+        return str(self.status) if self.status else "error"
+
+
+Hook = Callable[[ApiCall], None]
+
+_hooks: Tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Hook) -> Hook:
+    """Register a callable invoked with every completed ApiCall."""
+    global _hooks
+    with _hooks_lock:
+        if hook not in _hooks:
+            _hooks = _hooks + (hook,)
+    return hook
+
+
+def remove_hook(hook: Hook) -> None:
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h != hook)
+
+
+def describe(method: str, url: str, query_params: Any = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Derive the resource, verb, namespace and name of a request from its URL."""
+    parts = urlsplit(url)
+    segments = [s for s in parts.path.split('/') if s]
+    if segments[:1] == ['api']:
+        segments = segments[2:]
+    elif segments[:1] == ['apis']:
+        segments = segments[3:]
+
+    namespace = ''
+    if len(segments) >= 3 and segments[0] == 'namespaces':
+        namespace = segments[1]
+        segments = segments[2:]
+    resource = segments[0] if segments else ''
+    name = segments[1] if len(segments) > 1 else ''
+    if len(segments) > 2:
+        resource = f"{resource}/{segments[2]}"
+
+    query = parse_qs(parts.query)
+    if query_params:
+        for key, value in (query_params.items() if isinstance(query_params, dict) else query_params):
+            query.setdefault(key, []).append(str(value))
+    content_type = (headers or {}).get('Content-Type', '')
+
+    method = method.upper()
+    if method == 'GET':
+        if any(v.lower() in ('true', '1') for v in query.get('watch', [])):
+            verb = 'watch'
+        else:
+            verb = 'get' if name else 'list'
+    elif method == 'POST':
+        verb = 'create'
+    elif method == 'PUT':
+        verb = 'update'
+    elif method == 'PATCH':
+        verb = 'apply' if 'apply-patch' in content_type else 'patch'
+    elif method == 'DELETE':
+        verb = 'delete' if name else 'deletecollection'
+    else:
+        verb = method.lower()
+    return {'verb': verb, 'resource': resource, 'namespace': namespace, 'name': name}
+
+
+def _response_bytes(response: Any, preloaded: bool) -> Optional[int]:
+    """Size of a response body without reading a body that was not preloaded."""
+    if preloaded:
+        data = getattr(response, 'data', None)
+        if isinstance(data, (bytes, bytearray, str)):
+            return len(data)
+    length = getattr(response, 'content_length', None)
+    if length is not None:
+        return length
+    getheader = getattr(response, 'getheader', None)
+    value = getheader('Content-Length') if getheader is not None else None
+    return int(value) if value and str(value).isdigit() else None
+
+
+def _emit(
+    method: str,
+    url: str,
+    kwargs: Dict[str, Any],
+    response: Any,
+    error: Optional[BaseException],
+    start_time_ns: int,
+    duration: float
+) -> None:
+    call = ApiCall(
+        method=method.upper(),
+        status=getattr(error, 'status', None) if error is not None else getattr(response, 'status', 200),
+        duration=duration,
+        start_time_ns=start_time_ns,
+        response_bytes=_response_bytes(response, kwargs.get('_preload_content', True)) if response is not None else None,
+        error=type(error).__name__ if error is not None else None,
+        **describe(method, url, kwargs.get('query_params'), kwargs.get('headers'))
+    )
+    for hook in _hooks:
+        try:
+            hook(call)
+        except Exception as e:
+            logger.warning(f"Instrumentation hook {hook!r} failed: {e}")
+
+
+def _instrumented_sync(request: Callable) -> Callable:
+    @functools.wraps(request)
+    def wrapper(method, url, *args, **kwargs):
+        if not _hooks:
+            return request(method, url, *args, **kwargs)
+        start_time_ns = time.time_ns()
+        start = time.perf_counter()
+        response, error = None, None
+        try:
+            response = request(method, url, *args, **kwargs)
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _emit(method, url, kwargs, response, error, start_time_ns, time.perf_counter() - start)
+    return wrapper
+
+
+def _instrumented_async(request: Callable) -> Callable:
+    @functools.wraps(request)
+    async def wrapper(method, url, *args, **kwargs):
+        if not _hooks:
+            return await request(method, url, *args, **kwargs)
+        start_time_ns = time.time_ns()
+        start = time.perf_counter()
+        response, error = None, None
+        try:
+            response = await request(method, url, *args, **kwargs)
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _emit(method, url, kwargs, response, error, start_time_ns, time.perf_counter() - start)
+    return wrapper
+
+
+def install(api_client: Any) -> Any:
+    """Report a kubernetes or kubernetes_asyncio ApiClient's requests to the registered hooks."""
+    rest_client = api_client.rest_client
+    if inspect.iscoroutinefunction(rest_client.request):
+        rest_client.request = _instrumented_async(rest_client.request)
+    else:
+        rest_client.request = _instrumented_sync(rest_client.request)
+    return api_client
+
+
+class MetricsHook:
+    """Request latency histograms and request/byte counters in the Prometheus model."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self.response_bytes: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, call: ApiCall) -> None:
+        key = (call.resource, call.verb)
+        with self._lock:
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = Histogram(self.buckets)
+            histogram.observe(call.duration)
+            status_key = (call.resource, call.verb, call.code)
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            if call.response_bytes:
+                self.response_bytes[key] = self.response_bytes.get(key, 0) + call.response_bytes
+
+    def render(self) -> str:
+        """Metrics in Prometheus text format."""
+        lines = [
+            "# HELP ark_sdk_request_duration_seconds Kubernetes API request latency, including throttling and retries.",
+            "# TYPE ark_sdk_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (resource, verb), histogram in sorted(self.latency.items()):
+                lines += histogram.render("ark_sdk_request_duration_seconds", f'resource="{resource}",verb="{verb}"')
+            lines += [
+                "# HELP ark_sdk_requests_total Kubernetes API requests by status code.",
+                "# TYPE ark_sdk_requests_total counter",
+            ]
+            for (resource, verb, code), count in sorted(self.requests.items()):
+                lines.append(f'ark_sdk_requests_total{{resource="{resource}",verb="{verb}",code="{code}"}} {count}')
+            lines += [
+                "# HELP ark_sdk_response_bytes_total Kubernetes API response body bytes.",
+                "# TYPE ark_sdk_response_bytes_total counter",
+            ]
+            for (resource, verb), total in sorted(self.response_bytes.items()):
+                lines.append(f'ark_sdk_response_bytes_total{{resource="{resource}",verb="{verb}"}} {total}')
+        return "\n".join(lines) + "\n"
+
+
+class TracingHook:
+    """Records one OpenTelemetry client span per call, parented to the caller's current span.
+
+    Requires the opentelemetry-api package.
+    """
+
+    def __init__(self, tracer: Any = None):
+        from opentelemetry import trace
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("ark_sdk")
+
+    def __call__(self, call: ApiCall) -> None:
+        attributes = {
+            "http.request.method": call.method,
+            "k8s.verb": call.verb,
+            "k8s.resource": call.resource,
+            "k8s.namespace.name": call.namespace,
+        }
+        if call.name:
+            attributes["k8s.object.name"] = call.name
+        if call.status:
+            attributes["http.response.status_code"] = call.status
+        if call.response_bytes is not None:
+            attributes["http.response.body.size"] = call.response_bytes
+        span = self._tracer.start_span(
+            f"k8s {call.verb} {call.resource}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=call.start_time_ns,
+            attributes=attributes
+        )
+        if call.error or (call.status and call.status >= 400):
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, call.error or call.code))
+        span.end(end_time=call.start_time_ns + int(call.duration * 1e9))
+
+
+_metrics: Optional[MetricsHook] = None
+_tracing: Optional[TracingHook] = None
+
+
+def enable_metrics() -> MetricsHook:
+    """Register the process-wide MetricsHook, creating it on first use."""
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsHook()
+    add_hook(_metrics)
+    return _metrics
+
+
+def enable_tracing(tracer: Any = None) -> TracingHook:
+    """Register the process-wide TracingHook, creating it on first use."""
+    global _tracing
+    if _tracing is None:
+        _tracing = TracingHook(tracer)
+    add_hook(_tracing)
+    return _tracing
+
+
+def get_hooks() -> List[Hook]:
+    return list(_hooks)
+
+
+if os.getenv("ARK_SDK_METRICS", "").lower() in ("1", "true", "yes"):
+    enable_metrics()
+if os.getenv("ARK_SDK_TRACING", "").lower() in ("1", "true", "yes"):
+    enable_tracing()
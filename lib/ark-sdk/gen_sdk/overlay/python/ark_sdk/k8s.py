@@ -2,10 +2,12 @@
 import functools
 import logging
 import os
+import threading
 from functools import lru_cache
 
 from kubernetes import config
 from kubernetes.config.config_exception import ConfigException
+from kubernetes.config.kube_config import KUBE_CONFIG_DEFAULT_LOCATION
 from kubernetes_asyncio import client, config as async_config
 import base64
 from typing import Dict, List, Optional
@@ -16,6 +18,11 @@ logger = logging.getLogger(__name__)
 
 NS_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
 
+# Accept headers asking the apiserver for object metadata only, or for its
+# server-side table rendering, instead of full objects
+PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+TABLE_ACCEPT = "application/json;as=Table;g=meta.k8s.io;v=v1"
+
 def get_namespace():
     """Get current namespace using standard Kubernetes patterns."""
     context_info = get_context()
@@ -33,8 +40,52 @@ def get_context():
     2. Fall back to ~/.kube/config context (dev mode)
     3. Fall back to 'default' namespace
 
-    Note: Does not cache results to ensure multiple clients see correct context.
+    The result is resolved once and cached. In dev mode the cache is invalidated when
+    the kubeconfig file changes (e.g. after `kubectl config set-context`); call
+    refresh_context() to force a re-read.
     """
+    global _context_cache
+
+    fingerprint = _kubeconfig_fingerprint()
+    cached = _context_cache
+    if cached is None or cached[0] != fingerprint:
+        with _context_lock:
+            cached = _context_cache
+            if cached is None or cached[0] != fingerprint:
+                cached = (fingerprint, _resolve_context())
+                _context_cache = cached
+    return dict(cached[1])
+
+
+def refresh_context():
+    """Drop the cached context and resolve it again."""
+    global _context_cache
+
+    with _context_lock:
+        _context_cache = None
+    return get_context()
+
+
+_context_lock = threading.Lock()
+_context_cache = None
+
+
+def _kubeconfig_fingerprint():
+    """Modification times of the kubeconfig files, or None when running in-cluster."""
+    if os.path.isfile(NS_PATH):
+        return None
+    paths = os.path.expanduser(KUBE_CONFIG_DEFAULT_LOCATION).split(os.pathsep)
+    fingerprint = []
+    for path in paths:
+        try:
+            fingerprint.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            fingerprint.append(None)
+    return tuple(fingerprint)
+
+
+def _resolve_context():
+    """Read the current context from the service account or kubeconfig."""
 
     # First try: in-cluster service account (preferred when running in pods)
     if os.path.isfile(NS_PATH):
@@ -111,6 +162,64 @@ async def init_k8s():
         async_config.load_incluster_config()
 
 
+async def _list_as(
+    api_client: ApiClient,
+    path: str,
+    accept: str,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None
+) -> Dict:
+    """GET a list path with a custom Accept header.
+
+    The generated list methods always overwrite Accept, so this goes through
+    call_api directly.
+    """
+    query_params = []
+    if label_selector:
+        query_params.append(('labelSelector', label_selector))
+    if field_selector:
+        query_params.append(('fieldSelector', field_selector))
+    return await api_client.call_api(
+        path, 'GET',
+        query_params=query_params,
+        header_params={'Accept': accept},
+        response_types_map={200: 'object'},
+        auth_settings=['BearerToken'],
+        _return_http_data_only=True
+    )
+
+
+async def list_metadata(
+    api_client: ApiClient,
+    path: str,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None
+) -> List[Dict]:
+    """List only the metadata of the objects at a list path.
+
+    Requests a PartialObjectMetadataList, so object bodies (spec, status, secret
+    data) are never sent. Returns each object's metadata dictionary.
+    """
+    result = await _list_as(api_client, path, PARTIAL_METADATA_ACCEPT, label_selector, field_selector)
+    return [item.get('metadata') or {} for item in result.get('items', [])]
+
+
+async def list_table(
+    api_client: ApiClient,
+    path: str,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None
+) -> List[Dict]:
+    """List the objects at a list path as the apiserver's Table rendering.
+
+    Returns one dictionary per row mapping column names (e.g. "Name", "Age" and
+    a CRD's printer columns) to cell values.
+    """
+    result = await _list_as(api_client, path, TABLE_ACCEPT, label_selector, field_selector)
+    columns = [column['name'] for column in result.get('columnDefinitions', [])]
+    return [dict(zip(columns, row.get('cells', []))) for row in result.get('rows', [])]
+
+
 class SecretClient:
     """Kubernetes Secret management client."""
 
@@ -144,20 +253,20 @@ class SecretClient:
         return total_length
     
     async def list_secrets(self, label_selector: Optional[str] = None):
-        """List all secrets in namespace."""
+        """List all secrets in namespace (metadata only, secret data is not fetched)."""
         async with ApiClient() as api:
-            v1 = client.CoreV1Api(api)
-            secrets = await v1.list_namespaced_secret(
-                namespace=self.namespace,
+            secrets = await list_metadata(
+                api,
+                f"/api/v1/namespaces/{self.namespace}/secrets",
                 label_selector=label_selector
             )
             
             secret_list = []
-            for secret in secrets.items:
+            for metadata in secrets:
                 secret_list.append({
-                    "name": secret.metadata.name,
-                    "id": str(secret.metadata.uid),
-                    "annotations": secret.metadata.annotations or {}
+                    "name": metadata.get("name"),
+                    "id": str(metadata.get("uid")),
+                    "annotations": metadata.get("annotations") or {}
                 })
             
             return {
@@ -0,0 +1,70 @@
+"""Patch bodies built from partial update requests.
+
+Update routes used to read a resource, change its spec and replace the whole
+object, which costs two round-trips and fails on resourceVersion conflicts when
+someone else edits the resource in between. A JSON merge patch (RFC 7386) sends
+only the changed fields in one request and carries no resourceVersion:
+
+    from ark_sdk.patch import merge_patch
+    patch = {"spec": merge_patch(body)}
+    agent = await ark_client.agents.a_merge_patch(name, patch)
+
+Merge patch semantics apply: omitted fields are left untouched, lists replace
+the existing list, nested objects are merged key by key and a None value
+removes the key. Reference objects such as modelRef are replaced with
+`replace`; free-form objects (label selectors, config maps) need the current
+value, see diff_patch.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from pydantic import BaseModel
+
+
+def merge_patch(
+    update: BaseModel,
+    exclude: Optional[Iterable[str]] = None,
+    replace: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """Build a merge patch from a partial update request.
+
+    Fields that are None are left out, so they keep their current value on the
+    server. Field aliases are used as keys and enums are sent as their values.
+    Nested models named in `replace` are sent with their unset fields as None,
+    so they replace the existing object instead of being merged into it.
+    """
+    patch = update.model_dump(
+        exclude=set(exclude or ()),
+        exclude_none=True,
+        by_alias=True,
+        mode='json'
+    )
+    for field in replace or ():
+        value = getattr(update, field)
+        if isinstance(value, BaseModel):
+            alias = type(update).model_fields[field].alias or field
+            patch[alias] = value.model_dump(by_alias=True, mode='json')
+    return patch
+
+
+def diff_patch(current: Dict[str, Any], desired: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a merge patch that turns `current` into `desired`.
+
+    Use it to replace a nested object that has been read anyway: keys missing
+    from `desired` are set to None, so the server drops them instead of merging.
+    """
+    patch = {key: None for key in current if key not in desired}
+    for key, value in desired.items():
+        existing = current.get(key)
+        if isinstance(value, dict) and isinstance(existing, dict):
+            nested = diff_patch(existing, value)
+            if nested:
+                patch[key] = nested
+        elif key not in current or value != existing:
+            patch[key] = value
+    return patch
+
+
+def apply_body(api_version: str, kind: str, name: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a partial object for server-side apply from top-level fields such as spec"""
+    return {'apiVersion': api_version, 'kind': kind, 'metadata': {'name': name}, **fields}
@@ -0,0 +1,255 @@
+"""Client-side rate limiting and retries for Kubernetes API requests.
+
+Every request made through the SDK's shared API clients first takes a token from a
+process-wide token bucket (as client-go does with QPS/Burst) and is retried with
+exponential backoff and jitter when the API server answers 429 or 5xx, or the
+connection fails. A Retry-After header from the server takes precedence over the
+computed backoff.
+
+Configure with the ARK_SDK_QPS, ARK_SDK_BURST and ARK_SDK_MAX_RETRIES environment
+variables or at runtime:
+
+    from ark_sdk.ratelimit import configure, get_metrics
+    configure(qps=100, burst=200)
+    print(get_metrics())  # limiter waits and retries so far
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+import urllib3
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QPS = float(os.getenv("ARK_SDK_QPS", "50"))
+DEFAULT_BURST = int(os.getenv("ARK_SDK_BURST", "100"))
+DEFAULT_MAX_RETRIES = int(os.getenv("ARK_SDK_MAX_RETRIES", "3"))
+
+INITIAL_BACKOFF_SECONDS = 0.2
+MAX_BACKOFF_SECONDS = 10.0
+# Limiter waits longer than this are logged, like client-go's throttling message
+SLOW_WAIT_LOG_SECONDS = 1.0
+
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+# Methods that are safe to resend after a server error or a dropped connection
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by sync and async callers.
+
+    Callers reserve a token and then sleep for the returned delay, so a request is
+    never admitted faster than `qps` on average after an initial `burst`. A qps of 0
+    or less disables limiting.
+    """
+
+    def __init__(self, qps: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.qps = qps
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            self.requests += 1
+            if self.qps <= 0:
+                return 0.0
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.qps)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            delay = -self._tokens / self.qps
+            self.throttled += 1
+            self.wait_seconds_total += delay
+            self.wait_seconds_max = max(self.wait_seconds_max, delay)
+        if delay > SLOW_WAIT_LOG_SECONDS:
+            logger.info(f"Waited {delay:.2f}s due to client-side throttling (qps={self.qps}, burst={self.burst})")
+        return delay
+
+    def wait(self) -> None:
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def a_wait(self) -> None:
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for throttled, failed or dropped requests."""
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        initial_backoff: float = INITIAL_BACKOFF_SECONDS,
+        max_backoff: float = MAX_BACKOFF_SECONDS
+    ):
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.retries = 0
+
+    def delay(self, attempt: int, method: str, status: Optional[int], retry_after: Optional[str]) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the request should not be retried.
+
+        `status` is None for connection errors.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if status == 429:
+            pass
+        elif status is None or status in RETRYABLE_STATUSES:
+            if method.upper() not in IDEMPOTENT_METHODS:
+                return None
+        else:
+            return None
+
+        self.retries += 1
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass  # HTTP-date form; fall back to the computed backoff
+        backoff = min(self.max_backoff, self.initial_backoff * (2 ** attempt))
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+
+_limiter = TokenBucket(DEFAULT_QPS, DEFAULT_BURST)
+_retry_policy = RetryPolicy()
+
+
+def configure(qps: Optional[float] = None, burst: Optional[int] = None, max_retries: Optional[int] = None) -> None:
+    """Change the process-wide QPS, burst and retry count; omitted values are kept."""
+    global _limiter
+    if qps is not None or burst is not None:
+        _limiter = TokenBucket(
+            _limiter.qps if qps is None else qps,
+            _limiter.burst if burst is None else burst
+        )
+    if max_retries is not None:
+        _retry_policy.max_retries = max_retries
+
+
+def get_metrics() -> Dict[str, Any]:
+    """Snapshot of limiter waits and retries since the limiter was configured."""
+    return {
+        "qps": _limiter.qps,
+        "burst": _limiter.burst,
+        "requests": _limiter.requests,
+        "throttled_requests": _limiter.throttled,
+        "wait_seconds_total": _limiter.wait_seconds_total,
+        "wait_seconds_max": _limiter.wait_seconds_max,
+        "retries": _retry_policy.retries,
+    }
+
+
+def _retry_after(source: Any) -> Optional[str]:
+    """Read Retry-After from a response or an ApiException, whichever the client produced."""
+    getheader = getattr(source, "getheader", None)
+    if getheader is not None:
+        return getheader("Retry-After")
+    headers = getattr(source, "headers", None)
+    return headers.get("Retry-After") if headers else None
+
+
+def _throttled_sync(request: Callable) -> Callable:
+    @functools.wraps(request)
+    def wrapper(method, url, *args, **kwargs):
+        attempt = 0
+        while True:
+            _limiter.wait()
+            try:
+                response = request(method, url, *args, **kwargs)
+            except urllib3.exceptions.HTTPError as e:
+                delay = _retry_policy.delay(attempt, method, None, None)
+                if delay is None:
+                    raise
+                logger.debug(f"Retrying {method} {url} in {delay:.2f}s after connection error: {e}")
+            except Exception as e:
+                status = getattr(e, "status", None)
+                if status is None:
+                    raise
+                delay = _retry_policy.delay(attempt, method, status or None, _retry_after(e))
+                if delay is None:
+                    raise
+                logger.debug(f"Retrying {method} {url} in {delay:.2f}s after HTTP {status}")
+            else:
+                # Newer clients return non-2xx responses instead of raising
+                status = getattr(response, "status", 200)
+                delay = None
+                if status == 429 or status in RETRYABLE_STATUSES:
+                    delay = _retry_policy.delay(attempt, method, status, _retry_after(response))
+                if delay is None:
+                    return response
+                if hasattr(response, "read"):
+                    response.read()  # release the connection back to the pool
+                logger.debug(f"Retrying {method} {url} in {delay:.2f}s after HTTP {status}")
+            time.sleep(delay)
+            attempt += 1
+    return wrapper
+
+
+def _throttled_async(request: Callable) -> Callable:
+    @functools.wraps(request)
+    async def wrapper(method, url, *args, **kwargs):
+        attempt = 0
+        while True:
+            await _limiter.a_wait()
+            try:
+                response = await request(method, url, *args, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                delay = _retry_policy.delay(attempt, method, None, None)
+                if delay is None:
+                    raise
+                logger.debug(f"Retrying {method} {url} in {delay:.2f}s after connection error: {e}")
+            except Exception as e:
+                status = getattr(e, "status", None)
+                if status is None:
+                    raise
+                delay = _retry_policy.delay(attempt, method, status or None, _retry_after(e))
+                if delay is None:
+                    raise
+                logger.debug(f"Retrying {method} {url} in {delay:.2f}s after HTTP {status}")
+            else:
+                # With _preload_content=False the raw aiohttp response is returned unchecked
+                status = getattr(response, "status", 200)
+                delay = None
+                if status == 429 or status in RETRYABLE_STATUSES:
+                    delay = _retry_policy.delay(attempt, method, status, _retry_after(response))
+                if delay is None:
+                    return response
+                if hasattr(response, "release"):
+                    response.release()
+                logger.debug(f"Retrying {method} {url} in {delay:.2f}s after HTTP {status}")
+            await asyncio.sleep(delay)
+            attempt += 1
+    return wrapper
+
+
+def install(api_client: Any) -> Any:
+    """Route a kubernetes or kubernetes_asyncio ApiClient's requests through the limiter and retries."""
+    rest_client = api_client.rest_client
+    if inspect.iscoroutinefunction(rest_client.request):
+        rest_client.request = _throttled_async(rest_client.request)
+    else:
+        rest_client.request = _throttled_sync(rest_client.request)
+    return api_client
@@ -1,12 +1,25 @@
 """Streaming configuration from ConfigMap."""
 
-from typing import Optional
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 from dataclasses import dataclass
 import yaml
+from kubernetes_asyncio import client, watch
+
+from ark_sdk.versions import get_async_api_client
+
+logger = logging.getLogger(__name__)
 
 # ConfigMap name for streaming configuration
 STREAMING_CONFIG_NAME = "ark-config-streaming"
 
+# Fallback expiry of cached configuration, in case a watch misses a change
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+# Server-side timeout of a single invalidation watch; it is resumed afterwards
+WATCH_TIMEOUT_SECONDS = 300
+
 
 @dataclass
 class ServiceRef:
@@ -69,6 +82,9 @@ async def get_streaming_base_url(config: ArkStreamingConfig, namespace: str, k8s
     Raises:
         ValueError: If URL cannot be constructed
     """
+    if not config:
+        raise ValueError("No streaming configuration provided")
+
     service_ns = config.serviceRef.namespace or namespace
 
     # Look up the service to resolve port
@@ -88,4 +104,177 @@ async def get_streaming_base_url(config: ArkStreamingConfig, namespace: str, k8s
         raise ValueError(f"Port '{config.serviceRef.port}' not found in service {config.serviceRef.name}")
 
     # Return base URL
-    return f"http://{config.serviceRef.name}.{service_ns}.svc.cluster.local:{port_number}"
\ No newline at end of file
+    return f"http://{config.serviceRef.name}.{service_ns}.svc.cluster.local:{port_number}"
+
+
+def _base_url(config: ArkStreamingConfig, service_ns: str, ports: Dict[str, int]) -> str:
+    """Build the streaming base URL from a service's named ports."""
+    port_number = ports.get(config.serviceRef.port)
+    if port_number is None:
+        raise ValueError(f"Port '{config.serviceRef.port}' not found in service {config.serviceRef.name}")
+    return f"http://{config.serviceRef.name}.{service_ns}.svc.cluster.local:{port_number}"
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    watch_task: Optional[asyncio.Task] = None
+
+
+class StreamingConfigResolver:
+    """Caches streaming configuration and service ports per namespace.
+
+    The first lookup for a namespace reads the ConfigMap (and the Service it
+    references); later lookups are answered from memory. Each cached object is
+    watched from the resourceVersion that was read, and any change or deletion
+    drops it from the cache. Entries also expire after `ttl` seconds in case a
+    watch misses an update. Concurrent lookups of the same object share one read.
+    """
+
+    def __init__(
+        self,
+        k8s_client: Optional[client.CoreV1Api] = None,
+        ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        watch_changes: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._k8s_client = k8s_client
+        self.ttl = ttl
+        self.watch_changes = watch_changes
+        self._clock = clock
+        self._entries: Dict[Tuple[str, str, str], _CacheEntry] = {}
+        self._pending: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_config(self, namespace: str) -> Optional[ArkStreamingConfig]:
+        """Cached equivalent of get_streaming_config."""
+        key = ("configmaps", namespace, STREAMING_CONFIG_NAME)
+        return await self._get(key, self._load_config)
+
+    async def get_base_url(self, config: ArkStreamingConfig, namespace: str) -> str:
+        """Cached equivalent of get_streaming_base_url."""
+        if not config:
+            raise ValueError("No streaming configuration provided")
+        service_ns = config.serviceRef.namespace or namespace
+        key = ("services", service_ns, config.serviceRef.name)
+        return _base_url(config, service_ns, await self._get(key, self._load_service_ports))
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop cached entries for a namespace, or all entries."""
+        for key in list(self._entries):
+            if namespace is None or key[1] == namespace:
+                self._drop(key)
+
+    async def close(self) -> None:
+        """Stop all watches and clear the cache."""
+        tasks = [entry.watch_task for entry in self._entries.values() if entry.watch_task]
+        self.invalidate()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _api(self) -> client.CoreV1Api:
+        if self._k8s_client is None:
+            self._k8s_client = client.CoreV1Api(await get_async_api_client())
+        return self._k8s_client
+
+    async def _get(self, key: Tuple[str, str, str], load: Callable[..., Awaitable[Tuple[Any, Optional[str]]]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > self._clock():
+            self.hits += 1
+            return entry.value
+        pending = self._pending.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = asyncio.ensure_future(self._load(key, load))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _load(self, key: Tuple[str, str, str], load: Callable[..., Awaitable[Tuple[Any, Optional[str]]]]) -> Any:
+        _, namespace, name = key
+        value, resource_version = await load(namespace, name)
+        self._drop(key)
+        entry = _CacheEntry(value=value, expires_at=self._clock() + self.ttl)
+        if self.watch_changes:
+            entry.watch_task = asyncio.ensure_future(self._watch(key, resource_version))
+        self._entries[key] = entry
+        return value
+
+    async def _load_config(self, namespace: str, name: str) -> Tuple[Optional[ArkStreamingConfig], Optional[str]]:
+        api = await self._api()
+        try:
+            cm = await api.read_namespaced_config_map(name=name, namespace=namespace)
+        except Exception as e:
+            if hasattr(e, 'status') and e.status == 404:
+                return None, None
+            raise
+        return ArkStreamingConfig.from_dict(cm.data), cm.metadata.resource_version
+
+    async def _load_service_ports(self, namespace: str, name: str) -> Tuple[Dict[str, int], Optional[str]]:
+        api = await self._api()
+        service = await api.read_namespaced_service(name=name, namespace=namespace)
+        ports = {svc_port.name: svc_port.port for svc_port in service.spec.ports or []}
+        return ports, service.metadata.resource_version
+
+    async def _watch(self, key: Tuple[str, str, str], resource_version: Optional[str]) -> None:
+        """Drop `key` from the cache on the first change after `resource_version`."""
+        plural, namespace, name = key
+        api = await self._api()
+        list_method = api.list_namespaced_config_map if plural == "configmaps" else api.list_namespaced_service
+        try:
+            while True:
+                w = watch.Watch()
+                try:
+                    async for event in w.stream(
+                        list_method,
+                        namespace=namespace,
+                        field_selector=f"metadata.name={name}",
+                        resource_version=resource_version,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=WATCH_TIMEOUT_SECONDS
+                    ):
+                        event_version = (event['raw_object'].get('metadata') or {}).get('resourceVersion')
+                        if event['type'] == 'BOOKMARK':
+                            resource_version = event_version or resource_version
+                            continue
+                        logger.debug(f"Streaming config cache: {plural} {namespace}/{name} {event['type'].lower()}")
+                        self._drop(key, watch_task=asyncio.current_task())
+                        return
+                finally:
+                    await w.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Includes 410 Gone; the next lookup reads and watches afresh
+            logger.debug(f"Streaming config watch for {plural} {namespace}/{name} stopped: {e}")
+            self._drop(key, watch_task=asyncio.current_task())
+
+    def _drop(self, key: Tuple[str, str, str], watch_task: Optional[asyncio.Task] = None) -> None:
+        """Remove a cache entry and stop its watch; from a watch, only its own entry is removed."""
+        entry = self._entries.get(key)
+        if entry is None or (watch_task is not None and entry.watch_task is not watch_task):
+            return
+        del self._entries[key]
+        if entry.watch_task is not None and watch_task is None:
+            entry.watch_task.cancel()
+
+
+_resolver: Optional[StreamingConfigResolver] = None
+
+
+def get_streaming_resolver() -> StreamingConfigResolver:
+    """Process-wide resolver shared by streaming requests."""
+    global _resolver
+    if _resolver is None:
+        _resolver = StreamingConfigResolver()
+    return _resolver
+
+
+async def close_streaming_resolver() -> None:
+    """Stop the shared resolver's watches; call on shutdown."""
+    global _resolver
+    if _resolver is not None:
+        await _resolver.close()
+        _resolver = None
@@ -1,8 +1,13 @@
 """Tests for streaming configuration."""
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from ark_sdk.streaming_config import ArkStreamingConfig, ServiceRef, get_streaming_config, get_streaming_base_url, STREAMING_CONFIG_NAME
+from unittest.mock import AsyncMock, MagicMock, patch
+from ark_sdk.streaming_config import (
+    ArkStreamingConfig, ServiceRef, StreamingConfigResolver,
+    get_streaming_config, get_streaming_base_url, STREAMING_CONFIG_NAME
+)
 
 
 def test_from_dict_valid():
@@ -146,4 +151,103 @@ async def test_get_streaming_base_url_port_not_found():
     mock_client.read_namespaced_service.return_value = mock_service
 
     with pytest.raises(ValueError, match="Port 'nonexistent' not found"):
-        await get_streaming_base_url(config, "default", mock_client)
\ No newline at end of file
+        await get_streaming_base_url(config, "default", mock_client)
+
+
+def make_core_client():
+    """CoreV1Api mock with a streaming ConfigMap and its Service."""
+    mock_client = AsyncMock()
+    mock_cm = MagicMock()
+    mock_cm.data = {"enabled": "true", "serviceRef": 'name: ark-broker\nport: "http"'}
+    mock_cm.metadata.resource_version = "10"
+    mock_client.read_namespaced_config_map.return_value = mock_cm
+    mock_port = MagicMock()
+    mock_port.name = "http"
+    mock_port.port = 8080
+    mock_service = MagicMock()
+    mock_service.spec.ports = [mock_port]
+    mock_service.metadata.resource_version = "11"
+    mock_client.read_namespaced_service.return_value = mock_service
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_resolver_caches_config_and_base_url():
+    """Test repeated lookups make no further API calls."""
+    mock_client = make_core_client()
+    resolver = StreamingConfigResolver(mock_client, watch_changes=False)
+
+    for _ in range(3):
+        config = await resolver.get_config("default")
+        url = await resolver.get_base_url(config, "default")
+
+    assert url == "http://ark-broker.default.svc.cluster.local:8080"
+    assert mock_client.read_namespaced_config_map.await_count == 1
+    assert mock_client.read_namespaced_service.await_count == 1
+    assert (resolver.hits, resolver.misses) == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_resolver_caches_missing_config_and_expires_after_ttl():
+    """Test a missing ConfigMap is cached and entries expire after the TTL."""
+    now = [0.0]
+    mock_client = AsyncMock()
+    mock_error = Exception()
+    mock_error.status = 404
+    mock_client.read_namespaced_config_map.side_effect = mock_error
+    resolver = StreamingConfigResolver(mock_client, ttl=60, watch_changes=False, clock=lambda: now[0])
+
+    assert await resolver.get_config("default") is None
+    assert await resolver.get_config("default") is None
+    now[0] = 61
+    assert await resolver.get_config("default") is None
+
+    assert mock_client.read_namespaced_config_map.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolver_shares_concurrent_lookups():
+    """Test concurrent cache misses for a namespace share one read."""
+    mock_client = make_core_client()
+    resolver = StreamingConfigResolver(mock_client, watch_changes=False)
+
+    configs = await asyncio.gather(*(resolver.get_config("default") for _ in range(5)))
+
+    assert all(config is configs[0] for config in configs)
+    assert mock_client.read_namespaced_config_map.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_resolver_watch_invalidates_on_change():
+    """Test a watched change drops the entry so the next lookup re-reads it."""
+    mock_client = make_core_client()
+    changed = asyncio.Event()
+    streams = []
+
+    class FakeWatch:
+        def stream(self, func, **kwargs):
+            streams.append(kwargs)
+            return self._events()
+
+        async def _events(self):
+            await changed.wait()
+            yield {"type": "MODIFIED", "raw_object": {"metadata": {"resourceVersion": "12"}}}
+
+        async def close(self):
+            pass
+
+    with patch('ark_sdk.streaming_config.watch.Watch', FakeWatch):
+        resolver = StreamingConfigResolver(mock_client)
+        await resolver.get_config("default")
+        await resolver.get_config("default")
+        await asyncio.sleep(0)
+        assert streams[0]["field_selector"] == f"metadata.name={STREAMING_CONFIG_NAME}"
+        assert streams[0]["resource_version"] == "10"
+
+        changed.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await resolver.get_config("default")
+        await resolver.close()
+
+    assert mock_client.read_namespaced_config_map.await_count == 2
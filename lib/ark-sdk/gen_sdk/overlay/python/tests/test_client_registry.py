@@ -0,0 +1,51 @@
+"""Tests for the process-wide ARK client registry."""
+import unittest
+from unittest.mock import patch
+
+from ark_sdk import client as ark_client
+
+
+class TestClientRegistry(unittest.TestCase):
+    """Test cases for get_client caching."""
+
+    def setUp(self):
+        ark_client.clear_client_cache()
+
+    def tearDown(self):
+        ark_client.clear_client_cache()
+
+    @patch('ark_sdk.client.versions.ARKClientV1alpha1')
+    def test_clients_are_cached_per_namespace_and_version(self, mock_client_class):
+        mock_client_class.side_effect = lambda namespace: object()
+
+        first = ark_client.get_client("team-a", "v1alpha1")
+
+        self.assertIs(ark_client.get_client("team-a", "v1alpha1"), first)
+        self.assertIsNot(ark_client.get_client("team-b", "v1alpha1"), first)
+        self.assertEqual(mock_client_class.call_count, 2)
+
+    @patch('ark_sdk.client.get_context', return_value={"namespace": "from-context", "cluster": None})
+    @patch('ark_sdk.client.versions.ARKClientV1alpha1')
+    def test_namespace_defaults_to_context(self, mock_client_class, mock_get_context):
+        ark_client.get_client(None, "v1alpha1")
+
+        mock_client_class.assert_called_once_with("from-context")
+
+    def test_unknown_version(self):
+        with self.assertRaises(Exception) as context:
+            ark_client.get_client("default", "v9")
+
+        self.assertIn("No client for v9", str(context.exception))
+
+    @patch('ark_sdk.client.versions.ARKClientV1alpha1')
+    def test_clear_client_cache(self, mock_client_class):
+        mock_client_class.side_effect = lambda namespace: object()
+        first = ark_client.get_client("default", "v1alpha1")
+
+        ark_client.clear_client_cache()
+
+        self.assertIsNot(ark_client.get_client("default", "v1alpha1"), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for cached Kubernetes context resolution."""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ark_sdk import k8s
+
+
+def active_context(namespace, cluster="dev"):
+    return [], {"name": "dev", "context": {"namespace": namespace, "cluster": cluster}}
+
+
+class TestGetContext(unittest.TestCase):
+    """Test cases for get_context caching."""
+
+    def setUp(self):
+        handle, self.kubeconfig = tempfile.mkstemp()
+        os.close(handle)
+        self.addCleanup(os.remove, self.kubeconfig)
+        for target, value in (
+            ('ark_sdk.k8s.KUBE_CONFIG_DEFAULT_LOCATION', self.kubeconfig),
+            ('ark_sdk.k8s.NS_PATH', os.path.join(tempfile.gettempdir(), "missing-ark-namespace")),
+            ('ark_sdk.k8s._context_cache', None),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @patch('ark_sdk.k8s.config.list_kube_config_contexts', return_value=active_context("dev-ns"))
+    def test_context_is_resolved_once(self, mock_contexts):
+        self.assertEqual(k8s.get_context(), {"namespace": "dev-ns", "cluster": "dev"})
+        self.assertEqual(k8s.get_namespace(), "dev-ns")
+
+        mock_contexts.assert_called_once()
+
+    @patch('ark_sdk.k8s.config.list_kube_config_contexts')
+    def test_kubeconfig_change_invalidates_cache(self, mock_contexts):
+        mock_contexts.return_value = active_context("first")
+        self.assertEqual(k8s.get_context()["namespace"], "first")
+
+        mock_contexts.return_value = active_context("second")
+        stat = os.stat(self.kubeconfig)
+        os.utime(self.kubeconfig, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(k8s.get_context()["namespace"], "second")
+        self.assertEqual(mock_contexts.call_count, 2)
+
+    @patch('ark_sdk.k8s.config.list_kube_config_contexts')
+    def test_refresh_context(self, mock_contexts):
+        mock_contexts.return_value = active_context("first")
+        k8s.get_context()
+
+        mock_contexts.return_value = active_context("second")
+        self.assertEqual(k8s.get_context()["namespace"], "first")
+        self.assertEqual(k8s.refresh_context()["namespace"], "second")
+
+    @patch('ark_sdk.k8s.config.list_kube_config_contexts')
+    def test_in_cluster_namespace(self, mock_contexts):
+        with tempfile.NamedTemporaryFile("w", delete=False) as f:
+            f.write("pod-ns\n")
+        self.addCleanup(os.remove, f.name)
+
+        with patch('ark_sdk.k8s.NS_PATH', f.name):
+            self.assertEqual(k8s.get_context(), {"namespace": "pod-ns", "cluster": None})
+            self.assertEqual(k8s.get_context()["namespace"], "pod-ns")
+
+        mock_contexts.assert_not_called()
+
+    def test_returned_context_is_a_copy(self):
+        with patch('ark_sdk.k8s.config.list_kube_config_contexts', return_value=active_context("dev-ns")):
+            k8s.get_context()["namespace"] = "mutated"
+            self.assertEqual(k8s.get_context()["namespace"], "dev-ns")
+
+
+if __name__ == '__main__':
+    unittest.main()
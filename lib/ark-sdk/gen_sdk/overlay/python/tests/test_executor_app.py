@@ -0,0 +1,179 @@
+"""Tests for the execution engine application."""
+import asyncio
+import json
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from ark_sdk.admission import AdmissionController, Overloaded
+from ark_sdk.executor import BaseExecutor, ExecutionEngineRequest, Message, MessageDelta
+from ark_sdk.executor_app import ExecutorApp
+
+REQUEST = {
+    "agent": {
+        "name": "test-agent",
+        "namespace": "default",
+        "prompt": "You are helpful.",
+        "model": {"name": "gpt-4", "type": "openai"},
+    },
+    "userInput": {"role": "user", "content": "hi"},
+    "history": [],
+}
+
+
+class StaticExecutor(BaseExecutor):
+    """Executor that only implements execute_agent."""
+
+    def __init__(self):
+        super().__init__("Static")
+
+    async def execute_agent(self, request: ExecutionEngineRequest) -> List[Message]:
+        return [Message(role="assistant", content="hello there")]
+
+
+class StreamingExecutor(StaticExecutor):
+    """Executor that streams two deltas without a final message."""
+
+    async def stream_agent(self, request: ExecutionEngineRequest):
+        yield MessageDelta(content="hello ")
+        yield MessageDelta(content="there")
+
+
+class FailingExecutor(StreamingExecutor):
+    """Executor that fails after the first delta."""
+
+    async def stream_agent(self, request: ExecutionEngineRequest):
+        yield MessageDelta(content="hel")
+        raise RuntimeError("model unavailable")
+
+
+def parse_sse(body: str) -> List[tuple]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestExecuteStream(unittest.TestCase):
+    """Test cases for POST /execute/stream."""
+
+    def stream(self, executor: BaseExecutor, accept: str = "text/event-stream"):
+        client = TestClient(ExecutorApp(executor, "test").app)
+        return client.post("/execute/stream", json=REQUEST, headers={"Accept": accept})
+
+    def test_streams_deltas_as_sse(self):
+        response = self.stream(StreamingExecutor())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        events = parse_sse(response.text)
+        self.assertEqual(events[:2], [("delta", {"type": "delta", "content": "hello "}),
+                                      ("delta", {"type": "delta", "content": "there"})])
+        event_type, done = events[2]
+        self.assertEqual(event_type, "done")
+        self.assertEqual(done["response"]["messages"][0]["content"], "hello there")
+        self.assertEqual(done["response"]["error"], "")
+
+    def test_fallback_adapter_streams_execute_agent_messages(self):
+        self.assertFalse(StaticExecutor().supports_streaming)
+        self.assertTrue(StreamingExecutor().supports_streaming)
+
+        response = self.stream(StaticExecutor(), accept="application/x-ndjson")
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([e["type"] for e in events], ["message", "done"])
+        self.assertEqual(events[0]["message"]["content"], "hello there")
+        self.assertEqual(events[1]["response"]["messages"], [events[0]["message"]])
+
+    def test_error_is_reported_in_done_event(self):
+        response = self.stream(FailingExecutor(), accept="application/x-ndjson")
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([e["type"] for e in events], ["delta", "done"])
+        self.assertEqual(events[1]["response"]["messages"], [])
+        self.assertIn("model unavailable", events[1]["response"]["error"])
+
+    def test_execute_still_returns_full_response(self):
+        client = TestClient(ExecutorApp(StreamingExecutor(), "test").app)
+
+        response = client.post("/execute", json=REQUEST)
+
+        self.assertEqual(response.json()["messages"][0]["content"], "hello there")
+
+
+class TestAdmissionController(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AdmissionController."""
+
+    async def test_queues_then_rejects(self):
+        admission = AdmissionController(max_concurrent=1, max_queue=1, retry_after=7)
+        await admission.acquire()
+        queued = asyncio.ensure_future(admission.acquire())
+        await asyncio.sleep(0)
+
+        with self.assertRaises(Overloaded) as context:
+            await admission.acquire()
+        self.assertEqual(context.exception.retry_after, 7)
+        self.assertEqual(admission.stats()["waiting"], 1)
+
+        admission.release()
+        await queued
+        self.assertEqual(admission.stats(), {
+            "active": 1, "waiting": 0, "rejected": 1, "max_concurrent": 1, "max_queue": 1
+        })
+        self.assertEqual(admission.queue_wait.count, 2)
+
+    async def test_unlimited_by_default(self):
+        admission = AdmissionController(max_concurrent=0, max_queue=0)
+        for _ in range(100):
+            await admission.acquire()
+        self.assertEqual(admission.stats()["active"], 100)
+
+
+class TestAdmissionRoutes(unittest.TestCase):
+    """Test cases for 503 responses and /metrics."""
+
+    def test_overflow_returns_503_with_retry_after(self):
+        executor_app = ExecutorApp(StaticExecutor(), "test", max_concurrency=1, max_queue=0, retry_after=3)
+        client = TestClient(executor_app.app)
+        executor_app.admission.active = 1  # the only slot is taken
+
+        for path in ("/execute", "/execute/stream"):
+            response = client.post(path, json=REQUEST)
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers["Retry-After"], "3")
+
+        executor_app.admission.active = 0
+        self.assertEqual(client.post("/execute/stream", json=REQUEST).status_code, 200)
+        self.assertEqual(executor_app.admission.active, 0)
+
+    def test_metrics(self):
+        executor_app = ExecutorApp(StaticExecutor(), "test")
+        client = TestClient(executor_app.app)
+        client.post("/execute", json=REQUEST)
+
+        body = client.get("/metrics").text
+
+        self.assertIn('executor_queue_depth{engine="test"} 0', body)
+        self.assertIn('executor_executions_total{engine="test",status="success"} 1', body)
+        self.assertIn('executor_execution_duration_seconds_count{engine="test"} 1', body)
+        self.assertIn('executor_execution_duration_seconds_bucket{engine="test",le="+Inf"} 1', body)
+
+    @patch('ark_sdk.executor_app.uvicorn.run')
+    def test_run_with_workers_uses_factory(self, mock_run):
+        executor_app = ExecutorApp(StaticExecutor(), "test")
+
+        with self.assertRaises(ValueError):
+            executor_app.run(workers=4)
+        executor_app.run(port=9000, workers=4, factory="my_engine.app:create_app")
+
+        mock_run.assert_called_once_with(
+            "my_engine.app:create_app", factory=True, host="0.0.0.0", port=9000, workers=4,
+            access_log=True, log_level="info"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
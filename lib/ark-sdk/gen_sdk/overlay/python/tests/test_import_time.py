@@ -0,0 +1,77 @@
+"""Tests for lazy package imports and the import-time budget."""
+import os
+import subprocess
+import sys
+import unittest
+
+import ark_sdk
+
+# Cumulative `import ark_sdk` time allowed by -X importtime, in milliseconds
+IMPORT_BUDGET_MS = float(os.getenv("ARK_SDK_IMPORT_BUDGET_MS", "150"))
+
+# Modules that must not be loaded just by importing the package
+HEAVY_MODULES = ("kubernetes", "kubernetes_asyncio", "yaml", "fastapi", "uvicorn", "pydantic")
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def cumulative_import_us(stderr: str, module: str) -> int:
+    """Cumulative microseconds for `module` from `python -X importtime` output."""
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1])
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for PEP 562 loading of package exports."""
+
+    def test_import_does_not_load_models_or_clients(self):
+        result = run_python(
+            "import sys, ark_sdk; print('\\n'.join(sys.modules))"
+        )
+        loaded = set(result.stdout.split())
+
+        for module in HEAVY_MODULES + ("ark_sdk.versions", "ark_sdk.models.query_v1alpha1"):
+            self.assertNotIn(module, loaded)
+
+    def test_client_does_not_load_executor_app(self):
+        result = run_python(
+            "import sys, ark_sdk.client; print('\\n'.join(sys.modules))"
+        )
+        loaded = set(result.stdout.split())
+
+        self.assertNotIn("ark_sdk.executor_app", loaded)
+        self.assertNotIn("fastapi", loaded)
+
+    def test_import_time_budget(self):
+        samples = [
+            cumulative_import_us(run_python("import ark_sdk", "-X", "importtime").stderr, "ark_sdk")
+            for _ in range(3)
+        ]
+
+        self.assertLess(min(samples) / 1000, IMPORT_BUDGET_MS)
+
+    def test_exports_resolve_on_access(self):
+        from ark_sdk import ARKClientV1alpha1, BaseExecutor, QueryV1alpha1
+        from ark_sdk.models import QueryV1alpha1Spec
+
+        self.assertEqual(QueryV1alpha1.__module__, "ark_sdk.models.query_v1alpha1")
+        self.assertEqual(QueryV1alpha1Spec.__module__, "ark_sdk.models.query_v1alpha1_spec")
+        self.assertEqual(ARKClientV1alpha1.__module__, "ark_sdk.versions")
+        self.assertEqual(BaseExecutor.__module__, "ark_sdk.executor")
+        self.assertIn("QueryV1alpha1", dir(ark_sdk))
+        self.assertIs(ark_sdk.__dict__["QueryV1alpha1"], QueryV1alpha1)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            ark_sdk.NotAModel
+
+
+if __name__ == '__main__':
+    unittest.main()
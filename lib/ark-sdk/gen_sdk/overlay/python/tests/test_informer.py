@@ -0,0 +1,218 @@
+"""Tests for the watch-backed informer cache."""
+import asyncio
+import unittest
+from unittest.mock import Mock, AsyncMock, patch
+
+from kubernetes_asyncio.client.rest import ApiException
+
+from ark_sdk.informer import Informer, InformerFactory, field_index, label_index, matches_label_selector
+
+
+def make_obj(name, rv="1", labels=None, model="gpt-4"):
+    return {
+        "metadata": {"name": name, "namespace": "test-namespace", "resourceVersion": rv, "labels": labels or {}},
+        "spec": {"modelRef": {"name": model}},
+    }
+
+
+class FakeModel:
+    def __init__(self, **kwargs):
+        self.metadata = kwargs["metadata"]
+        self.spec = kwargs.get("spec")
+
+
+def make_resource_client():
+    resource_client = Mock()
+    resource_client.kind = "Agent"
+    resource_client.group = "ark.mckinsey.com"
+    resource_client.version = "v1alpha1"
+    resource_client.plural = "agents"
+    resource_client.namespace = "test-namespace"
+    resource_client._dict_to_model.side_effect = lambda data: FakeModel(**data)
+    return resource_client
+
+
+def events(*items, error=None):
+    async def generator(resource_version):
+        for item in items:
+            yield item
+        if error is not None:
+            raise error
+        # Keep the watch open until the informer is stopped
+        await asyncio.Event().wait()
+    return generator
+
+
+class TestLabelSelector(unittest.TestCase):
+    """Test cases for client-side label selector matching."""
+
+    def test_equality_and_existence(self):
+        labels = {"app": "ark", "tier": "backend"}
+        self.assertTrue(matches_label_selector(labels, "app=ark"))
+        self.assertTrue(matches_label_selector(labels, "app==ark,tier"))
+        self.assertFalse(matches_label_selector(labels, "app!=ark"))
+        self.assertFalse(matches_label_selector(labels, "!tier"))
+        self.assertFalse(matches_label_selector(labels, "missing"))
+
+    def test_set_based(self):
+        labels = {"env": "prod"}
+        self.assertTrue(matches_label_selector(labels, "env in (prod, staging)"))
+        self.assertFalse(matches_label_selector(labels, "env notin (prod,staging)"))
+        self.assertTrue(matches_label_selector({}, "env notin (prod)"))
+
+
+class TestInformer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for Informer."""
+
+    def setUp(self):
+        self.informer = Informer(make_resource_client())
+
+    async def asyncTearDown(self):
+        await self.informer.stop()
+
+    async def _start(self, items, rv, watch_events):
+        self.informer._list_objects = AsyncMock(return_value=(items, rv))
+        self.informer._watch_events = watch_events
+        await self.informer.start()
+        await self.informer.wait_for_sync(timeout=1)
+
+    async def test_initial_list_populates_store(self):
+        await self._start([make_obj("a"), make_obj("b", labels={"team": "x"})], "10", events())
+
+        self.assertEqual((await self.informer.a_get("a")).metadata["name"], "a")
+        self.assertEqual(len(await self.informer.a_list()), 2)
+        self.assertEqual([m.metadata["name"] for m in self.informer.list("team=x")], ["b"])
+        self.assertEqual(self.informer.resource_version, "10")
+
+    async def test_reads_time_out_while_list_fails(self):
+        self.informer._list_objects = AsyncMock(side_effect=ApiException(status=403, reason="Forbidden"))
+        await self.informer.start()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.informer.a_get("a", timeout=0.01)
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.informer.a_list(timeout=0.01)
+        self.assertFalse(self.informer.has_synced)
+
+    async def test_get_missing_raises(self):
+        await self._start([], "1", events())
+
+        with self.assertRaises(Exception) as context:
+            self.informer.get("missing")
+        self.assertIn("not found", str(context.exception))
+
+    async def test_watch_events_update_store_and_handlers(self):
+        on_add, on_update, on_delete = Mock(), AsyncMock(), Mock()
+        self.informer.add_event_handler(on_add=on_add, on_update=on_update, on_delete=on_delete)
+        done = asyncio.Event()
+        self.informer.add_event_handler(on_delete=lambda obj: done.set())
+
+        await self._start([make_obj("a")], "1", events(
+            ("ADDED", make_obj("b", rv="2")),
+            ("MODIFIED", make_obj("a", rv="3", model="claude")),
+            ("BOOKMARK", {"metadata": {"resourceVersion": "4"}}),
+            ("DELETED", make_obj("b", rv="5")),
+        ))
+        await asyncio.wait_for(done.wait(), 1)
+
+        self.assertEqual(self.informer.get("a").spec["modelRef"]["name"], "claude")
+        self.assertIsNone(self.informer.get_raw("b"))
+        self.assertEqual(self.informer.resource_version, "5")
+        self.assertEqual([c.args[0]["metadata"]["name"] for c in on_add.call_args_list], ["a", "b"])
+        on_update.assert_awaited_once()
+        on_delete.assert_called_once()
+
+    async def test_secondary_index(self):
+        self.informer.add_index("model", field_index("spec.modelRef.name"))
+        self.informer.add_index("team", label_index("team"))
+        done = asyncio.Event()
+        self.informer.add_event_handler(on_update=lambda old, new: done.set())
+
+        await self._start(
+            [make_obj("a"), make_obj("b", model="claude", labels={"team": "x"})], "1",
+            events(("MODIFIED", make_obj("a", rv="2", model="claude")))
+        )
+        await asyncio.wait_for(done.wait(), 1)
+
+        self.assertEqual([m.metadata["name"] for m in self.informer.by_index("model", "claude")], ["a", "b"])
+        self.assertEqual(self.informer.by_index("model", "gpt-4"), [])
+        self.assertEqual([m.metadata["name"] for m in self.informer.by_index("team", "x")], ["b"])
+        with self.assertRaises(KeyError):
+            self.informer.by_index("unknown", "x")
+
+    async def test_models_are_cached_until_object_changes(self):
+        await self._start([make_obj("a")], "1", events())
+
+        first = self.informer.get("a")
+        self.assertIs(self.informer.get("a"), first)
+        self.informer._put(make_obj("a", rv="2"))
+        self.assertIsNot(self.informer.get("a"), first)
+
+    async def test_gone_triggers_relist(self):
+        on_delete = Mock()
+        self.informer.add_event_handler(on_delete=on_delete)
+        gone = ApiException(status=410, reason="Expired")
+        watches = [events(error=gone), events()]
+        self.informer._watch_events = lambda rv: watches.pop(0)(rv)
+        self.informer._list_objects = AsyncMock(side_effect=[
+            ([make_obj("a"), make_obj("b")], "1"),
+            ([make_obj("a")], "20"),
+        ])
+
+        await self.informer.start()
+        for _ in range(100):
+            if self.informer.resource_version == "20":
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(self.informer._list_objects.await_count, 2)
+        self.assertEqual([o["metadata"]["name"] for o in self.informer.list_raw()], ["a"])
+        on_delete.assert_called_once()
+
+    async def test_resync_replays_updates(self):
+        on_update = Mock()
+        self.informer.add_event_handler(on_update=on_update)
+        await self._start([make_obj("a"), make_obj("b")], "1", events())
+
+        await self.informer.resync()
+
+        self.assertEqual(on_update.call_count, 2)
+
+    async def test_handler_errors_are_isolated(self):
+        on_add = Mock()
+        self.informer.add_event_handler(on_add=Mock(side_effect=RuntimeError("boom")))
+        self.informer.add_event_handler(on_add=on_add)
+
+        await self._start([make_obj("a")], "1", events())
+
+        on_add.assert_called_once()
+
+
+class TestInformerFactory(unittest.IsolatedAsyncioTestCase):
+    """Test cases for InformerFactory."""
+
+    def test_informers_are_shared_per_namespace_and_plural(self):
+        factory = InformerFactory()
+        resource_client = make_resource_client()
+
+        first = factory.informer_for(resource_client)
+        self.assertIs(factory.informer_for(resource_client), first)
+        self.assertIsNot(factory.informer_for(resource_client, namespace="other"), first)
+        self.assertEqual(factory.informer_for(resource_client, namespace="other").namespace, "other")
+
+    @patch('ark_sdk.informer.Informer.start', new_callable=AsyncMock)
+    @patch('ark_sdk.informer.Informer.stop', new_callable=AsyncMock)
+    async def test_start_and_stop_all(self, mock_stop, mock_start):
+        factory = InformerFactory()
+        factory.informer_for(make_resource_client())
+        factory.informer_for(make_resource_client(), namespace="other")
+
+        await factory.start()
+        await factory.stop()
+
+        self.assertEqual(mock_start.await_count, 2)
+        self.assertEqual(mock_stop.await_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""Tests for Kubernetes API call instrumentation."""
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from kubernetes_asyncio.client.rest import ApiException
+
+from ark_sdk import instrumentation
+from ark_sdk.instrumentation import ApiCall, MetricsHook, describe
+
+QUERIES = "https://k8s/apis/ark.mckinsey.com/v1alpha1/namespaces/default/queries"
+
+
+class TestDescribe(unittest.TestCase):
+    """Test cases for deriving verbs and resources from request URLs."""
+
+    def test_custom_resource_verbs(self):
+        self.assertEqual(describe("GET", QUERIES), {
+            "verb": "list", "resource": "queries", "namespace": "default", "name": ""
+        })
+        self.assertEqual(describe("GET", f"{QUERIES}/q1")["verb"], "get")
+        self.assertEqual(describe("GET", f"{QUERIES}?watch=true")["verb"], "watch")
+        self.assertEqual(describe("GET", QUERIES, query_params=[("watch", True)])["verb"], "watch")
+        self.assertEqual(describe("POST", QUERIES)["verb"], "create")
+        self.assertEqual(describe("PUT", f"{QUERIES}/q1")["verb"], "update")
+        self.assertEqual(describe("PATCH", f"{QUERIES}/q1")["verb"], "patch")
+        self.assertEqual(
+            describe("PATCH", f"{QUERIES}/q1", headers={"Content-Type": "application/apply-patch+yaml"})["verb"],
+            "apply"
+        )
+        self.assertEqual(describe("DELETE", f"{QUERIES}/q1")["verb"], "delete")
+        self.assertEqual(describe("DELETE", QUERIES)["verb"], "deletecollection")
+
+    def test_core_and_cluster_scoped_paths(self):
+        self.assertEqual(describe("GET", "https://k8s/api/v1/namespaces/dev/secrets/s1"), {
+            "verb": "get", "resource": "secrets", "namespace": "dev", "name": "s1"
+        })
+        self.assertEqual(describe("GET", "https://k8s/api/v1/namespaces/dev"), {
+            "verb": "get", "resource": "namespaces", "namespace": "", "name": "dev"
+        })
+        self.assertEqual(describe("PUT", f"{QUERIES}/q1/status")["resource"], "queries/status")
+
+
+class TestMetricsHook(unittest.TestCase):
+    """Test cases for the Prometheus-style metrics hook."""
+
+    def call(self, **overrides):
+        values = dict(
+            method="GET", verb="list", resource="queries", namespace="default", name="",
+            status=200, duration=0.2, start_time_ns=0, response_bytes=1024
+        )
+        values.update(overrides)
+        return ApiCall(**values)
+
+    def test_render(self):
+        metrics = MetricsHook(buckets=(0.1, 1.0))
+        metrics(self.call())
+        metrics(self.call(duration=0.05, response_bytes=512))
+        metrics(self.call(status=None, duration=2.0, response_bytes=None, error="ClientConnectionError"))
+
+        text = metrics.render()
+
+        self.assertIn('ark_sdk_request_duration_seconds_bucket{resource="queries",verb="list",le="0.1"} 1', text)
+        self.assertIn('ark_sdk_request_duration_seconds_bucket{resource="queries",verb="list",le="1.0"} 2', text)
+        self.assertIn('ark_sdk_request_duration_seconds_count{resource="queries",verb="list"} 3', text)
+        self.assertIn('ark_sdk_requests_total{resource="queries",verb="list",code="200"} 2', text)
+        self.assertIn('ark_sdk_requests_total{resource="queries",verb="list",code="error"} 1', text)
+        self.assertIn('ark_sdk_response_bytes_total{resource="queries",verb="list"} 1536', text)
+
+
+class TestInstall(unittest.IsolatedAsyncioTestCase):
+    """Test cases for reporting API client requests to hooks."""
+
+    def setUp(self):
+        patcher = patch('ark_sdk.instrumentation._hooks', ())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = []
+        instrumentation.add_hook(self.calls.append)
+
+    def test_sync_request_is_reported(self):
+        response = Mock(status=200, data=b'{"items": []}')
+        api_client = Mock()
+        api_client.rest_client.request = Mock(return_value=response)
+
+        instrumentation.install(api_client)
+        result = api_client.rest_client.request("GET", QUERIES)
+
+        self.assertIs(result, response)
+        [call] = self.calls
+        self.assertEqual((call.verb, call.resource, call.namespace, call.status), ("list", "queries", "default", 200))
+        self.assertEqual(call.response_bytes, 13)
+        self.assertGreaterEqual(call.duration, 0)
+
+    async def test_async_error_is_reported_and_raised(self):
+        api_client = Mock()
+        api_client.rest_client.request = AsyncMock(side_effect=ApiException(status=404))
+
+        instrumentation.install(api_client)
+        with self.assertRaises(ApiException):
+            await api_client.rest_client.request("GET", f"{QUERIES}/missing")
+
+        [call] = self.calls
+        self.assertEqual((call.verb, call.name, call.status, call.error), ("get", "missing", 404, "ApiException"))
+
+    async def test_unread_response_body_is_not_read(self):
+        response = Mock(status=200, content_length=None, spec=["status", "content_length", "getheader"])
+        response.getheader.return_value = "42"
+        api_client = Mock()
+        api_client.rest_client.request = AsyncMock(return_value=response)
+
+        instrumentation.install(api_client)
+        await api_client.rest_client.request("GET", f"{QUERIES}?watch=true", _preload_content=False)
+
+        self.assertEqual(self.calls[0].response_bytes, 42)
+
+    def test_failing_hook_does_not_break_requests(self):
+        instrumentation.add_hook(Mock(side_effect=RuntimeError("boom")))
+        api_client = Mock()
+        api_client.rest_client.request = Mock(return_value=Mock(status=201, data=b""))
+
+        instrumentation.install(api_client)
+        api_client.rest_client.request("POST", QUERIES)
+
+        self.assertEqual(self.calls[0].verb, "create")
+
+    def test_no_hooks_passes_through(self):
+        instrumentation.remove_hook(self.calls.append)
+        api_client = Mock()
+        api_client.rest_client.request = Mock(return_value="ok")
+
+        instrumentation.install(api_client)
+
+        self.assertEqual(api_client.rest_client.request("GET", QUERIES), "ok")
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for building patches from partial update requests."""
+import unittest
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from ark_sdk.patch import apply_body, diff_patch, merge_patch
+
+
+class Strategy(str, Enum):
+    SEQUENTIAL = "sequential"
+
+
+class Edge(BaseModel):
+    from_: str = Field(..., alias='from')
+    to: str
+    label: Optional[str] = None
+
+
+class Ref(BaseModel):
+    name: str
+    namespace: Optional[str] = None
+
+
+class UpdateRequest(BaseModel):
+    description: Optional[str] = None
+    ref: Optional[Ref] = None
+    strategy: Optional[Strategy] = None
+    edges: Optional[List[Edge]] = None
+    type: Optional[str] = None
+
+
+class TestMergePatch(unittest.TestCase):
+    """Test cases for merge_patch."""
+
+    def test_only_set_fields_are_included(self):
+        update = UpdateRequest(description="new", edges=[Edge(**{"from": "a", "to": "b"})])
+
+        self.assertEqual(merge_patch(update), {
+            "description": "new",
+            "edges": [{"from": "a", "to": "b"}],
+        })
+
+    def test_enums_are_sent_as_values(self):
+        self.assertEqual(merge_patch(UpdateRequest(strategy=Strategy.SEQUENTIAL)), {"strategy": "sequential"})
+
+    def test_exclude(self):
+        update = UpdateRequest(description="new", type="direct")
+
+        self.assertEqual(merge_patch(update, exclude=["type"]), {"description": "new"})
+
+    def test_empty_update(self):
+        self.assertEqual(merge_patch(UpdateRequest()), {})
+
+    def test_replace_sends_unset_fields_as_none(self):
+        update = UpdateRequest(ref=Ref(name="m2"))
+
+        self.assertEqual(merge_patch(update), {"ref": {"name": "m2"}})
+        self.assertEqual(merge_patch(update, replace=["ref"]), {"ref": {"name": "m2", "namespace": None}})
+        self.assertEqual(merge_patch(UpdateRequest(), replace=["ref"]), {})
+
+
+class TestDiffPatch(unittest.TestCase):
+    """Test cases for diff_patch."""
+
+    def test_removed_keys_are_nulled(self):
+        current = {"openai": {"apiKey": {"valueFrom": {"secretKeyRef": {"name": "s"}}}, "baseUrl": {"value": "u"}}}
+        desired = {"openai": {"apiKey": {"value": "k"}}}
+
+        self.assertEqual(diff_patch(current, desired), {
+            "openai": {"apiKey": {"valueFrom": None, "value": "k"}, "baseUrl": None},
+        })
+
+    def test_unchanged_values_are_left_out(self):
+        current = {"a": 1, "b": {"c": [1, 2]}}
+
+        self.assertEqual(diff_patch(current, {"a": 1, "b": {"c": [1, 2]}}), {})
+        self.assertEqual(diff_patch(current, {"a": 1, "b": {"c": [3]}}), {"b": {"c": [3]}})
+
+
+class TestApplyBody(unittest.TestCase):
+    """Test cases for apply_body."""
+
+    def test_partial_object(self):
+        body = apply_body("ark.mckinsey.com/v1alpha1", "Agent", "helper", {"spec": {"prompt": "hi"}})
+
+        self.assertEqual(body, {
+            "apiVersion": "ark.mckinsey.com/v1alpha1",
+            "kind": "Agent",
+            "metadata": {"name": "helper"},
+            "spec": {"prompt": "hi"},
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
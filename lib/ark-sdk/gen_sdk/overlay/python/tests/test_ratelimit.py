@@ -0,0 +1,146 @@
+"""Tests for the client-side rate limiter and retry policy."""
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+import urllib3
+from kubernetes_asyncio.client.rest import ApiException
+
+from ark_sdk import ratelimit
+from ark_sdk.ratelimit import RetryPolicy, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_qps(self):
+        clock = FakeClock()
+        bucket = TokenBucket(qps=10, burst=2, clock=clock)
+
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1)
+        self.assertAlmostEqual(bucket.reserve(), 0.2)
+
+        clock.now = 1.0
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.throttled, 2)
+        self.assertAlmostEqual(bucket.wait_seconds_total, 0.3)
+        self.assertAlmostEqual(bucket.wait_seconds_max, 0.2)
+
+    def test_zero_qps_disables_limiting(self):
+        bucket = TokenBucket(qps=0, burst=1)
+        self.assertEqual([bucket.reserve() for _ in range(5)], [0.0] * 5)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test cases for RetryPolicy."""
+
+    def test_retryable_statuses_and_methods(self):
+        policy = RetryPolicy(max_retries=3, initial_backoff=0.2, max_backoff=10)
+
+        self.assertIsNotNone(policy.delay(0, "POST", 429, None))
+        self.assertIsNotNone(policy.delay(0, "GET", 503, None))
+        self.assertIsNotNone(policy.delay(0, "GET", None, None))
+        self.assertIsNone(policy.delay(0, "POST", 500, None))
+        self.assertIsNone(policy.delay(0, "POST", None, None))
+        self.assertIsNone(policy.delay(0, "GET", 404, None))
+        self.assertIsNone(policy.delay(3, "GET", 503, None))
+
+    def test_backoff_grows_with_jitter_and_honors_retry_after(self):
+        policy = RetryPolicy(max_retries=5, initial_backoff=1, max_backoff=4)
+
+        self.assertTrue(0.5 <= policy.delay(0, "GET", 503, None) <= 1)
+        self.assertTrue(2 <= policy.delay(2, "GET", 503, None) <= 4)
+        self.assertTrue(2 <= policy.delay(4, "GET", 503, None) <= 4)
+        self.assertEqual(policy.delay(0, "GET", 429, "3"), 3)
+        self.assertEqual(policy.delay(0, "GET", 429, "60"), 4)
+
+
+class TestInstall(unittest.IsolatedAsyncioTestCase):
+    """Test cases for wrapping API client requests."""
+
+    def setUp(self):
+        for target, value in (
+            ('ark_sdk.ratelimit._limiter', TokenBucket(qps=0, burst=1)),
+            ('ark_sdk.ratelimit._retry_policy', RetryPolicy(max_retries=2)),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @patch('ark_sdk.ratelimit.time.sleep')
+    def test_sync_retries_throttled_response(self, mock_sleep):
+        throttled = Mock(status=429)
+        throttled.getheader.return_value = "1"
+        ok = Mock(status=200)
+        api_client = Mock()
+        api_client.rest_client.request = Mock(side_effect=[throttled, ok])
+
+        ratelimit.install(api_client)
+        result = api_client.rest_client.request("GET", "https://k8s/apis")
+
+        self.assertIs(result, ok)
+        throttled.read.assert_called_once()
+        mock_sleep.assert_called_once_with(1.0)
+        self.assertEqual(ratelimit.get_metrics()["retries"], 1)
+
+    @patch('ark_sdk.ratelimit.time.sleep')
+    def test_sync_connection_errors_give_up_after_max_retries(self, mock_sleep):
+        api_client = Mock()
+        api_client.rest_client.request = Mock(side_effect=urllib3.exceptions.ProtocolError("reset"))
+
+        ratelimit.install(api_client)
+        with self.assertRaises(urllib3.exceptions.ProtocolError):
+            api_client.rest_client.request("GET", "https://k8s/apis")
+
+        self.assertEqual(api_client.rest_client.request.__wrapped__.call_count, 3)
+
+    @patch('ark_sdk.ratelimit.asyncio.sleep', new_callable=AsyncMock)
+    async def test_async_retries_api_exceptions(self, mock_sleep):
+        error = ApiException(status=503, reason="Unavailable")
+        api_client = Mock()
+        api_client.rest_client.request = AsyncMock(side_effect=[error, aiohttp.ClientConnectionError(), "ok"])
+
+        ratelimit.install(api_client)
+        result = await api_client.rest_client.request("GET", "https://k8s/apis")
+
+        self.assertEqual(result, "ok")
+        self.assertEqual(mock_sleep.await_count, 2)
+
+    @patch('ark_sdk.ratelimit.asyncio.sleep', new_callable=AsyncMock)
+    async def test_async_retries_unread_throttled_response(self, mock_sleep):
+        throttled = Mock(status=429, headers={"Retry-After": "2"}, spec=["status", "headers", "release"])
+        ok = Mock(status=200)
+        api_client = Mock()
+        api_client.rest_client.request = AsyncMock(side_effect=[throttled, ok])
+
+        ratelimit.install(api_client)
+        result = await api_client.rest_client.request("GET", "https://k8s/apis", _preload_content=False)
+
+        self.assertIs(result, ok)
+        throttled.release.assert_called_once()
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    @patch('ark_sdk.ratelimit.asyncio.sleep', new_callable=AsyncMock)
+    async def test_async_does_not_retry_non_idempotent_errors(self, mock_sleep):
+        api_client = Mock()
+        api_client.rest_client.request = AsyncMock(side_effect=ApiException(status=500))
+
+        ratelimit.install(api_client)
+        with self.assertRaises(ApiException):
+            await api_client.rest_client.request("POST", "https://k8s/apis")
+
+        mock_sleep.assert_not_awaited()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ import base64
 from unittest.mock import Mock, AsyncMock, patch
 from kubernetes_asyncio.client.rest import ApiException
 
-from ark_sdk.k8s import SecretClient
+from ark_sdk.k8s import PARTIAL_METADATA_ACCEPT, TABLE_ACCEPT, SecretClient, list_table
 
 
 class TestSecretClient(unittest.IsolatedAsyncioTestCase):
@@ -15,32 +15,23 @@ class TestSecretClient(unittest.IsolatedAsyncioTestCase):
         self.client = SecretClient(namespace="test-namespace")
 
     @patch('ark_sdk.k8s.ApiClient')
-    @patch('ark_sdk.k8s.client.CoreV1Api')
-    async def test_list_secrets_success(self, mock_v1_api, mock_api_client):
+    async def test_list_secrets_success(self, mock_api_client):
         """Test successful secret listing - adapted from ark-api test."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
-        # Mock secret objects (same as original ark-api test)
-        mock_secret1 = Mock()
-        mock_secret1.metadata.name = "my-secret"
-        mock_secret1.metadata.uid = "uuid-1234-5678"
-        mock_secret1.metadata.annotations = {}
-        
-        mock_secret2 = Mock()
-        mock_secret2.metadata.name = "app-config"
-        mock_secret2.metadata.uid = "uuid-abcd-efgh"
-        mock_secret2.metadata.annotations = {}
-        
-        # Mock the API response
-        mock_api_instance = mock_v1_api.return_value
-        mock_response = Mock()
-        mock_response.items = [mock_secret1, mock_secret2]
-        mock_api_instance.list_namespaced_secret = AsyncMock(return_value=mock_response)
+        # Mock the PartialObjectMetadataList response
+        mock_api_client_instance.call_api = AsyncMock(return_value={
+            "kind": "PartialObjectMetadataList",
+            "items": [
+                {"metadata": {"name": "my-secret", "uid": "uuid-1234-5678"}},
+                {"metadata": {"name": "app-config", "uid": "uuid-abcd-efgh", "annotations": {"a": "b"}}},
+            ]
+        })
         
         # Test the method (adapted from API call to direct method call)
-        result = await self.client.list_secrets()
+        result = await self.client.list_secrets(label_selector="app=test")
         
         # Assert response (same assertions as original)
         self.assertEqual(result["count"], 2)
@@ -49,30 +40,28 @@ class TestSecretClient(unittest.IsolatedAsyncioTestCase):
         # Check first secret
         self.assertEqual(result["items"][0]["name"], "my-secret")
         self.assertEqual(result["items"][0]["id"], "uuid-1234-5678")
+        self.assertEqual(result["items"][0]["annotations"], {})
         
         # Check second secret
         self.assertEqual(result["items"][1]["name"], "app-config")
         self.assertEqual(result["items"][1]["id"], "uuid-abcd-efgh")
+        self.assertEqual(result["items"][1]["annotations"], {"a": "b"})
         
-        # Verify namespace parameter was passed correctly
-        mock_api_instance.list_namespaced_secret.assert_called_once_with(
-            namespace="test-namespace",
-            label_selector=None
-        )
+        # Verify only metadata was requested, in the right namespace
+        args, kwargs = mock_api_client_instance.call_api.call_args
+        self.assertEqual(args, ("/api/v1/namespaces/test-namespace/secrets", "GET"))
+        self.assertEqual(kwargs["query_params"], [("labelSelector", "app=test")])
+        self.assertEqual(kwargs["header_params"]["Accept"], PARTIAL_METADATA_ACCEPT)
 
     @patch('ark_sdk.k8s.ApiClient')
-    @patch('ark_sdk.k8s.client.CoreV1Api')
-    async def test_list_secrets_empty(self, mock_v1_api, mock_api_client):
+    async def test_list_secrets_empty(self, mock_api_client):
         """Test listing secrets when none exist - adapted from ark-api test."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
         # Mock empty response
-        mock_api_instance = mock_v1_api.return_value
-        mock_response = Mock()
-        mock_response.items = []
-        mock_api_instance.list_namespaced_secret = AsyncMock(return_value=mock_response)
+        mock_api_client_instance.call_api = AsyncMock(return_value={"items": []})
         
         # Test the method
         result = await self.client.list_secrets()
@@ -82,16 +71,14 @@ class TestSecretClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result["items"], [])
 
     @patch('ark_sdk.k8s.ApiClient')
-    @patch('ark_sdk.k8s.client.CoreV1Api')
-    async def test_list_secrets_kubernetes_api_error(self, mock_v1_api, mock_api_client):
+    async def test_list_secrets_kubernetes_api_error(self, mock_api_client):
         """Test handling of Kubernetes API errors - adapted from ark-api test."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
         # Mock API exception for namespace not found
-        mock_api_instance = mock_v1_api.return_value
-        mock_api_instance.list_namespaced_secret = AsyncMock(side_effect=ApiException(
+        mock_api_client_instance.call_api = AsyncMock(side_effect=ApiException(
             status=404,
             reason="Not Found"
         ))
@@ -101,16 +88,14 @@ class TestSecretClient(unittest.IsolatedAsyncioTestCase):
             await self.client.list_secrets()
 
     @patch('ark_sdk.k8s.ApiClient')
-    @patch('ark_sdk.k8s.client.CoreV1Api')
-    async def test_list_secrets_forbidden_error(self, mock_v1_api, mock_api_client):
+    async def test_list_secrets_forbidden_error(self, mock_api_client):
         """Test handling of forbidden access errors - adapted from ark-api test."""
         # Setup async context manager mock
         mock_api_client_instance = AsyncMock()
         mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
         
         # Mock API exception for forbidden access
-        mock_api_instance = mock_v1_api.return_value
-        mock_api_instance.list_namespaced_secret = AsyncMock(side_effect=ApiException(
+        mock_api_client_instance.call_api = AsyncMock(side_effect=ApiException(
             status=403,
             reason="Forbidden"
         ))
@@ -119,6 +104,20 @@ class TestSecretClient(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(ApiException):
             await self.client.list_secrets()
 
+    async def test_list_table_maps_columns(self):
+        """Test Table rows are returned as column name to cell dictionaries."""
+        api_client = AsyncMock()
+        api_client.call_api = AsyncMock(return_value={
+            "kind": "Table",
+            "columnDefinitions": [{"name": "Name"}, {"name": "Phase"}],
+            "rows": [{"cells": ["q1", "done"]}, {"cells": ["q2", "running"]}]
+        })
+
+        rows = await list_table(api_client, "/apis/ark.mckinsey.com/v1alpha1/namespaces/default/queries")
+
+        self.assertEqual(rows, [{"Name": "q1", "Phase": "done"}, {"Name": "q2", "Phase": "running"}])
+        self.assertEqual(api_client.call_api.call_args.kwargs["header_params"]["Accept"], TABLE_ACCEPT)
+
     @patch('ark_sdk.k8s.ApiClient')
     @patch('ark_sdk.k8s.client.CoreV1Api')
     async def test_get_secret_success(self, mock_v1_api, mock_api_client):
@@ -1,9 +1,14 @@
 """Tests for token validator."""
+import asyncio
+import time
 import unittest
 from unittest.mock import patch, Mock, AsyncMock, MagicMock
-from jose import jwt
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt, jwk
 from jose.exceptions import JWTError, ExpiredSignatureError, JWTClaimsError
-from ark_sdk.auth.validator import TokenValidator
+from ark_sdk.auth.validator import TokenValidator, JWKSCache, VerifiedTokenCache
 from ark_sdk.auth.config import AuthConfig
 from ark_sdk.auth.exceptions import (
     TokenValidationError,
@@ -13,7 +18,16 @@ from ark_sdk.auth.exceptions import (
 )
 
 
-class TestTokenValidator(unittest.TestCase):
+def mock_jwks_client(handler):
+    """Patch httpx.AsyncClient in the validator to answer with `handler`."""
+    real_client = httpx.AsyncClient
+    return patch(
+        'ark_sdk.auth.validator.httpx.AsyncClient',
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+
+
+class TestTokenValidator(unittest.IsolatedAsyncioTestCase):
     """Test cases for TokenValidator class."""
 
     def setUp(self):
@@ -29,60 +43,48 @@ class TestTokenValidator(unittest.TestCase):
     def test_init(self):
         """Test TokenValidator initialization."""
         self.assertEqual(self.validator.config, self.config)
-        self.assertIsNone(self.validator._jwks_cache)
+        # Caches are shared by validators created per request
+        self.assertIs(self.validator._jwks_cache, TokenValidator(self.config)._jwks_cache)
+        self.assertIs(self.validator._token_cache, TokenValidator(self.config)._token_cache)
 
-    @patch('ark_sdk.auth.validator.requests.get')
-    def test_fetch_jwks_success(self, mock_get):
+    async def test_fetch_jwks_success(self):
         """Test successful JWKS fetching."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"keys": [{"kid": "test-key-id", "kty": "RSA"}]}
-        mock_get.return_value = mock_response
-        
-        result = self.validator._fetch_jwks()
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, json={"keys": [{"kid": "test-key-id", "kty": "RSA"}]})
+
+        with mock_jwks_client(handler):
+            result = await self.validator._fetch_jwks()
         
         self.assertEqual(result, {"keys": [{"kid": "test-key-id", "kty": "RSA"}]})
-        mock_get.assert_called_once_with(self.config.jwks_url, timeout=10)
+        self.assertEqual(requested, [self.config.jwks_url])
 
-    def test_fetch_jwks_no_url(self):
+    async def test_fetch_jwks_no_url(self):
         """Test JWKS fetching with no URL configured."""
         config = AuthConfig(jwks_url=None)
         validator = TokenValidator(config)
         
         with self.assertRaises(TokenValidationError) as context:
-            validator._fetch_jwks()
+            await validator._fetch_jwks()
         
         self.assertIn("JWKS URL not configured", str(context.exception))
 
-    @patch('ark_sdk.auth.validator.requests.get')
-    def test_get_jwks_caching(self, mock_get):
-        """Test that JWKS is cached after first fetch."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"keys": [{"kid": "test-key-id"}]}
-        mock_get.return_value = mock_response
-        
-        # First call
-        result1 = self.validator._get_jwks()
-        # Second call
-        result2 = self.validator._get_jwks()
-        
-        self.assertEqual(result1, result2)
-        # Should only be called once due to caching
-        mock_get.assert_called_once()
-
-    @patch('ark_sdk.auth.validator.requests.get')
-    def test_fetch_jwks_exception(self, mock_get):
+    async def test_fetch_jwks_exception(self):
         """Test JWKS fetching with exception."""
-        import requests
-        mock_get.side_effect = requests.RequestException("Network error")
-        
-        with self.assertRaises(TokenValidationError) as context:
-            self.validator._fetch_jwks()
+        def handler(request):
+            raise httpx.ConnectError("Network error")
+
+        with mock_jwks_client(handler):
+            with self.assertRaises(TokenValidationError) as context:
+                await self.validator._fetch_jwks()
         
         self.assertIn("Failed to fetch JWKS", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_success(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_success(self, mock_get_signing_key, mock_decode):
         """Test successful token validation."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
@@ -91,7 +93,7 @@ class TestTokenValidator(unittest.TestCase):
         mock_decode.return_value = mock_payload
         
         # Test
-        result = self.validator.validate_token("test-token")
+        result = await self.validator.validate_token("test-token")
         
         # Verify
         self.assertEqual(result, mock_payload)
@@ -112,7 +114,7 @@ class TestTokenValidator(unittest.TestCase):
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_fallback_to_jwt_config(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_fallback_to_jwt_config(self, mock_get_signing_key, mock_decode):
         """Test token validation falls back to JWT config when OKTA is not set."""
         # Setup config without audience/issuer values
         config = AuthConfig(
@@ -130,7 +132,7 @@ class TestTokenValidator(unittest.TestCase):
         mock_decode.return_value = mock_payload
         
         # Test
-        result = validator.validate_token("test-token")
+        result = await validator.validate_token("test-token")
         
         # Verify JWT values are used as fallback
         mock_decode.assert_called_once_with(
@@ -149,7 +151,7 @@ class TestTokenValidator(unittest.TestCase):
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_no_audience_issuer(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_no_audience_issuer(self, mock_get_signing_key, mock_decode):
         """Test token validation when no audience/issuer is configured."""
         # Setup config without audience/issuer
         config = AuthConfig(
@@ -167,7 +169,7 @@ class TestTokenValidator(unittest.TestCase):
         mock_decode.return_value = mock_payload
         
         # Test
-        result = validator.validate_token("test-token")
+        result = await validator.validate_token("test-token")
         
         # Verify audience/issuer verification is disabled
         mock_decode.assert_called_once_with(
@@ -185,7 +187,7 @@ class TestTokenValidator(unittest.TestCase):
         )
 
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_no_jwks_url(self, mock_get_signing_key):
+    async def test_validate_token_no_jwks_url(self, mock_get_signing_key):
         """Test token validation with no JWKS URL configured."""
         config = AuthConfig(jwks_url=None)
         validator = TokenValidator(config)
@@ -193,80 +195,80 @@ class TestTokenValidator(unittest.TestCase):
         mock_get_signing_key.side_effect = TokenValidationError("JWKS URL not configured")
         
         with self.assertRaises(TokenValidationError) as context:
-            validator.validate_token("test-token")
+            await validator.validate_token("test-token")
         
         self.assertIn("JWKS URL not configured", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_expired_signature(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_expired_signature(self, mock_get_signing_key, mock_decode):
         """Test token validation with expired signature."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
         mock_decode.side_effect = ExpiredSignatureError("Token has expired")
         
         with self.assertRaises(ExpiredTokenError) as context:
-            self.validator.validate_token("expired-token")
+            await self.validator.validate_token("expired-token")
         
         self.assertIn("Token has expired", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_invalid_token(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_invalid_token(self, mock_get_signing_key, mock_decode):
         """Test token validation with invalid token."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
         mock_decode.side_effect = JWTError("Invalid token")
         
         with self.assertRaises(InvalidTokenError) as context:
-            self.validator.validate_token("invalid-token")
+            await self.validator.validate_token("invalid-token")
         
         self.assertIn("Invalid token", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_decode_error(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_decode_error(self, mock_get_signing_key, mock_decode):
         """Test token validation with JWT claims error."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
         mock_decode.side_effect = JWTClaimsError("Invalid claims")
         
         with self.assertRaises(InvalidTokenError) as context:
-            self.validator.validate_token("malformed-token")
+            await self.validator.validate_token("malformed-token")
         
         self.assertIn("Invalid token claims", str(context.exception))
 
     @patch('ark_sdk.auth.validator.jwt.decode')
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_general_exception(self, mock_get_signing_key, mock_decode):
+    async def test_validate_token_general_exception(self, mock_get_signing_key, mock_decode):
         """Test token validation with general exception."""
         # Setup mocks
         mock_get_signing_key.return_value = "test-key"
         mock_decode.side_effect = Exception("Unexpected error")
         
         with self.assertRaises(TokenValidationError) as context:
-            self.validator.validate_token("bad-token")
+            await self.validator.validate_token("bad-token")
         
         self.assertIn("Token validation failed", str(context.exception))
 
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_jwks_exception(self, mock_get_signing_key):
+    async def test_validate_token_jwks_exception(self, mock_get_signing_key):
         """Test token validation when JWKS fetching raises exception."""
         mock_get_signing_key.side_effect = TokenValidationError("Failed to fetch JWKS")
         
         with self.assertRaises(TokenValidationError) as context:
-            self.validator.validate_token("test-token")
+            await self.validator.validate_token("test-token")
         
         self.assertIn("Failed to fetch JWKS", str(context.exception))
 
     @patch.object(TokenValidator, '_get_signing_key')
-    def test_validate_token_signing_key_exception(self, mock_get_signing_key):
+    async def test_validate_token_signing_key_exception(self, mock_get_signing_key):
         """Test token validation when getting signing key raises exception."""
         # Setup mocks
         mock_get_signing_key.side_effect = TokenValidationError("Unable to find key")
         
         with self.assertRaises(TokenValidationError) as context:
-            self.validator.validate_token("test-token")
+            await self.validator.validate_token("test-token")
         
         self.assertIn("Unable to find key", str(context.exception))
 
@@ -278,5 +280,124 @@ class TestTokenValidator(unittest.TestCase):
         self.assertEqual(self.config.jwks_url, "https://test.okta.com/.well-known/jwks.json")
 
 
+
+def make_signing_key(kid):
+    """RSA private key PEM and the matching public JWK."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_jwk = jwk.construct(pem, "RS256").public_key().to_dict()
+    public_jwk["kid"] = kid
+    return pem, public_jwk
+
+
+class TestTokenCaching(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the JWKS and verified-token caches."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pem1, cls.jwk1 = make_signing_key("key-1")
+        cls.pem2, cls.jwk2 = make_signing_key("key-2")
+
+    def setUp(self):
+        self.config = AuthConfig(
+            jwt_algorithm="RS256",
+            issuer="https://issuer.example.com",
+            audience="ark",
+            jwks_url="https://issuer.example.com/certs"
+        )
+        self.now = 0.0
+        self.jwks = {"keys": [self.jwk1]}
+        self.fetch_count = 0
+        self.jwks_cache = JWKSCache(ttl=3600, min_refresh_interval=30, clock=lambda: self.now)
+        self.validator = TokenValidator(self.config, jwks_cache=self.jwks_cache, token_cache=VerifiedTokenCache())
+
+        def handler(request):
+            self.fetch_count += 1
+            return httpx.Response(200, json=self.jwks)
+
+        patcher = mock_jwks_client(handler)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def token(self, pem, kid, **claims):
+        claims = {"sub": "user", "iss": self.config.issuer, "aud": "ark", "exp": int(time.time()) + 300, **claims}
+        return jwt.encode(claims, pem, algorithm="RS256", headers={"kid": kid})
+
+    async def test_jwks_fetched_once_across_validators(self):
+        """Test validators share one JWKS fetch."""
+        for i in range(3):
+            validator = TokenValidator(self.config, jwks_cache=self.jwks_cache, token_cache=VerifiedTokenCache())
+            payload = await validator.validate_token(self.token(self.pem1, "key-1", sub=f"user-{i}"))
+            self.assertEqual(payload["sub"], f"user-{i}")
+
+        self.assertEqual(self.fetch_count, 1)
+
+    async def test_concurrent_refresh_is_single_flight(self):
+        """Test concurrent validations with a cold cache share one fetch."""
+        tokens = [self.token(self.pem1, "key-1", sub=f"user-{i}") for i in range(5)]
+
+        await asyncio.gather(*(self.validator.validate_token(t) for t in tokens))
+
+        self.assertEqual(self.fetch_count, 1)
+
+    async def test_unknown_kid_refetches_rate_limited(self):
+        """Test a rotated key is picked up, but unknown kids cannot force a fetch per call."""
+        await self.validator.validate_token(self.token(self.pem1, "key-1"))
+
+        # Rotation within the refresh interval is not fetched yet
+        self.jwks = {"keys": [self.jwk1, self.jwk2]}
+        with self.assertRaises(TokenValidationError):
+            await self.validator.validate_token(self.token(self.pem2, "key-2"))
+        self.assertEqual(self.fetch_count, 1)
+
+        self.now = 31
+        payload = await self.validator.validate_token(self.token(self.pem2, "key-2"))
+        self.assertEqual(payload["sub"], "user")
+        self.assertEqual(self.fetch_count, 2)
+
+    async def test_jwks_refreshed_after_ttl_and_stale_keys_survive_errors(self):
+        """Test JWKS expire after the TTL and failed refreshes keep the cached keys."""
+        await self.validator.validate_token(self.token(self.pem1, "key-1", sub="a"))
+
+        self.now = 3601
+        await self.validator.validate_token(self.token(self.pem1, "key-1", sub="b"))
+        self.assertEqual(self.fetch_count, 2)
+
+        self.now = 7300
+        with patch.object(TokenValidator, '_fetch_jwks', AsyncMock(side_effect=TokenValidationError("down"))):
+            payload = await self.validator.validate_token(self.token(self.pem1, "key-1", sub="c"))
+        self.assertEqual(payload["sub"], "c")
+
+    @patch('ark_sdk.auth.validator.jwt.decode', wraps=jwt.decode)
+    async def test_verified_tokens_skip_signature_check(self, mock_decode):
+        """Test a validated token is served from the cache until it expires."""
+        token = self.token(self.pem1, "key-1")
+
+        first = await self.validator.validate_token(token)
+        second = await self.validator.validate_token(token)
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_decode.call_count, 1)
+
+    def test_verified_token_cache_bounds(self):
+        """Test entries expire at exp and the LRU evicts the oldest entry."""
+        now = [1000.0]
+        cache = VerifiedTokenCache(maxsize=2, clock=lambda: now[0])
+
+        cache.put("a", {"sub": "a", "exp": 1010})
+        cache.put("b", {"sub": "b", "exp": 2000})
+        cache.put("no-exp", {"sub": "c"})
+        self.assertEqual(cache.get("a"), {"sub": "a", "exp": 1010})
+        cache.put("c", {"sub": "c", "exp": 2000})
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNone(cache.get("no-exp"))
+        now[0] = 1010
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
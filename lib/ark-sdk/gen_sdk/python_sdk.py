@@ -45,21 +45,23 @@ def generate_versioned_client(api_version: str, resources: List[Dict[str, Any]])
     
     imports_str = '\n'.join(sorted(imports))
     
-    # Generate resource client initializations
-    resource_inits = []
+    # Generate lazily created resource client properties
+    resource_props = []
     for resource in resources:
         kind = resource['kind']
         attr_name = resource['plural']
-        resource_init = f'''        self.{attr_name} = ARKResourceClient(
+        resource_prop = f'''    @functools.cached_property
+    def {attr_name}(self) -> ARKResourceClient[{to_class(kind)}]:
+        return ARKResourceClient(
             api_version="{resource['api_version']}",
             kind="{resource['kind']}",
             plural="{resource['plural']}",
-            model_class={to_class(kind)},
-            namespace=namespace
+            model_class=self._model_class({to_class(kind)}),
+            namespace=self.namespace
         )'''
-        resource_inits.append(resource_init)
+        resource_props.append(resource_prop)
     
-    resource_inits_str = '\n\n'.join(resource_inits)
+    resource_props_str = '\n\n'.join(resource_props)
     
     # Generate class
     return f'''
@@ -68,13 +70,13 @@ def generate_versioned_client(api_version: str, resources: List[Dict[str, Any]])
 
 
 class {class_name}(_ARKClient):
-    """ARK client for API version {api_version}"""
+    """ARK client for API version {api_version}
+
+    Resource clients are created on first access and share one connection pool.
+    """
+
+{resource_props_str}
 
-    def __init__(self, namespace: Optional[str] = None):
-        super().__init__(namespace)
-        
-{resource_inits_str}
-        
 {generate_secret_client_addition()}
 '''
 
@@ -98,6 +100,8 @@ def generate_yaml_routing(resources: List[Dict[str, Any]]) -> str:
 
 def generate_secret_client_addition() -> str:
     """Generate secret client addition for versioned clients."""
-    return '''        # Add secret client
+    return '''    @functools.cached_property
+    def secrets(self):
+        # Add secret client
         from .k8s import SecretClient
-        self.secrets = SecretClient(namespace)'''
+        return SecretClient(self.namespace)'''
@@ -69,7 +69,33 @@ class Test{class_name}(BaseTestCase):
         client = {class_name}(namespace="custom-namespace")
         
         # Verify all resource clients have the same namespace
-{chr(10).join([f'        self.assertEqual(client.{r["plural"]}.namespace, "custom-namespace")' for r in resources])}'''
+{chr(10).join([f'        self.assertEqual(client.{r["plural"]}.namespace, "custom-namespace")' for r in resources])}
+    
+    def test_resource_clients_are_lazy(self):
+        """Test resource clients are created on first access and then reused"""
+        client = {class_name}(namespace="test-namespace")
+        
+        # Nothing is constructed until a resource attribute is accessed
+        self.assertNotIn("{resources[0]['plural']}", vars(client))
+        first = client.{resources[0]['plural']}
+        self.assertIs(client.{resources[0]['plural']}, first)
+        
+        # All resource clients share one API client and connection pool
+{chr(10).join([f'        self.assertIs(client.{r["plural"]}.api_client, first.api_client)' for r in resources[1:]])}
+    
+    @unittest.skipIf(msgspec is None, "msgspec not installed")
+    def test_structs_select_struct_models(self):
+        """Test structs=True swaps every pydantic model for its generated struct"""
+        client = {class_name}(namespace="test-namespace", structs=True)
+        pydantic_client = {class_name}(namespace="test-namespace")
+        data = {{'metadata': {{'name': 'test-resource'}}, 'status': {{}}}}
+        
+        for plural in {[r['plural'] for r in resources]!r}:
+            resource_client = getattr(client, plural)
+            self.assertTrue(resource_client.uses_structs)
+            self.assertEqual(resource_client.model_class.__module__, "ark_sdk.structs")
+            self.assertEqual(resource_client.model_class.__name__, getattr(pydantic_client, plural).model_class.__name__)
+            self.assertEqual(resource_client._dict_to_model(data).to_dict(), data)'''
 
 
 def generate_test_footer() -> str:
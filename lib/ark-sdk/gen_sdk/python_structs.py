@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Python Struct Model Generation Module
+
+This module generates compact msgspec.Struct models from the OpenAPI schemas, as a
+lighter alternative to the pydantic models produced by OpenAPI Generator. Class and
+attribute names follow the pydantic models (e.g. QueryV1alpha1Spec.conversation_id).
+"""
+
+import json
+import keyword
+from typing import Dict, List, Any, Optional, Tuple
+
+from gen_sdk.python_sdk import to_snake_case
+
+SCALAR_TYPES = {
+    'string': 'str',
+    'integer': 'int',
+    'number': 'float',
+    'boolean': 'bool',
+}
+
+STRUCTS_HEADER = '''#!/usr/bin/env python3
+"""
+Generated ARK msgspec models
+
+Compact counterparts of the pydantic models in ark_sdk.models, decoded directly
+from JSON by msgspec. Requires msgspec (pip install ark-sdk[structs]); select them
+per client with ARKClientV1alpha1(structs=True).
+Auto-generated from OpenAPI schema - do not edit manually.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import msgspec
+
+
+class ArkStruct(msgspec.Struct, kw_only=True, omit_defaults=True, gc=False):
+    """Base class of the generated models.
+
+    Decoded resources never contain reference cycles, so instances are not
+    tracked by the garbage collector.
+    """
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON-compatible dictionary for this model"""
+        return msgspec.to_builtins(self)
+'''
+
+
+def to_class_part(name: str) -> str:
+    """Convert a schema or property name to a class name part (Query_v1alpha1 -> QueryV1alpha1)"""
+    return ''.join(part[:1].upper() + part[1:] for part in name.split('_') if part)
+
+
+def to_attribute(name: str) -> str:
+    """Python attribute for a JSON property, matching OpenAPI Generator's naming"""
+    attribute = to_snake_case(name)
+    if keyword.iskeyword(attribute):
+        return f"var_{attribute}"
+    return attribute
+
+
+class StructGenerator:
+    """Collects struct definitions for a set of schemas, reusing identical inline schemas"""
+
+    def __init__(self):
+        self.classes: List[str] = []
+        self.names_by_schema: Dict[str, str] = {}
+        self.used_names: Dict[str, int] = {}
+
+    def struct_for(self, class_name: str, schema: Dict[str, Any], docstring: Optional[str] = None) -> str:
+        """Define a struct for an object schema (nested structs first) and return its name"""
+        key = json.dumps(schema, sort_keys=True)
+        if key in self.names_by_schema:
+            return self.names_by_schema[key]
+        if class_name in self.used_names:
+            # Different schemas whose paths concatenate to the same name
+            self.used_names[class_name] += 1
+            class_name = f"{class_name}{self.used_names[class_name]}"
+        self.used_names[class_name] = 0
+        self.names_by_schema[key] = class_name
+
+        required = set(schema.get('required', []))
+        fields = [
+            self.field_definition(class_name, prop, prop_schema, prop in required)
+            for prop, prop_schema in schema['properties'].items()
+        ]
+        # Required fields first for readability; kw_only makes the order irrelevant to msgspec
+        fields.sort(key=lambda field: not field[0])
+
+        lines = [f"class {class_name}(ArkStruct):"]
+        if docstring:
+            lines.append(f'    """{docstring}"""')
+            lines.append('')
+        lines.extend(f"    {definition}" for _, definition in fields)
+        self.classes.append('\n'.join(lines))
+        return class_name
+
+    def field_definition(self, class_name: str, prop: str, schema: Dict[str, Any], required: bool) -> Tuple[bool, str]:
+        """Return (has_no_default, definition line) for one property"""
+        attribute = to_attribute(prop)
+        type_name = self.type_for(class_name + to_class_part(prop), schema)
+        field_args = []
+        if 'default' in schema:
+            field_args.append(self.default_argument(schema['default']))
+        elif not required:
+            if type_name != 'Any':
+                type_name = f"Optional[{type_name}]"
+            field_args.append("default=None")
+        if attribute != prop:
+            field_args.append(f'name="{prop}"')
+
+        if not field_args:
+            return True, f"{attribute}: {type_name}"
+        if len(field_args) == 1 and field_args[0].startswith("default="):
+            return False, f"{attribute}: {type_name} = {field_args[0][len('default='):]}"
+        has_no_default = not field_args[0].startswith("default")
+        return has_no_default, f"{attribute}: {type_name} = msgspec.field({', '.join(field_args)})"
+
+    def default_argument(self, value: Any) -> str:
+        """msgspec.field argument for a schema default (msgspec copies empty collections itself)"""
+        if isinstance(value, (list, dict)) and value:
+            return f"default_factory=lambda: {value!r}"
+        return f"default={value!r}"
+
+    def type_for(self, class_name: str, schema: Dict[str, Any]) -> str:
+        """Python type annotation for a property schema"""
+        if schema.get('x-kubernetes-int-or-string'):
+            return 'Union[int, str]'
+        schema_type = schema.get('type')
+        if schema_type == 'object':
+            if schema.get('properties'):
+                return self.struct_for(class_name, schema)
+            additional = schema.get('additionalProperties')
+            if isinstance(additional, dict):
+                return f"Dict[str, {self.type_for(class_name + 'Value', additional)}]"
+            return 'Dict[str, Any]'
+        if schema_type == 'array':
+            return f"List[{self.type_for(class_name + 'Inner', schema.get('items', {}))}]"
+        return SCALAR_TYPES.get(schema_type, 'Any')
+
+
+def generate_structs(openapi_spec: Dict[str, Any], versions: Dict[str, List[Dict[str, Any]]]) -> str:
+    """Generate the ark_sdk.structs module for all resources in the schema"""
+    generator = StructGenerator()
+    schemas = openapi_spec.get('components', {}).get('schemas', {})
+
+    for api_version, resources in sorted(versions.items()):
+        for resource in sorted(resources, key=lambda r: r['model_class']):
+            schema = schemas[resource['model_class']]
+            generator.struct_for(
+                to_class_part(resource['model_class']),
+                schema,
+                docstring=f"{resource['kind']} ({api_version})"
+            )
+
+    return STRUCTS_HEADER + ''.join(f"\n\n{definition}\n" for definition in generator.classes)
@@ -18,6 +18,7 @@ from gen_sdk.python_sdk import (
     generate_versioned_client,
     generate_yaml_routing
 )
+from gen_sdk.python_structs import generate_structs
 from gen_sdk.python_sdk_tests import (
     generate_test_base,
     generate_resource_client_tests,
@@ -32,6 +33,7 @@ def main():
     parser.add_argument('schema_path', help='Path to OpenAPI schema JSON file')
     parser.add_argument('-v', '--version', action='store_true', help='Generate version info to stdout')
     parser.add_argument('-t', '--test', action='store_true', help='Generate unittest tests for the generated clients')
+    parser.add_argument('-s', '--structs', action='store_true', help='Generate msgspec struct models to stdout')
     
     args = parser.parse_args()
     # Load OpenAPI schema
@@ -76,6 +78,11 @@ def main():
         print(generate_test_footer(), end='')
         print("\nTest generation complete!", file=sys.stderr)
         return
+    elif args.structs: # Handle -s flag - generate msgspec models
+        print("Generating struct models...", file=sys.stderr)
+        print(generate_structs(openapi_spec, versions), end='')
+        print("\nStruct generation complete!", file=sys.stderr)
+        return
     elif args.version: # Handle -v flag
 
         # Default behavior - generate clients
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Rewrite generated package __init__ files to import their names lazily (PEP 562)"""
+
+import re
+import argparse
+
+IMPORT_PATTERN = re.compile(r'^from ([\w.]+) import (\w+)(?: as (\w+))?\s*$')
+
+# Names exported from the package root that live in the overlay rather than
+# in the openapi-generator output
+OVERLAY_EXPORTS = {
+    "ARKClientV1alpha1": "ark_sdk.versions",
+    "ARKClientV1prealpha1": "ark_sdk.versions",
+    "Parameter": "ark_sdk.executor",
+    "Model": "ark_sdk.executor",
+    "AgentConfig": "ark_sdk.executor",
+    "ToolDefinition": "ark_sdk.executor",
+    "Message": "ark_sdk.executor",
+    "MessageDelta": "ark_sdk.executor",
+    "ExecutionEngineRequest": "ark_sdk.executor",
+    "ExecutionEngineResponse": "ark_sdk.executor",
+    "ExecutionEngineStreamEvent": "ark_sdk.executor",
+    "BaseExecutor": "ark_sdk.executor",
+    "ExecutorApp": "ark_sdk.executor_app",
+}
+
+LAZY_LOADER = '''
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+'''
+
+
+def split_imports(content):
+    """Split generated content into the header and its `from x import y` lines"""
+    header, imports = [], []
+    for line in content.splitlines():
+        match = IMPORT_PATTERN.match(line)
+        if match:
+            module, name, alias = match.groups()
+            imports.append((line, module, alias or name))
+        elif not imports:
+            header.append(line)
+        elif line.strip() and not line.startswith('#'):
+            raise ValueError(f"Unexpected statement after imports: {line}")
+    return header, imports
+
+
+def make_lazy(content, extra_exports=None):
+    """Replace eager imports with a _LAZY_IMPORTS table and a module __getattr__"""
+    header, imports = split_imports(content)
+    if not imports:
+        return content
+
+    lazy_imports = {name: module for _, module, name in imports}
+    for name, module in (extra_exports or {}).items():
+        lazy_imports.setdefault(name, module)
+
+    lines = '\n'.join(header).rstrip() + '\n\n'
+    lines += 'import importlib\nfrom typing import TYPE_CHECKING\n\n'
+    lines += '# Names are imported on first access so that importing the package does\n'
+    lines += '# not load every generated model\n'
+    lines += '_LAZY_IMPORTS = {\n'
+    lines += ''.join(f'    "{name}": "{module}",\n' for name, module in lazy_imports.items())
+    lines += '}\n\n'
+    lines += 'if TYPE_CHECKING:\n'
+    lines += ''.join(f'    {line.strip()}\n' for line, _, _ in imports)
+    lines += LAZY_LOADER
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Make generated __init__.py files import lazily')
+    parser.add_argument('init_file', help='Path to the generated package __init__.py')
+    parser.add_argument('--overlay-exports', action='store_true',
+                        help='Also export the ARK clients and execution engine types')
+
+    args = parser.parse_args()
+
+    with open(args.init_file, 'r') as f:
+        content = f.read()
+
+    updated = make_lazy(content, OVERLAY_EXPORTS if args.overlay_exports else None)
+
+    if updated != content:
+        with open(args.init_file, 'w') as f:
+            f.write(updated)
+        print(f"Successfully updated {args.init_file}")
+    else:
+        print("No changes needed")
+
+if __name__ == "__main__":
+    main()
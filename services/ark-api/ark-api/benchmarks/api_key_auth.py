@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Load test: requests/sec of Basic-auth (API key) requests through AuthMiddleware.
+
+50 concurrent clients, each with its own API key, send requests to a protected
+route for a fixed duration. Kubernetes is replaced by an in-memory Secret store
+with a simulated apiserver latency; bcrypt hashes use the default cost. Three
+configurations are compared:
+
+  inline bcrypt        bcrypt.checkpw on the event loop, no cache (previous behaviour)
+  bcrypt pool          bcrypt on the verification thread pool, no cache
+  bcrypt pool + cache  bcrypt on the pool, verified key pairs cached
+
+Usage (from services/ark-api/ark-api with the package installed):
+    python benchmarks/api_key_auth.py --clients 50 --duration 10
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import time
+from typing import List, Tuple
+from unittest.mock import patch
+
+os.environ["AUTH_MODE"] = "basic"
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from ark_api.auth.middleware import AuthMiddleware  # noqa: E402
+from ark_api.services import api_keys  # noqa: E402
+from ark_api.services.api_keys import APIKeyService, VerifiedAPIKeyCache, _credential_fingerprint  # noqa: E402
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def make_keys(service: APIKeyService, count: int) -> Tuple[List[Tuple[str, str]], dict]:
+    """Generate `count` key pairs and the API key data the fake Secret store returns for them"""
+    pairs, store = [], {}
+    for _ in range(count):
+        public_key, secret_key = service._generate_key_pair()
+        secret_key_hash = service._hash_secret_key(secret_key)
+        data = {
+            "public_key": base64.b64encode(public_key.encode()).decode(),
+            "secret_key_hash": base64.b64encode(secret_key_hash.encode()).decode(),
+            "is_active": base64.b64encode(b"true").decode(),
+        }
+        store[public_key] = ({
+            "id": public_key,
+            "name": "bench",
+            "public_key": public_key,
+            "secret_key_hash": secret_key_hash,
+            "is_active": True,
+            "expires_at": None,
+            "secret_name": service._secret_name_from_public_key(public_key),
+        }, _credential_fingerprint(data, {}), "1")
+        pairs.append((public_key, secret_key))
+    return pairs, store
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware)
+
+    @app.get("/v1/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def run(app: FastAPI, pairs: List[Tuple[str, str]], duration: float) -> Tuple[int, List[float], float]:
+    """Each client loops on GET /v1/ping until `duration` elapses; returns (requests, latencies ms, wall s)"""
+    latencies: List[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        deadline = time.perf_counter() + duration
+
+        async def client_loop(public_key: str, secret_key: str) -> None:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                response = await http.get("/v1/ping", auth=(public_key, secret_key))
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    raise RuntimeError(f"Unexpected status {response.status_code}: {response.text}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop(*pair) for pair in pairs))
+        wall = time.perf_counter() - start
+    return len(latencies), latencies, wall
+
+
+async def main(args: argparse.Namespace) -> None:
+    with patch.object(api_keys, "get_context", return_value={"namespace": "bench"}):
+        service = APIKeyService()
+        pairs, store = make_keys(service, args.clients)
+        app = build_app()
+
+    latency = args.latency_ms / 1000
+
+    async def read_api_key(self, public_key):
+        await asyncio.sleep(latency)
+        return store.get(public_key)
+
+    async def update_last_used(self, secret_name, used_at=None):
+        await asyncio.sleep(latency)
+
+    async def inline_bcrypt(func, *func_args):
+        return func(*func_args)
+
+    configurations = (
+        ("inline bcrypt", inline_bcrypt, 0.0),
+        ("bcrypt pool", api_keys._run_bcrypt, 0.0),
+        ("bcrypt pool + cache", api_keys._run_bcrypt, api_keys.API_KEY_CACHE_TTL_SECONDS),
+    )
+    with patch.object(api_keys, "get_context", return_value={"namespace": "bench"}), \
+            patch.object(APIKeyService, "_read_api_key", read_api_key), \
+            patch.object(APIKeyService, "_update_last_used", update_last_used):
+        for label, run_bcrypt, ttl in configurations:
+            cache = VerifiedAPIKeyCache(ttl=ttl, watch_changes=False)
+            with patch.object(api_keys, "_run_bcrypt", run_bcrypt), \
+                    patch.object(api_keys, "_verified_keys", cache):
+                count, samples, wall = await run(app, pairs, args.duration)
+            print(
+                f"{label:<20} {count / wall:9.1f} req/s  p50={percentile(samples, 50):8.1f}ms  "
+                f"p99={percentile(samples, 99):8.1f}ms  mean={statistics.mean(samples):8.1f}ms  "
+                f"cache hits={cache.hits} misses={cache.misses}"
+            )
+        await api_keys.close_last_used_recorder()
+    await api_keys.close_verified_key_cache()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50, help="Concurrent API-key clients, one key each")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per configuration")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated apiserver latency per request")
+    args = parser.parse_args()
+    asyncio.run(main(args))
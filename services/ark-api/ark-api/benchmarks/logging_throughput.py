@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: request throughput of ark-api with request logging on and off.
+
+Runs concurrent requests against a hello-world route behind RequestLoggingMiddleware
+(in process, via httpx's ASGI transport) with log output written to a file:
+
+  off                  INFO disabled, nothing is logged
+  sync handler         StreamHandler on the event loop (previous logging.basicConfig)
+  queue text           QueueHandler/QueueListener pipeline, text lines
+  queue json           the pipeline with JSON output
+  queue json 10%       JSON output with LOG_REQUEST_SAMPLING-style 10% sampling
+
+Usage (from services/ark-api/ark-api with the package installed):
+    python benchmarks/logging_throughput.py --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+import httpx
+from fastapi import FastAPI
+
+from ark_api.core import log_pipeline
+from ark_api.core.middleware import RequestLoggingMiddleware
+
+
+def build_app(sampling: str) -> RequestLoggingMiddleware:
+    app = FastAPI()
+
+    @app.get("/v1/hello")
+    async def hello():
+        return {"hello": "world"}
+
+    return RequestLoggingMiddleware(app, sampling=sampling, slow_request_seconds=60)
+
+
+async def throughput(app, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                (await http.get("/v1/hello?namespace=default", headers={"x-session-id": "bench"})).raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start)
+
+
+def configure(mode: str, stream) -> Optional[str]:
+    """Set up logging for `mode`; returns the sampling spec to use"""
+    root = logging.getLogger()
+    root.handlers = []
+    if mode == "off":
+        root.setLevel(logging.WARNING)
+        return ""
+    if mode == "sync handler":
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(log_pipeline.make_formatter("text"))
+        root.handlers = [handler]
+        root.setLevel(logging.INFO)
+        return ""
+    log_format = "text" if mode == "queue text" else "json"
+    log_pipeline.start_logging(logging.INFO, log_format, stream)
+    return "/v1=0.1" if mode.endswith("10%") else ""
+
+
+def main(args: argparse.Namespace) -> None:
+    # Measure the write path, not the per-call-site limit
+    log_pipeline.LOG_RATE_LIMIT_PER_SECOND = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("off", "sync handler", "queue text", "queue json", "queue json 10%"):
+            path = os.path.join(tmp, "log.txt")
+            with open(path, "w") as stream:
+                sampling = configure(mode, stream)
+                app = build_app(sampling)
+                asyncio.run(throughput(app, min(1000, args.requests), args.concurrency))  # warm up
+                rps = asyncio.run(throughput(app, args.requests, args.concurrency))
+                log_pipeline.stop_logging()
+            print(f"{mode:<16} {rps:9.1f} req/s  log={os.path.getsize(path) / 1e6:7.2f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    main(parser.parse_args())
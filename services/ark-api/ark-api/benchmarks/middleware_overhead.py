@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request overhead and SSE time-to-first-byte of the ark-api middleware.
+
+Serves a hello-world JSON route and an SSE route with uvicorn on a local port and
+measures them with three middleware stacks:
+
+  none                 the bare FastAPI application
+  BaseHTTPMiddleware   authentication and request logging as BaseHTTPMiddleware
+                       dispatch functions (the previous implementation)
+  ASGI                 AuthMiddleware and RequestLoggingMiddleware
+
+Authentication uses AUTH_MODE=basic with API key verification stubbed out, so only
+the middleware itself is measured.
+
+Usage (from services/ark-api/ark-api with the package installed):
+    python benchmarks/middleware_overhead.py --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import statistics
+import threading
+import time
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+os.environ["AUTH_MODE"] = "basic"
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import JSONResponse, StreamingResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from ark_api.auth.config import is_route_authenticated  # noqa: E402
+from ark_api.auth.middleware import AuthMiddleware  # noqa: E402
+from ark_api.core.middleware import RequestLoggingMiddleware  # noqa: E402
+from ark_api.services.api_keys import APIKeyService  # noqa: E402
+
+AUTH = ("pk-ark-bench", "sk-ark-bench")
+logger = logging.getLogger("ark-api")
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def legacy_auth(request: Request, call_next):
+    service: APIKeyService = request.app.state.api_key_service
+    if is_route_authenticated(request.url.path):
+        header = request.headers.get("Authorization")
+        if not header or not await service.verify_api_key(*AUTH):
+            return JSONResponse(status_code=401, content={"detail": "Authentication failed"})
+    return await call_next(request)
+
+
+async def legacy_logging(request: Request, call_next):
+    start_time = time.time()
+    session_id = request.headers.get("x-session-id")
+    session_info = f"session={session_id}" if session_id else "no-session"
+    logger.info(f"Request: {request.method} {request.url.path} - {session_info} - Query: {dict(request.query_params)}")
+    response = await call_next(request)
+    logger.info(
+        f"Response: {request.method} {request.url.path} - {session_info} - Status: {response.status_code} - "
+        f"Time: {time.time() - start_time:.3f}s"
+    )
+    return response
+
+
+def build_app(stack: str, events: int, interval: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/hello")
+    async def hello():
+        return {"hello": "world"}
+
+    @app.get("/v1/sse")
+    async def sse():
+        async def stream():
+            for i in range(events):
+                yield f"data: {i}\n\n"
+                await asyncio.sleep(interval)
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    if stack == "BaseHTTPMiddleware":
+        app.state.api_key_service = APIKeyService()
+        app.add_middleware(BaseHTTPMiddleware, dispatch=legacy_auth)
+        app.add_middleware(BaseHTTPMiddleware, dispatch=legacy_logging)
+    elif stack == "ASGI":
+        app.add_middleware(AuthMiddleware)
+        app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+class Server:
+    """uvicorn on a free local port in a background thread"""
+
+    def __init__(self, app: FastAPI):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(app, port=self.port, log_level="warning", access_log=False))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self) -> str:
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return f"http://127.0.0.1:{self.port}"
+
+    def __exit__(self, *exc) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+
+async def hello_throughput(base_url: str, requests: int, concurrency: int) -> tuple:
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, auth=AUTH, limits=limits) as http:
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                response = await http.get("/v1/hello")
+                latencies.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+    return requests / wall, latencies
+
+
+async def sse_first_byte(base_url: str, streams: int) -> List[float]:
+    """Time from sending the request to the first SSE event, for `streams` concurrent streams"""
+    async with httpx.AsyncClient(base_url=base_url, auth=AUTH, limits=httpx.Limits(max_connections=streams)) as http:
+        async def one() -> float:
+            start = time.perf_counter()
+            async with http.stream("GET", "/v1/sse") as response:
+                async for _ in response.aiter_bytes():
+                    first = (time.perf_counter() - start) * 1000
+                    break
+                async for _ in response.aiter_bytes():
+                    pass
+            return first
+
+        return await asyncio.gather(*(one() for _ in range(streams)))
+
+
+def main(args: argparse.Namespace) -> None:
+    if args.log:
+        logging.basicConfig(level=logging.INFO, filename=os.devnull)
+    verified = {"public_key": AUTH[0], "secret_name": "api-key-bench"}
+    with patch("ark_api.services.api_keys.get_context", return_value={"namespace": "bench"}), \
+            patch.object(APIKeyService, "verify_api_key", AsyncMock(return_value=verified)):
+        for stack in ("none", "BaseHTTPMiddleware", "ASGI"):
+            app = build_app(stack, args.events, args.interval_ms / 1000)
+            with Server(app) as base_url:
+                asyncio.run(hello_throughput(base_url, min(500, args.requests), args.concurrency))  # warm up
+                rps, latencies = asyncio.run(hello_throughput(base_url, args.requests, args.concurrency))
+                ttfb = asyncio.run(sse_first_byte(base_url, args.streams))
+            print(
+                f"{stack:<19} hello {rps:8.1f} req/s  p50={percentile(latencies, 50):6.2f}ms  "
+                f"p99={percentile(latencies, 99):6.2f}ms  |  SSE first byte p50={percentile(ttfb, 50):6.2f}ms  "
+                f"p99={percentile(ttfb, 99):6.2f}ms  mean={statistics.mean(ttfb):6.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--streams", type=int, default=50, help="Concurrent SSE streams")
+    parser.add_argument("--events", type=int, default=20, help="Events per SSE stream")
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="Delay between SSE events")
+    parser.add_argument("--log", action="store_true", help="Enable INFO request logging (to /dev/null)")
+    main(parser.parse_args())
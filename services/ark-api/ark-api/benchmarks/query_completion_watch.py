@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: apiserver watch connections and wake-up latency of non-streaming chat completions.
+
+Simulates `--chats` concurrent completions in one namespace against an in-process fake
+apiserver. Every watch is a connection that receives the namespace's query events,
+filtered by name when a field selector is given. Each query moves to running and then to
+done after a random delay:
+
+  per-query watch      a_wait_for: one watch with a metadata.name field selector per
+                       query (the previous implementation)
+  shared watch         QueryCompletionWatcher: one watch per namespace
+
+Reported are the peak number of open watch connections, the events delivered to
+ark-api, and the time from a query's status update to its waiter waking up.
+
+Usage (from services/ark-api/ark-api with the package installed):
+    python benchmarks/query_completion_watch.py --chats 1000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from ark_api.utils.query_watch import QueryCompletionWatcher, _is_query_finished
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class FakeQueries:
+    """SDK query client backed by an in-process event broadcast"""
+
+    def __init__(self, namespace: str = "bench"):
+        self.namespace = namespace
+        self.connections: List[tuple] = []
+        self.peak_connections = 0
+        self.delivered = 0
+        self.updated_at: Dict[str, float] = {}
+
+    def update(self, name: str, phase: str) -> None:
+        self.updated_at[name] = time.perf_counter()
+        event = SimpleNamespace(
+            type="MODIFIED", object=None, raw_object={"metadata": {"name": name}, "status": {"phase": phase}}
+        )
+        for selected, events in self.connections:
+            if selected is None or selected == name:
+                self.delivered += 1
+                events.put_nowait(event)
+
+    async def a_watch(self, name: Optional[str] = None, namespace: Optional[str] = None, raw: bool = False):
+        connection = (name, asyncio.Queue())
+        self.connections.append(connection)
+        self.peak_connections = max(self.peak_connections, len(self.connections))
+        try:
+            while True:
+                yield await connection[1].get()
+        finally:
+            self.connections.remove(connection)
+
+    async def a_wait_for(self, name: str, predicate, timeout: Optional[float] = None):
+        async def wait():
+            async for event in self.a_watch(name=name):
+                if predicate(event.raw_object):
+                    return event.raw_object
+        return await asyncio.wait_for(wait(), timeout)
+
+
+async def run(mode: str, chats: int, max_seconds: float) -> None:
+    queries = FakeQueries()
+    watcher = QueryCompletionWatcher()
+    latencies: List[float] = []
+
+    async def chat(i: int) -> None:
+        name = f"openai-query-{i:06d}"
+
+        async def complete():
+            await asyncio.sleep(random.uniform(0, max_seconds / 2))
+            queries.update(name, "running")
+            await asyncio.sleep(random.uniform(0, max_seconds / 2))
+            queries.update(name, "done")
+
+        worker = asyncio.ensure_future(complete())
+        if mode == "per-query watch":
+            query = await queries.a_wait_for(name, _is_query_finished, timeout=60)
+        else:
+            query = await watcher.wait(queries, name, timeout=60)
+        latencies.append((time.perf_counter() - queries.updated_at[query["metadata"]["name"]]) * 1000)
+        await worker
+
+    start = time.perf_counter()
+    await asyncio.gather(*(chat(i) for i in range(chats)))
+    wall = time.perf_counter() - start
+    await watcher.close()
+    print(
+        f"{mode:<16} watches peak={queries.peak_connections:5d}  events={queries.delivered:8d}  "
+        f"wake-up p50={percentile(latencies, 50):6.2f}ms  p99={percentile(latencies, 99):6.2f}ms  "
+        f"mean={statistics.mean(latencies):6.2f}ms  wall={wall:5.2f}s"
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    for mode in ("per-query watch", "shared watch"):
+        asyncio.run(run(mode, args.chats, args.max_seconds))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chats", type=int, default=1000, help="Concurrent chat completions")
+    parser.add_argument("--max-seconds", type=float, default=2.0, help="Longest simulated query run")
+    main(parser.parse_args())
@@ -88,11 +88,11 @@ async def list_a2a_servers(namespace: Optional[str] = Query(None, description="N
         A2AServerListResponse: List of all A2A servers in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        a2a_servers = await ark_client.a2aservers.a_list()
+        a2a_servers = await ark_client.a2aservers.a_list_raw()
         
         a2a_server_list = []
         for a2a_server in a2a_servers:
-            a2a_server_list.append(a2a_server_to_response(a2a_server.to_dict()))
+            a2a_server_list.append(a2a_server_to_response(a2a_server))
         
         return A2AServerListResponse(
             items=a2a_server_list,
@@ -147,11 +147,11 @@ async def list_a2a_tasks(namespace: Optional[str] = Query(None, description="Nam
         A2ATaskListResponse: List of all A2A tasks in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        tasks = await ark_client.a2atasks.a_list()
+        tasks = await ark_client.a2atasks.a_list_raw()
 
         task_list = []
         for task in tasks:
-            task_list.append(a2a_task_to_response(task.to_dict()))
+            task_list.append(a2a_task_to_response(task))
 
         return A2ATaskListResponse(
             items=task_list,
@@ -90,6 +90,9 @@ class DynamicManager:
         self.registry = get_registry()
         self._refresh_task = None
         self._running = False
+        self._versions = None
+        # Set while self.agents holds changes whose routes failed to build
+        self._routes_stale = False
 
     async def start_periodic_sync(self):
         """Start the periodic registry sync task"""
@@ -125,6 +128,12 @@ class DynamicManager:
     async def _sync_with_registry(self):
         """Sync agents with registry and update routes if needed"""
         try:
+            # Agents only need rebuilding when a resource version changed
+            versions = await self.registry.agent_versions()
+            if versions == self._versions:
+                logger.debug("No agent resource versions changed, routes unchanged")
+                return
+
             # Get current agents from registry
             logger.debug("Fetching agents from registry...")
             agent_cards = await self.registry.list_agents()
@@ -151,12 +160,17 @@ class DynamicManager:
                         logger.info(f"Added/Updated agent: {name}")
                         changes_detected = True
             
-            # Only update routes if changes were detected
-            if changes_detected:
+            # Only update routes if changes were detected, or an earlier update failed
+            if changes_detected or self._routes_stale:
                 logger.info("Agent changes detected, updating routes...")
+                self._routes_stale = True
                 self._update_routes()
+                self._routes_stale = False
             else:
                 logger.debug("No agent changes detected, routes unchanged")
+
+            # Recorded only once routes match, so a failed update is retried on the next sync
+            self._versions = versions
                 
         except Exception as e:
             logger.error(f"Failed to sync with registry: {e}", exc_info=True)
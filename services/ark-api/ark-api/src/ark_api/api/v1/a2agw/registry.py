@@ -82,6 +82,12 @@ class AgentRegistry:
             agents = await ark_client.agents.a_list()
             return [ark_to_agent_card(a) for a in agents]
 
+    async def agent_versions(self) -> dict[str, str]:
+        """Map agent names to resource versions, listing metadata only."""
+        async with with_ark_client(self._namespace, V1_ALPHA1) as ark_client:
+            agents = await ark_client.agents.a_list_metadata()
+            return {metadata["name"]: metadata.get("resourceVersion", "") for metadata in agents}
+
     async def find_agents_by_capability(self, capability: str) -> list[AgentCard]:
         agents = await self.list_agents()
         return [agent for agent in agents if any(capability in skill.name for skill in agent.skills)]
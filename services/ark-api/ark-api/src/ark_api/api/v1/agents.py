@@ -8,6 +8,7 @@ from typing import Optional
 from ark_sdk.models.agent_v1alpha1 import AgentV1alpha1
 
 from ark_sdk.client import with_ark_client
+from ark_sdk.patch import merge_patch
 
 from ...models.agents import (
     AgentResponse,
@@ -114,11 +115,11 @@ async def list_agents(namespace: Optional[str] = Query(None, description="Namesp
         AgentListResponse: List of all agents in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        agents = await ark_client.agents.a_list()
+        agents = await ark_client.agents.a_list_raw()
         
         agent_list = []
         for agent in agents:
-            agent_list.append(agent_to_response(agent.to_dict()))
+            agent_list.append(agent_to_response(agent))
         
         return AgentListResponse(
             items=agent_list,
@@ -210,41 +211,9 @@ async def update_agent(agent_name: str, body: AgentUpdateRequest, namespace: Opt
         AgentDetailResponse: The updated agent details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get the existing agent first
-        existing_agent = await ark_client.agents.a_get(agent_name)
-        existing_spec = existing_agent.to_dict()["spec"]
-        
-        # Update only the fields that are provided
-        if body.description is not None:
-            existing_spec["description"] = body.description
-        
-        if body.executionEngine is not None:
-            existing_spec["executionEngine"] = body.executionEngine.model_dump(exclude_none=True)
-        
-        if body.modelRef is not None:
-            existing_spec["modelRef"] = body.modelRef.model_dump(exclude_none=True)
-        
-        if body.parameters is not None:
-            existing_spec["parameters"] = [param.model_dump(exclude_none=True) for param in body.parameters]
-        
-        if body.prompt is not None:
-            existing_spec["prompt"] = body.prompt
-        
-        if body.tools is not None:
-            existing_spec["tools"] = [tool.model_dump(exclude_none=True) for tool in body.tools]
-
-        if body.overrides is not None:
-            existing_spec["overrides"] = [override.model_dump(exclude_none=True) for override in body.overrides]
-        
-        # Update the agent
-        # Get the full existing agent object and update its spec
-        existing_agent_dict = existing_agent.to_dict()
-        existing_agent_dict["spec"] = existing_spec
-        
-        # Create updated agent object
-        updated_agent_obj = AgentV1alpha1(**existing_agent_dict)
-        
-        updated_agent = await ark_client.agents.a_update(updated_agent_obj)
+        # Send only the provided fields as a merge patch; references are replaced as a whole
+        patch = {"spec": merge_patch(body, replace=["modelRef", "executionEngine"])}
+        updated_agent = await ark_client.agents.a_merge_patch(agent_name, patch)
         
         return agent_to_detail_response(updated_agent.to_dict())
 
@@ -39,26 +39,25 @@ async def list_evaluations(
 ) -> Union[EvaluationListResponse, EnhancedEvaluationListResponse]:
     """List all evaluations in a namespace."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        result = await ark_client.evaluations.a_list()
+        result = await ark_client.evaluations.a_list_raw()
         
         # Filter by query_ref if provided
         if query_ref:
             filtered_result = []
             for item in result:
-                item_dict = item.to_dict()
                 # Check if this evaluation has a queryRef that matches
-                if (item_dict.get('spec', {}).get('config', {}).get('queryRef', {}).get('name') == query_ref):
+                if (item.get('spec', {}).get('config', {}).get('queryRef', {}).get('name') == query_ref):
                     filtered_result.append(item)
             result = filtered_result
         
         if enhanced:
-            evaluations = [enhanced_evaluation_to_response(item.to_dict()) for item in result]
+            evaluations = [enhanced_evaluation_to_response(item) for item in result]
             return EnhancedEvaluationListResponse(
                 items=evaluations,
                 count=len(evaluations)
             )
         else:
-            evaluations = [evaluation_to_response(item.to_dict()) for item in result]
+            evaluations = [evaluation_to_response(item) for item in result]
             return EvaluationListResponse(
                 items=evaluations,
                 count=len(evaluations)
@@ -163,59 +162,54 @@ async def update_evaluation(
 ) -> EvaluationDetailResponse:
     """Update an existing evaluation."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get existing evaluation
-        existing = await ark_client.evaluations.a_get(name)
-        existing_dict = existing.to_dict()
-        
-        # Update spec with provided values
-        spec = existing_dict.get("spec", {})
+        # Merge patch of the provided values; None removes a key
+        spec = {}
         
         if evaluation.evaluator:
-            evaluator_dict = {"name": evaluation.evaluator.name}
-            if evaluation.evaluator.namespace:
-                evaluator_dict["namespace"] = evaluation.evaluator.namespace
-            if evaluation.evaluator.parameters:
-                evaluator_dict["parameters"] = evaluation.evaluator.parameters
-            spec["evaluator"] = evaluator_dict
+            # The evaluator reference is replaced as a whole
+            spec["evaluator"] = {
+                "name": evaluation.evaluator.name,
+                "namespace": evaluation.evaluator.namespace or None,
+                "parameters": evaluation.evaluator.parameters or None
+            }
         
         if evaluation.type:
             spec["type"] = evaluation.type.value
         
         if evaluation.config:
-            if "config" not in spec:
-                spec["config"] = {}
+            config = {}
             
             # Update config based on type
             if evaluation.config.input is not None:
-                spec["config"]["input"] = evaluation.config.input
+                config["input"] = evaluation.config.input
             if evaluation.config.output is not None:
-                spec["config"]["output"] = evaluation.config.output
+                config["output"] = evaluation.config.output
                 
             if evaluation.config.queryRef is not None:
                 if evaluation.config.queryRef:
-                    spec["config"]["queryRef"] = {
-                        "name": evaluation.config.queryRef.name
+                    config["queryRef"] = {
+                        "name": evaluation.config.queryRef.name,
+                        "namespace": evaluation.config.queryRef.namespace or None,
+                        "responseTarget": evaluation.config.queryRef.responseTarget or None
                     }
-                    if evaluation.config.queryRef.namespace:
-                        spec["config"]["queryRef"]["namespace"] = evaluation.config.queryRef.namespace
-                    if evaluation.config.queryRef.responseTarget:
-                        spec["config"]["queryRef"]["responseTarget"] = evaluation.config.queryRef.responseTarget
                 else:
-                    spec["config"].pop("queryRef", None)
+                    config["queryRef"] = None
             
             if evaluation.config.evaluations is not None:
                 if evaluation.config.evaluations:
-                    spec["config"]["evaluations"] = []
+                    config["evaluations"] = []
                     for eval_ref in evaluation.config.evaluations:
                         eval_dict = {"name": eval_ref.name}
                         if eval_ref.namespace:
                             eval_dict["namespace"] = eval_ref.namespace
-                        spec["config"]["evaluations"].append(eval_dict)
+                        config["evaluations"].append(eval_dict)
                 else:
-                    spec["config"].pop("evaluations", None)
+                    config["evaluations"] = None
                     
             if evaluation.config.rules is not None:
-                spec["config"]["rules"] = evaluation.config.rules
+                config["rules"] = evaluation.config.rules
+            
+            spec["config"] = config
         
         if evaluation.ttl is not None:
             spec["ttl"] = evaluation.ttl
@@ -223,11 +217,7 @@ async def update_evaluation(
         if evaluation.timeout is not None:
             spec["timeout"] = evaluation.timeout
         
-        # Update evaluation object
-        existing_dict["spec"] = spec
-        updated_evaluation = EvaluationV1alpha1.from_dict(existing_dict)
-        
-        result = await ark_client.evaluations.a_update(updated_evaluation)
+        result = await ark_client.evaluations.a_merge_patch(name, {"spec": spec})
         return evaluation_to_detail_response(result.to_dict())
 
 
@@ -245,17 +235,7 @@ async def delete_evaluation(name: str, namespace: Optional[str] = Query(None, de
 async def cancel_evaluation(name: str, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> EvaluationDetailResponse:
     """Cancel a running evaluation."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get existing evaluation
-        existing = await ark_client.evaluations.a_get(name)
-        existing_dict = existing.to_dict()
-        
         # Set cancel flag in spec
-        if "spec" not in existing_dict:
-            existing_dict["spec"] = {}
-        existing_dict["spec"]["cancel"] = True
-        
-        # Update evaluation
-        updated_evaluation = EvaluationV1alpha1.from_dict(existing_dict)
-        result = await ark_client.evaluations.a_update(updated_evaluation)
+        result = await ark_client.evaluations.a_merge_patch(name, {"spec": {"cancel": True}})
         
         return evaluation_to_detail_response(result.to_dict())
\ No newline at end of file
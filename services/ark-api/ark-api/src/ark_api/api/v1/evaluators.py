@@ -36,9 +36,9 @@ VERSION = "v1alpha1"
 async def list_evaluators(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> EvaluatorListResponse:
     """List all evaluators in a namespace."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        result = await ark_client.evaluators.a_list()
+        result = await ark_client.evaluators.a_list_raw()
         
-        evaluators = [evaluator_to_response(item.to_dict()) for item in result]
+        evaluators = [evaluator_to_response(item) for item in result]
         
         return EvaluatorListResponse(
             items=evaluators,
@@ -91,11 +91,11 @@ async def list_mcp_servers(namespace: Optional[str] = Query(None, description="N
         MCPServerListResponse: List of all MCP servers in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        mcp_servers = await ark_client.mcpservers.a_list()
+        mcp_servers = await ark_client.mcpservers.a_list_raw()
         
         mcp_server_list = []
         for mcp_server in mcp_servers:
-            mcp_server_list.append(mcp_server_to_response(mcp_server.to_dict()))
+            mcp_server_list.append(mcp_server_to_response(mcp_server))
         
         return MCPServerListResponse(
             items=mcp_server_list,
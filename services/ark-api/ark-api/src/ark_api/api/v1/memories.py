@@ -6,6 +6,7 @@ from fastapi import APIRouter, Query
 from ark_sdk.models.memory_v1alpha1 import MemoryV1alpha1
 
 from ark_sdk.client import with_ark_client
+from ark_sdk.patch import diff_patch, merge_patch
 
 from ...models.memories import (
     MemoryResponse,
@@ -77,9 +78,9 @@ def memory_to_detail_response(memory) -> MemoryDetailResponse:
 async def list_memories(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> MemoryListResponse:
     """List all memories in a namespace."""
     async with with_ark_client(namespace, VERSION) as client:
-        memories = await client.memories.a_list()
+        memories = await client.memories.a_list_raw()
         
-        memory_responses = [memory_to_response(memory.to_dict()) for memory in memories]
+        memory_responses = [memory_to_response(memory) for memory in memories]
         return MemoryListResponse(items=memory_responses)
 
 
@@ -114,24 +115,13 @@ async def create_memory(memory_request: MemoryCreateRequest, namespace: Optional
 async def update_memory(name: str, memory_request: MemoryUpdateRequest, namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> MemoryDetailResponse:
     """Update an existing memory."""
     async with with_ark_client(namespace, VERSION) as client:
-        # Get existing memory
-        existing_memory = await client.memories.a_get(name)
-        existing_dict = existing_memory.to_dict()
-        
-        # Update spec fields
-        spec = existing_dict.get("spec", {})
-        if memory_request.description is not None:
-            spec["description"] = memory_request.description
+        # Send only the provided fields as a merge patch
+        spec = merge_patch(memory_request, exclude=["config"])
         if memory_request.config is not None:
-            spec["config"] = memory_request.config
-        
-        # Create updated memory object
-        memory_obj = MemoryV1alpha1(
-            metadata=existing_dict["metadata"],
-            spec=spec
-        )
-        
-        updated_memory = await client.memories.a_update(memory_obj)
+            # The config is replaced as a whole, so only this case reads the memory
+            existing_spec = (await client.memories.a_get(name)).to_dict()["spec"]
+            spec["config"] = diff_patch(existing_spec.get("config") or {}, memory_request.config)
+        updated_memory = await client.memories.a_merge_patch(name, {"spec": spec})
         return memory_to_detail_response(updated_memory.to_dict())
 
 
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Query
 from typing import Optional
 
 from ark_sdk.client import with_ark_client
+from ark_sdk.patch import diff_patch
 
 from ...models.models import (
     ModelResponse,
@@ -113,11 +114,11 @@ async def list_models(namespace: Optional[str] = Query(None, description="Namesp
         ModelListResponse: List of all models in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        models = await ark_client.models.a_list()
+        models = await ark_client.models.a_list_raw()
         
         model_list = []
         for model in models:
-            model_list.append(model_to_response(model.to_dict()))
+            model_list.append(model_to_response(model))
         
         return ModelListResponse(
             items=model_list,
@@ -236,16 +237,16 @@ async def update_model(model_name: str, body: ModelUpdateRequest, namespace: Opt
         ModelDetailResponse: The updated model details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get the existing model first
-        existing_model = await ark_client.models.a_get(model_name)
-        existing_spec = existing_model.to_dict()["spec"]
-        provider = get_provider_from_spec(existing_spec)
-
-        # Update only the fields that are provided
+        # Update only the fields that are provided, as a merge patch
+        spec = {}
         if body.model is not None:
-            existing_spec["model"] = {"value": body.model}
+            spec["model"] = {"value": body.model, "valueFrom": None}
 
         if body.config is not None:
+            # The config layout depends on the provider, so only this case reads the model
+            existing_spec = (await ark_client.models.a_get(model_name)).to_dict()["spec"]
+            provider = get_provider_from_spec(existing_spec)
+
             # Build the config based on the provider
             config_dict = {}
 
@@ -281,16 +282,10 @@ async def update_model(model_name: str, body: ModelUpdateRequest, namespace: Opt
                         elif isinstance(value, str):
                             config_dict[PROVIDER_BEDROCK][field] = {"value": value}
 
-            existing_spec["config"] = config_dict
-        
-        # Update the model - need to update the entire resource object
-        existing_model_dict = existing_model.to_dict()
-        existing_model_dict["spec"] = existing_spec
-        
-        from ark_sdk.models.model_v1alpha1 import ModelV1alpha1
-        updated_resource = ModelV1alpha1(**existing_model_dict)
+            # The config is replaced as a whole
+            spec["config"] = diff_patch(existing_spec.get("config") or {}, config_dict)
         
-        updated_model = await ark_client.models.a_update(updated_resource)
+        updated_model = await ark_client.models.a_merge_patch(model_name, {"spec": spec})
         
         return model_to_detail_response(updated_model.to_dict())
 
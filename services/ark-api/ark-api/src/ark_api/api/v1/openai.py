@@ -11,10 +11,9 @@ from ark_sdk import QueryV1alpha1Spec
 from ark_sdk.client import with_ark_client
 from ark_sdk.k8s import get_namespace
 from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
-from ark_sdk.streaming_config import get_streaming_base_url, get_streaming_config
+from ark_sdk.streaming_config import get_streaming_resolver
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse, StreamingResponse
-from kubernetes_asyncio import client as k8s_client
 from openai.types import Model
 from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 from pydantic import BaseModel, ValidationError
@@ -261,9 +260,9 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
                 "Connection": "keep-alive",
             }
 
-            api = k8s_client.ApiClient()
-            v1 = k8s_client.CoreV1Api(api)
-            streaming_config = await get_streaming_config(v1, namespace)
+            # Served from the resolver's watch-invalidated cache after the first request
+            streaming_resolver = get_streaming_resolver()
+            streaming_config = await streaming_resolver.get_config(namespace)
 
             # If no config or not enabled, fall back to polling
             if not streaming_config or not streaming_config.enabled:
@@ -277,7 +276,7 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
                 )
 
             # Streaming is enabled - get the base URL and construct full URL
-            base_url = await get_streaming_base_url(streaming_config, namespace, v1)
+            base_url = await streaming_resolver.get_base_url(streaming_config, namespace)
             streaming_url = f"{base_url}/stream/{query_name}?from-beginning=true&wait-for-query={timeout_seconds}"
 
             # Proxy to the streaming endpoint
@@ -317,43 +316,38 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletion:
 
 @router.get("/models")
 async def list_models():
-    """List available models in OpenAI format, including ARK agents, teams, models, and tools."""
+    """List available models in OpenAI format, including ARK agents, teams, models, and tools.
+
+    Only names and creation timestamps are used, so resources are listed as metadata.
+    """
     models_list = []
 
     async with with_ark_client("default", "v1alpha1") as ark_client:
         # Get agents
         try:
-            agents = await ark_client.agents.a_list()
-            for agent in agents:
-                name = agent.metadata["name"]
-                models_list.append(_create_model_entry(f"agent/{name}", agent.metadata))
+            for metadata in await ark_client.agents.a_list_metadata():
+                models_list.append(_create_model_entry(f"agent/{metadata['name']}", metadata))
         except Exception as e:
             logger.error(f"Failed to list agents: {e}")
 
         # Get teams
         try:
-            teams = await ark_client.teams.a_list()
-            for team in teams:
-                name = team.metadata["name"]
-                models_list.append(_create_model_entry(f"team/{name}", team.metadata))
+            for metadata in await ark_client.teams.a_list_metadata():
+                models_list.append(_create_model_entry(f"team/{metadata['name']}", metadata))
         except Exception as e:
             logger.error(f"Failed to list teams: {e}")
 
         # Get models
         try:
-            models = await ark_client.models.a_list()
-            for model in models:
-                name = model.metadata["name"]
-                models_list.append(_create_model_entry(f"model/{name}", model.metadata))
+            for metadata in await ark_client.models.a_list_metadata():
+                models_list.append(_create_model_entry(f"model/{metadata['name']}", metadata))
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
 
         # Get tools
         try:
-            tools = await ark_client.tools.a_list()
-            for tool in tools:
-                name = tool.metadata["name"]
-                models_list.append(_create_model_entry(f"tool/{name}", tool.metadata))
+            for metadata in await ark_client.tools.a_list_metadata():
+                models_list.append(_create_model_entry(f"tool/{metadata['name']}", metadata))
         except Exception as e:
             logger.error(f"Failed to list tools: {e}")
 
@@ -1,3 +1,3 @@
 from .proxy import router as proxy_router
 # Re-export names used by tests and external patching
-from .proxy import get_context, ApiClient, client  # noqa: F401
\ No newline at end of file
+from .proxy import get_context, ApiClient, list_metadata  # noqa: F401
\ No newline at end of file
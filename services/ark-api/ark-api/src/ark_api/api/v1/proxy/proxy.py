@@ -4,10 +4,9 @@ import os
 from multiprocessing import get_context
 from token import OP
 from ark_api.utils.ark_services import get_headers
-from ark_sdk.k8s import get_context
+from ark_sdk.k8s import get_context, list_metadata
 from ark_sdk.client import with_ark_client
 from datetime import datetime
-from kubernetes_asyncio import client
 from kubernetes_asyncio.client.api_client import ApiClient
 from posix import preadv
 from typing import Optional
@@ -173,10 +172,9 @@ async def list_services(
         namespace = get_context()["namespace"]
 
     async with ApiClient() as api_client:
-        v1 = client.CoreV1Api(api_client)
-        services = await v1.list_namespaced_service(namespace=namespace)
-        service_names = [svc.metadata.name for svc in services.items]
-        return ServiceListResponse(services=service_names)
+        # Only names are needed, so skip the service specs
+        services = await list_metadata(api_client, f"/api/v1/namespaces/{namespace}/services")
+        return ServiceListResponse(services=[metadata["name"] for metadata in services])
 
 @router.options("/{resource}/{server_name}")
 @router.post("/{resource}/{server_name}")
@@ -7,6 +7,7 @@ from ark_sdk.models.query_v1alpha1 import QueryV1alpha1
 from ark_sdk.models.query_v1alpha1_spec import QueryV1alpha1Spec
 
 from ark_sdk.client import with_ark_client
+from ark_sdk.patch import diff_patch, merge_patch
 
 from ...models.queries import (
     QueryResponse,
@@ -25,6 +26,9 @@ router = APIRouter(
 # CRD configuration
 VERSION = "v1alpha1"
 
+# Page size used when a continue token is supplied without a limit
+DEFAULT_PAGE_SIZE = 100
+
 
 def query_to_response(query: dict) -> QueryResponse:
     """Convert a Kubernetes query object to response model."""
@@ -84,16 +88,30 @@ def query_to_detail_response(query: dict) -> QueryDetailResponse:
 
 @router.get("", response_model=QueryListResponse)
 @handle_k8s_errors(operation="list", resource_type="query")
-async def list_queries(namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)")) -> QueryListResponse:
-    """List all queries in a namespace."""
+async def list_queries(
+    namespace: Optional[str] = Query(None, description="Namespace for this request (defaults to current context)"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of queries to return; enables cursor pagination"),
+    continue_token: Optional[str] = Query(None, alias="continue", description="Continue token from a previous paginated response")
+) -> QueryListResponse:
+    """List queries in a namespace, optionally one page at a time."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        result = await ark_client.queries.a_list()
+        if limit is None and continue_token is None:
+            result = await ark_client.queries.a_list_raw()
+            next_token = None
+        else:
+            page = await ark_client.queries.a_list_page_raw(
+                limit=limit or DEFAULT_PAGE_SIZE,
+                continue_token=continue_token
+            )
+            result = page.items
+            next_token = page.continue_token
         
-        queries = [query_to_response(item.to_dict()) for item in result]
+        queries = [query_to_response(item) for item in result]
         
         return QueryListResponse(
             items=queries,
-            count=len(queries)
+            count=len(queries),
+            continue_=next_token
         )
 
 
@@ -179,44 +197,14 @@ async def update_query(
 ) -> QueryDetailResponse:
     """Update a specific query."""
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get current query
-        current = await ark_client.queries.a_get(query_name)
-        spec = current.to_dict()["spec"]
-        
-        # Update spec with non-None values
-        if query.input is not None:
-            spec["input"] = query.input
-        if query.memory is not None:
-            spec["memory"] = query.memory.model_dump()
-        if query.parameters is not None:
-            spec["parameters"] = [p.model_dump() for p in query.parameters]
+        # Send only the provided fields as a merge patch; the input type is not updatable
+        # and references are replaced as a whole
+        spec = merge_patch(query, exclude=["type", "selector"], replace=["memory", "target"])
         if query.selector is not None:
-            spec["selector"] = query.selector.model_dump()
-        if query.serviceAccount is not None:
-            spec["serviceAccount"] = query.serviceAccount
-        if query.sessionId is not None:
-            spec["sessionId"] = query.sessionId
-        if query.conversationId is not None:
-            spec["conversationId"] = query.conversationId
-        if query.target is not None:
-            spec["target"] = query.target.model_dump()
-        if query.timeout is not None:
-            spec["timeout"] = query.timeout
-        if query.ttl is not None:
-            spec["ttl"] = query.ttl
-        if query.cancel is not None:
-            spec["cancel"] = query.cancel
-        if query.overrides is not None:
-            spec["overrides"] = [o.model_dump() for o in query.overrides]
-
-        # Update the resource - need to update the entire resource object
-        current_dict = current.to_dict()
-        current_dict["spec"] = spec
-        
-        # Create updated query object
-        updated_query_obj = QueryV1alpha1(**current_dict)
-        
-        updated = await ark_client.queries.a_update(updated_query_obj)
+            # Label selectors are replaced as a whole, so only this case reads the query
+            existing_spec = (await ark_client.queries.a_get(query_name)).to_dict()["spec"]
+            spec["selector"] = diff_patch(existing_spec.get("selector") or {}, query.selector.model_dump(exclude_none=True))
+        updated = await ark_client.queries.a_merge_patch(query_name, {"spec": spec})
         
         return query_to_detail_response(updated.to_dict())
 
@@ -6,6 +6,7 @@ from typing import Optional
 from ark_sdk.models.team_v1alpha1 import TeamV1alpha1
 
 from ark_sdk.client import with_ark_client
+from ark_sdk.patch import diff_patch, merge_patch
 
 from ...models.teams import (
     TeamResponse,
@@ -83,11 +84,11 @@ async def list_teams(namespace: Optional[str] = Query(None, description="Namespa
         TeamListResponse: List of all teams in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        teams = await ark_client.teams.a_list()
+        teams = await ark_client.teams.a_list_raw()
         
         team_list = []
         for team in teams:
-            team_list.append(team_to_response(team.to_dict()))
+            team_list.append(team_to_response(team))
         
         return TeamListResponse(
             items=team_list,
@@ -181,40 +182,13 @@ async def update_team(team_name: str, body: TeamUpdateRequest, namespace: Option
         TeamDetailResponse: The updated team details
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        # Get the existing team first
-        existing_team = await ark_client.teams.a_get(team_name)
-        existing_spec = existing_team.to_dict()["spec"]
-        
-        # Update only the fields that are provided
-        if body.description is not None:
-            existing_spec["description"] = body.description
-        
-        if body.members is not None:
-            existing_spec["members"] = [member.model_dump(exclude_none=True) for member in body.members]
-        
-        if body.strategy is not None:
-            existing_spec["strategy"] = body.strategy
-        
-        if body.graph is not None:
-            # Handle graph edges with from_ field conversion
-            graph_dict = body.graph.model_dump(exclude_none=True, by_alias=True)
-            existing_spec["graph"] = graph_dict
-        
-        if body.maxTurns is not None:
-            existing_spec["maxTurns"] = body.maxTurns
-        
+        # Send only the provided fields as a merge patch
+        spec = merge_patch(body, exclude=["selector"])
         if body.selector is not None:
-            existing_spec["selector"] = body.selector.model_dump(exclude_none=True)
-        
-        # Update the team
-        # Get the full existing team object and update its spec
-        existing_team_dict = existing_team.to_dict()
-        existing_team_dict["spec"] = existing_spec
-        
-        # Create updated team object
-        updated_team_obj = TeamV1alpha1(**existing_team_dict)
-        
-        updated_team = await ark_client.teams.a_update(updated_team_obj)
+            # The selector is replaced as a whole, so only this case reads the team
+            existing_spec = (await ark_client.teams.a_get(team_name)).to_dict()["spec"]
+            spec["selector"] = diff_patch(existing_spec.get("selector") or {}, body.selector.model_dump(exclude_none=True))
+        updated_team = await ark_client.teams.a_merge_patch(team_name, {"spec": spec})
         
         return team_to_detail_response(updated_team.to_dict())
 
@@ -70,11 +70,11 @@ async def list_tools(namespace: Optional[str] = Query(None, description="Namespa
         ToolListResponse: List of all tools in the namespace
     """
     async with with_ark_client(namespace, VERSION) as ark_client:
-        tools = await ark_client.tools.a_list()
+        tools = await ark_client.tools.a_list_raw()
         
         tool_list = []
         for tool in tools:
-            tool_list.append(tool_to_response(tool.to_dict()))
+            tool_list.append(tool_to_response(tool))
         
         return ToolListResponse(
             items=tool_list,
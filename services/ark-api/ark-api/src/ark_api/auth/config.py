@@ -10,7 +10,7 @@ All routes except PUBLIC_ROUTES require authentication when auth is enabled.
 Both JWT and API key authentication work on all authenticated routes.
 """
 
-from typing import Set
+from typing import FrozenSet, Set
 
 # Routes that should NOT be authenticated (public endpoints)
 # All other routes will be protected by default
@@ -22,6 +22,10 @@ PUBLIC_ROUTES: Set[str] = {
     "/redoc"
 }
 
+# Immutable snapshot of PUBLIC_ROUTES checked on every request; rebuilt by
+# add_public_route and remove_public_route
+_public_routes: FrozenSet[str] = frozenset(PUBLIC_ROUTES)
+
 def is_route_authenticated(path: str) -> bool:
     """
     Check if a route path requires authentication.
@@ -34,12 +38,8 @@ def is_route_authenticated(path: str) -> bool:
     Returns:
         True if the route requires authentication, False otherwise
     """
-    # Check if it's explicitly public - if so, don't authenticate
-    if path in PUBLIC_ROUTES:
-        return False
-    
-    # All other routes are protected by default
-    return True
+    # Public routes are exact paths, so a single hash lookup decides
+    return path not in _public_routes
 
 def get_public_routes() -> Set[str]:
     """Get all public routes that don't require authentication."""
@@ -47,8 +47,12 @@ def get_public_routes() -> Set[str]:
 
 def add_public_route(path: str) -> None:
     """Add a route to the public routes set (exceptions to authentication)."""
+    global _public_routes
     PUBLIC_ROUTES.add(path)
+    _public_routes = frozenset(PUBLIC_ROUTES)
 
 def remove_public_route(path: str) -> None:
     """Remove a route from the public routes set (will make it protected)."""
+    global _public_routes
     PUBLIC_ROUTES.discard(path)
+    _public_routes = frozenset(PUBLIC_ROUTES)
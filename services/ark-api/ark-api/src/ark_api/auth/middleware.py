@@ -10,13 +10,17 @@ Environment Variables:
     AUTH_MODE: Authentication mode (sso, basic, hybrid, open)
     
 Note: JWKS URL is automatically derived from the issuer URL
+
+The middleware is plain ASGI: `receive` and `send` are handed to the application
+untouched, so streaming responses (SSE) are not buffered or wrapped in extra tasks.
 """
 
 import logging
 import os
-from fastapi import Request, APIRouter
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .config import is_route_authenticated
 from .constants import AuthMode, AuthHeader
@@ -35,7 +39,7 @@ __all__ = ['AuthMiddleware', 'TokenValidationError']
 logger = logging.getLogger(__name__)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     Middleware that automatically protects all routes except those in PUBLIC_ROUTES.
     Supports multiple authentication modes:
@@ -45,10 +49,12 @@ class AuthMiddleware(BaseHTTPMiddleware):
     - open: No authentication (development)
     """
     
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         # API keys are always stored in current context namespace for security
         self.api_key_service = APIKeyService()
+        # Created on first JWT request; JWKS and verified tokens are cached process-wide
+        self._token_validator = None
         
         # Validate configuration at startup
         self._validate_auth_config()
@@ -87,39 +93,32 @@ class AuthMiddleware(BaseHTTPMiddleware):
         
         logger.info(f"Authentication middleware initialized with mode: {auth_mode or 'open (default)'}")
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Get the path from the request
-        path = request.url.path
+        path = scope["path"]
         
         # Get authentication mode (validated at startup)
         auth_mode = os.getenv("AUTH_MODE", "").lower() or AuthMode.OPEN
         
-        # Log authentication configuration
-        logger.debug(f"Auth mode: {auth_mode}, Path: {path}")
-        
         # Determine which auth methods are enabled
         jwt_enabled = auth_mode in [AuthMode.SSO, AuthMode.HYBRID]
         basic_enabled = auth_mode in [AuthMode.BASIC, AuthMode.HYBRID]
         auth_disabled = auth_mode == AuthMode.OPEN
         
-        if auth_disabled:
-            logger.debug("Authentication disabled")
-            response = await call_next(request)
-            return response
-        
-        # Check if this route should be authenticated
-        if not is_route_authenticated(path):
-            logger.debug(f"Route {path} is public, skipping authentication")
-            response = await call_next(request)
-            return response
+        # Skip authentication when disabled or for public routes
+        if auth_disabled or not is_route_authenticated(path):
+            await self.app(scope, receive, send)
+            return
         
         # Route requires authentication
-        auth_header = request.headers.get("Authorization")
+        auth_header = Headers(scope=scope).get("authorization")
         if not auth_header:
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Missing authorization header"}
-            )
+            await self._reject(scope, receive, send, "Missing authorization header")
+            return
         
         # Try different authentication methods based on auth mode
         auth_success = False
@@ -133,8 +132,9 @@ class AuthMiddleware(BaseHTTPMiddleware):
                     auth_error = "Missing token"
                 else:
                     # Validate JWT token using ark_sdk validator
-                    validator = TokenValidator()
-                    await validator.validate_token(token)
+                    if self._token_validator is None:
+                        self._token_validator = TokenValidator()
+                    await self._token_validator.validate_token(token)
                     auth_success = True
                     logger.debug("JWT authentication successful")
                     
@@ -162,8 +162,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
                         auth_success = True
                         logger.debug(f"Basic auth successful for key: {public_key} in namespace {self.api_key_service.namespace}")
                         
-                        # Add API key context to request (optional)
-                        request.state.api_key = api_key_data
+                        # Add API key context to request, available as request.state.api_key
+                        scope.setdefault("state", {})["api_key"] = api_key_data
                     else:
                         auth_error = f"Invalid API key credentials or key not found in namespace {self.api_key_service.namespace}"
                         
@@ -184,15 +184,17 @@ class AuthMiddleware(BaseHTTPMiddleware):
         
         # Check authentication result
         if not auth_success:
-            logger.warning(f"Authentication failed for {request.method} {path}: {auth_error}")
-            return JSONResponse(
-                status_code=401,
-                content={"detail": auth_error}
-            )
+            logger.warning(f"Authentication failed for {scope['method']} {path}: {auth_error}")
+            await self._reject(scope, receive, send, auth_error)
+            return
         
         # Authentication successful, continue to the next middleware/route handler
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, detail: str) -> None:
+        response = JSONResponse(status_code=401, content={"detail": detail})
+        await response(scope, receive, send)
 
 
 def add_auth_to_routes(router: APIRouter) -> None:
@@ -1,13 +1,12 @@
 import logging
 from typing import Optional
 
+from .log_pipeline import start_logging
+
 # Configure logging
 def setup_logging(logger_name: Optional[str] = None) -> logging.Logger:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(levelname)s\t%(asctime)s:\t%(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    # Records are formatted and written by a background thread (see log_pipeline)
+    start_logging(level=logging.INFO)
     
     # Quiet noisy helm command logging from pyhelm3
     logging.getLogger("pyhelm3").setLevel(logging.WARNING)
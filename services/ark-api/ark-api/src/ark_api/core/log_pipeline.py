@@ -0,0 +1,163 @@
+"""Non-blocking logging pipeline.
+
+Log records are put on an in-memory queue by a QueueHandler on the root logger and
+written to stderr by a QueueListener thread, so formatting and stream writes never
+run on the event loop; only the message and any traceback text are rendered by the
+logging thread, as the record must not hold references to live objects. Records below WARNING are rate limited per call site, so a
+line logged on every request cannot flood the output.
+
+Environment Variables:
+    LOG_FORMAT: "text" (default) or "json" for one JSON object per line
+    LOG_RATE_LIMIT_PER_SECOND: INFO/DEBUG lines per second allowed from one call site,
+        0 disables the limit (default 100)
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, TextIO, Tuple
+
+TEXT_FORMAT = "%(levelname)s\t%(asctime)s:\t%(message)s"
+TEXT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_RATE_LIMIT_PER_SECOND = float(os.getenv("LOG_RATE_LIMIT_PER_SECOND", "100"))
+
+# Attributes every LogRecord has; anything else was passed with `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats a record as one JSON object, including fields passed with `extra`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Drops records below WARNING beyond `rate` per second from the same call site.
+
+    The number of dropped records is appended to the next record let through.
+    """
+
+    def __init__(self, rate: Optional[float] = None, clock=time.monotonic):
+        super().__init__()
+        self.rate = LOG_RATE_LIMIT_PER_SECOND if rate is None else rate
+        self._clock = clock
+        # call site -> (window start, records in window, suppressed records)
+        self._windows: Dict[Tuple[str, int], Tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate <= 0 or record.levelno >= logging.WARNING:
+            return True
+        key = (record.pathname, record.lineno)
+        now = self._clock()
+        with self._lock:
+            start, count, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - start >= 1.0:
+                start, count = now, 0
+            if count >= self.rate:
+                self._windows[key] = (start, count, suppressed + 1)
+                return False
+            self._windows[key] = (start, count + 1, 0)
+        if suppressed:
+            record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+        return True
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queues records with their message and traceback rendered but not formatted.
+
+    The stock prepare() runs the full formatter on the logging thread and folds the
+    traceback into the message, which hides it from JSONFormatter.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queued_loggers: Dict[str, logging.Handler] = {}
+
+
+def make_formatter(log_format: str = LOG_FORMAT) -> logging.Formatter:
+    if log_format == "json":
+        return JSONFormatter()
+    return logging.Formatter(TEXT_FORMAT, datefmt=TEXT_DATE_FORMAT)
+
+
+def start_logging(level: int = logging.INFO, log_format: str = LOG_FORMAT, stream: Optional[TextIO] = None) -> None:
+    """Route the root logger and uvicorn's loggers through the queue; idempotent.
+
+    Records are written to `stream`, stderr by default.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(make_formatter(log_format))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    loggers = [root]
+    # uvicorn installs its own stream handlers before the app is imported
+    for name in ("uvicorn", "uvicorn.access"):
+        if logging.getLogger(name).handlers:
+            loggers.append(logging.getLogger(name))
+    for queued in loggers:
+        queued.handlers = [queue_handler]
+        _queued_loggers[queued.name] = stream_handler
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Write queued records and stop the listener thread; call on shutdown.
+
+    Records logged afterwards are written directly, without the queue.
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+    for name, stream_handler in _queued_loggers.items():
+        logging.getLogger(name if name != "root" else None).handlers = [stream_handler]
+    _queued_loggers.clear()
@@ -0,0 +1,106 @@
+"""Request logging middleware.
+
+Plain ASGI middleware: `receive` is passed to the application untouched and `send`
+is only observed for the response status, so streaming responses (SSE) flow through
+without extra tasks or buffering.
+
+Environment Variables:
+    LOG_REQUEST_SAMPLING: Comma-separated `path-prefix=rate` pairs, e.g.
+        "/health=0,/v1/queries=0.1"; the longest matching prefix decides the share of
+        requests logged (default: all requests)
+    LOG_SLOW_REQUEST_SECONDS: Requests whose response starts later than this are
+        always logged at WARNING, whatever their sampling rate (default 1.0)
+"""
+
+import logging
+import os
+import random
+import time
+from typing import List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("ark-api")
+
+LOG_REQUEST_SAMPLING = os.getenv("LOG_REQUEST_SAMPLING", "")
+LOG_SLOW_REQUEST_SECONDS = float(os.getenv("LOG_SLOW_REQUEST_SECONDS", "1.0"))
+
+
+def parse_sampling(spec: str) -> List[Tuple[str, float]]:
+    """Parse `prefix=rate` pairs into rules ordered longest prefix first."""
+    rules = []
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        prefix, _, rate = item.partition("=")
+        try:
+            rules.append((prefix.strip(), min(1.0, max(0.0, float(rate)))))
+        except ValueError:
+            logger.warning(f"Ignoring invalid LOG_REQUEST_SAMPLING entry: {item!r}")
+    return sorted(rules, key=lambda rule: len(rule[0]), reverse=True)
+
+
+class RequestLoggingMiddleware:
+    """Logs sampled HTTP requests, and every slow one, with session, status and timing."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sampling: Optional[str] = None,
+        slow_request_seconds: Optional[float] = None
+    ):
+        self.app = app
+        self.rules = parse_sampling(LOG_REQUEST_SAMPLING if sampling is None else sampling)
+        self.slow_request_seconds = LOG_SLOW_REQUEST_SECONDS if slow_request_seconds is None else slow_request_seconds
+
+    def sample_rate(self, path: str) -> float:
+        for prefix, rate in self.rules:
+            if path.startswith(prefix):
+                return rate
+        return 1.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        rate = self.sample_rate(path)
+        sampled = logger.isEnabledFor(logging.INFO) and (rate >= 1.0 or random.random() < rate)
+
+        session_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-session-id":
+                session_id = value.decode("latin-1")
+                break
+        session_info = f"session={session_id}" if session_id else "no-session"
+        query = scope.get("query_string", b"").decode("latin-1")
+        fields = {"method": method, "path": path, "session_id": session_id, "query": query}
+        if sampled:
+            logger.info(f"Request: {method} {path} - {session_info} - Query: {query}", extra=fields)
+
+        status_code = 500
+        response_started: Optional[float] = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_started = time.perf_counter()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            end_time = time.perf_counter()
+            process_time = end_time - start_time
+            # Streaming responses run as long as the stream; slowness is time to the first byte
+            first_byte_time = (response_started or end_time) - start_time
+            fields.update(status=status_code, duration=round(process_time, 6), time_to_first_byte=round(first_byte_time, 6))
+            line = f"{method} {path} - {session_info} - Status: {status_code} - Time: {process_time:.3f}s"
+            if first_byte_time > self.slow_request_seconds:
+                logger.warning(f"Slow request: {line} - First byte: {first_byte_time:.3f}s", extra=fields)
+            elif sampled:
+                logger.info(f"Response: {line}", extra=fields)
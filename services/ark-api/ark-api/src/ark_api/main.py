@@ -1,5 +1,4 @@
 import os
-import time
 from contextlib import asynccontextmanager
 from importlib.metadata import version, PackageNotFoundError
 from fastapi import FastAPI, Request
@@ -10,7 +9,7 @@ from fastapi.responses import JSONResponse
 from kubernetes_asyncio import client
 from dotenv import load_dotenv
 from typing import Dict, Any
-from opentelemetry import baggage, propagate, trace
+from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
@@ -21,11 +20,17 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from .api import router
 from .core.config import setup_logging
 from .auth.middleware import AuthMiddleware
+from .core.middleware import RequestLoggingMiddleware
 from .auth.constants import AuthMode
 from .auth.config import get_public_routes
 from .openapi.security import add_security_to_openapi
 from .api.v1.a2a_gateway import get_a2a_manager
+from .services.api_keys import close_last_used_recorder, close_verified_key_cache
+from .utils.query_watch import close_query_watcher
+from ark_sdk import instrumentation
 from ark_sdk.k8s import init_k8s
+from ark_sdk.streaming_config import close_streaming_resolver
+from ark_sdk.versions import close_async_api_client
 
 # Load environment variables from .env file
 load_dotenv()
@@ -64,21 +69,10 @@ def setup_telemetry():
     span_processor = BatchSpanProcessor(otlp_exporter)
     tracer_provider.add_span_processor(span_processor)
     
-    logger.info(f"Telemetry initialized for {service_name} -> {otel_endpoint}")
-
-
-def extract_session_context(request: Request):
-    """Extract OTEL context and session ID from request headers"""
-    # Extract OTEL trace context from headers
-    ctx = propagate.extract(request.headers)
-    
-    # Extract session ID from custom header
-    session_id = request.headers.get("x-session-id")
-    if session_id:
-        # Add session to baggage
-        ctx = baggage.set_baggage("session.id", session_id, context=ctx)
+    # Record a span for every Kubernetes API call made through the SDK
+    instrumentation.enable_tracing()
     
-    return ctx, session_id
+    logger.info(f"Telemetry initialized for {service_name} -> {otel_endpoint}")
 
 
 @asynccontextmanager
@@ -105,7 +99,14 @@ async def lifespan(app: FastAPI):
     # Shutdown A2A manager
     await a2a_manager.shutdown()
     
-    # Close all kubernetes async clients
+    # Write pending API key last-used times
+    await close_last_used_recorder()
+    
+    # Stop query, streaming config and API key watches, then close all kubernetes async clients
+    await close_query_watcher()
+    await close_streaming_resolver()
+    await close_verified_key_cache()
+    await close_async_api_client()
     await client.ApiClient().close()
 
 
@@ -196,30 +197,8 @@ app.include_router(router)
 # Add global authentication middleware (protects all routes by default except PUBLIC_ROUTES)
 app.add_middleware(AuthMiddleware)
 
-
-@app.middleware("http")
-async def session_aware_middleware(request: Request, call_next):
-    """Middleware for session tracking and request timing with OTEL context"""
-    start_time = time.time()
-    
-    # Extract OTEL context and session ID
-    otel_ctx, session_id = extract_session_context(request)
-    
-    # Add session info to logs
-    session_info = f"session={session_id}" if session_id else "no-session"
-    logger.info(
-        f"Request: {request.method} {request.url.path} - {session_info} - Query: {dict(request.query_params)}"
-    )
-    
-    # Process request with OTEL context
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    logger.info(
-        f"Response: {request.method} {request.url.path} - {session_info} - Status: {response.status_code} - Time: {process_time:.3f}s"
-    )
-    
-    return response
+# Log requests with session and timing; outermost, so rejected requests are logged too
+app.add_middleware(RequestLoggingMiddleware)
 
 
 # Custom exception handler for validation errors
@@ -2,7 +2,7 @@
 
 from typing import List, Dict, Optional, Any, Union
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 from openai.types.chat import ChatCompletionMessageParam
 from .agents import AgentOverride
@@ -87,8 +87,15 @@ class QueryResponse(BaseModel):
 
 class QueryListResponse(BaseModel):
     """Response for listing queries."""
+    model_config = ConfigDict(populate_by_name=True)
+
     items: List[QueryResponse]
     count: int
+    continue_: Optional[str] = Field(
+        None,
+        alias="continue",
+        description="Token for fetching the next page; only set for paginated requests with more results"
+    )
 
 
 class QueryCreateRequest(BaseModel):
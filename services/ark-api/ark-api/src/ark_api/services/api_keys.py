@@ -1,17 +1,35 @@
-"""API key management service."""
+"""API key management service.
 
+Verified credentials are cached process-wide for a short TTL, keyed by an HMAC of the
+namespace and key pair, so repeated Basic-auth requests skip the Secret read and bcrypt.
+API key Secrets are watched while credentials are cached: revoking, deleting or
+re-hashing a key drops its entries at once. Cache misses run bcrypt on a small
+dedicated thread pool (bcrypt releases the GIL), never on the event loop.
+
+Last-used times are recorded in memory and written behind by a background task, at
+most one Secret patch per key per flush interval, with a final flush on shutdown.
+"""
+
+import asyncio
 import secrets
 import bcrypt
 import base64
+import hashlib
+import hmac
 import json
 import logging
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Tuple, Dict, Any
-from kubernetes_asyncio import client
+from typing import Optional, Tuple, Dict, Any, Awaitable, Callable, Set
+from kubernetes_asyncio import client, watch
 from kubernetes_asyncio.client.api_client import ApiClient
 
 from ark_sdk.k8s import get_context
+from ark_sdk.versions import get_async_api_client
 
 from ..models.auth import (
     APIKeyCreateRequest,
@@ -35,6 +53,334 @@ API_KEY_ANNOTATION = ARK_PREFIX + "api-key-metadata"  # JSON annotation with all
 PUBLIC_KEY_TOKEN_LENGTH = 32  # bytes for public key token generation
 SECRET_KEY_TOKEN_LENGTH = 48  # bytes for secret key token generation
 
+# Seconds a verified key pair is trusted without re-reading its Secret
+API_KEY_CACHE_TTL_SECONDS = float(os.getenv("ARK_API_KEY_CACHE_TTL_SECONDS", "60"))
+# Number of verified key pairs remembered
+API_KEY_CACHE_SIZE = int(os.getenv("ARK_API_KEY_CACHE_SIZE", "1024"))
+# Threads running bcrypt; bounds the CPU spent on cache misses
+API_KEY_VERIFY_WORKERS = int(os.getenv("ARK_API_KEY_VERIFY_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Server-side timeout of a single API key Secret watch; it is resumed afterwards
+WATCH_TIMEOUT_SECONDS = 300
+# Seconds between writes of recorded last-used times; each key is patched at most once per interval
+API_KEY_LAST_USED_FLUSH_SECONDS = float(os.getenv("ARK_API_KEY_LAST_USED_FLUSH_SECONDS", "60"))
+
+
+def _credential_fingerprint(data: Optional[Dict[str, str]], annotations: Optional[Dict[str, str]]) -> Tuple:
+    """Fields of an API key Secret that decide whether a key pair is valid.
+
+    Works on the base64 `data` of both a V1Secret and a raw watch object, and leaves
+    out lastUsedAt so that recording usage does not invalidate cached credentials.
+    """
+    data = data or {}
+    try:
+        metadata = json.loads((annotations or {}).get(API_KEY_ANNOTATION) or "{}")
+    except ValueError:
+        metadata = {}
+    return (
+        data.get("public_key"),
+        data.get("secret_key_hash"),
+        data.get("is_active"),
+        metadata.get("expiresAt"),
+        metadata.get("deletedAt")
+    )
+
+
+@dataclass
+class _VerifiedKey:
+    value: Dict[str, Any]
+    namespace: str
+    secret_name: str
+    fingerprint: Tuple
+    expires_at: float
+
+
+class VerifiedAPIKeyCache:
+    """Key pairs that passed bcrypt verification, shared by all APIKeyService instances.
+
+    Entries are keyed by an HMAC-SHA256 of (namespace, public key, secret key) under a
+    per-process random key, so secret keys are never held in memory or compared in
+    plain text. An entry lives at most `ttl` seconds and never past the key's own
+    expiry. While a namespace has entries its API key Secrets are watched, and an
+    entry is dropped as soon as its Secret is deleted or its hash, active flag, expiry
+    or deletion mark changes. The watch stops when the namespace's last entry is
+    dropped; expired entries are dropped when they are next looked up or evicted.
+    Only successful verifications are cached; concurrent misses for the same key pair
+    share one verification. A verification is not cached if its Secret changed while
+    bcrypt was running.
+    """
+
+    def __init__(
+        self,
+        ttl: float = API_KEY_CACHE_TTL_SECONDS,
+        max_size: int = API_KEY_CACHE_SIZE,
+        watch_changes: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.watch_changes = watch_changes
+        self._clock = clock
+        self._hmac_key = secrets.token_bytes(32)
+        self._entries: Dict[bytes, _VerifiedKey] = {}
+        self._by_secret: Dict[Tuple[str, str], Set[bytes]] = {}
+        self._pending: Dict[bytes, asyncio.Future] = {}
+        self._watches: Dict[str, asyncio.Task] = {}
+        self._namespace_sizes: Dict[str, int] = {}
+        # Fingerprint of the latest change to each Secret (None once deleted), recorded
+        # while verifications are running so that they do not cache what they read before
+        self._loading = 0
+        self._changed: Dict[Tuple[str, str], Optional[Tuple]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, namespace: str, public_key: str, secret_key: str) -> bytes:
+        message = "\0".join((namespace, public_key, secret_key)).encode("utf-8")
+        return hmac.new(self._hmac_key, message, hashlib.sha256).digest()
+
+    async def get(
+        self,
+        key: bytes,
+        verify: Callable[[], Awaitable[Optional[Tuple[Dict[str, Any], str, Tuple, Optional[str]]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached API key data for `key`, or run `verify` and cache a success.
+
+        `verify` returns None for invalid credentials, otherwise the API key data, the
+        Secret's namespace, its fingerprint and its resourceVersion.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > self._clock():
+                self.hits += 1
+                return dict(entry.value)
+            self._drop(key)
+        pending = self._pending.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = asyncio.ensure_future(self._load(key, verify))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        value = await asyncio.shield(pending)
+        return dict(value) if value is not None else None
+
+    def invalidate(self, namespace: Optional[str] = None, secret_name: Optional[str] = None) -> None:
+        """Drop the entries of one Secret, of a namespace, or all entries."""
+        if namespace is not None and secret_name is not None:
+            keys = list(self._by_secret.get((namespace, secret_name), ()))
+        else:
+            keys = [k for k, e in self._entries.items() if namespace is None or e.namespace == namespace]
+        for key in keys:
+            self._drop(key)
+
+    async def close(self) -> None:
+        """Stop all watches and clear the cache."""
+        tasks = list(self._watches.values())
+        self._watches.clear()
+        self.invalidate()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _load(self, key: bytes, verify: Callable[[], Awaitable[Any]]) -> Optional[Dict[str, Any]]:
+        self._loading += 1
+        try:
+            result = await verify()
+            if result is None:
+                return None
+            value, namespace, fingerprint, resource_version = result
+            secret = (namespace, value["secret_name"])
+            changed = secret in self._changed and self._changed[secret] != fingerprint
+        finally:
+            self._loading -= 1
+            if not self._loading:
+                self._changed.clear()
+        if changed:
+            # Revoked or re-hashed after it was read; the next request verifies again
+            logger.debug(f"API key cache: secret {secret[0]}/{secret[1]} changed during verification")
+            return value
+        ttl = self.ttl
+        expires_at = value.get("expires_at")
+        if expires_at is not None:
+            ttl = min(ttl, (expires_at - datetime.now(timezone.utc)).total_seconds())
+        if ttl <= 0:
+            return value
+        self._drop(key)
+        while len(self._entries) >= self.max_size:
+            self._drop(next(iter(self._entries)))
+        self._entries[key] = _VerifiedKey(value, namespace, secret[1], fingerprint, self._clock() + ttl)
+        self._by_secret.setdefault(secret, set()).add(key)
+        self._namespace_sizes[namespace] = self._namespace_sizes.get(namespace, 0) + 1
+        if self.watch_changes and namespace not in self._watches:
+            self._watches[namespace] = asyncio.ensure_future(self._watch(namespace, resource_version))
+        return value
+
+    def _drop(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._by_secret.get((entry.namespace, entry.secret_name))
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_secret[(entry.namespace, entry.secret_name)]
+        remaining = self._namespace_sizes.pop(entry.namespace) - 1
+        if remaining:
+            self._namespace_sizes[entry.namespace] = remaining
+            return
+        # Nothing cached in the namespace is left to invalidate; the next entry watches afresh
+        task = self._watches.pop(entry.namespace, None)
+        if task is not None:
+            task.cancel()
+
+    def _on_event(self, namespace: str, event_type: str, obj: Dict[str, Any]) -> None:
+        metadata = obj.get('metadata') or {}
+        secret = (namespace, metadata.get('name'))
+        if not self._loading and secret not in self._by_secret:
+            return
+        fingerprint = None
+        if event_type != 'DELETED':
+            fingerprint = _credential_fingerprint(obj.get('data'), metadata.get('annotations'))
+        if self._loading:
+            self._changed[secret] = fingerprint
+        for key in list(self._by_secret.get(secret, ())):
+            if fingerprint is None or self._entries[key].fingerprint != fingerprint:
+                logger.debug(f"API key cache: secret {namespace}/{metadata.get('name')} {event_type.lower()}")
+                self._drop(key)
+
+    async def _watch(self, namespace: str, resource_version: Optional[str]) -> None:
+        """Apply changes to API key Secrets in `namespace` to the cached entries."""
+        try:
+            api = client.CoreV1Api(await get_async_api_client())
+            while True:
+                w = watch.Watch()
+                try:
+                    async for event in w.stream(
+                        api.list_namespaced_secret,
+                        namespace=namespace,
+                        label_selector=f"{API_KEY_TYPE}=true",
+                        resource_version=resource_version,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=WATCH_TIMEOUT_SECONDS
+                    ):
+                        obj = event['raw_object']
+                        resource_version = (obj.get('metadata') or {}).get('resourceVersion') or resource_version
+                        if event['type'] in ('MODIFIED', 'DELETED'):
+                            self._on_event(namespace, event['type'], obj)
+                finally:
+                    await w.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Includes 410 Gone; changes may have been missed, so start over on the next miss
+            logger.debug(f"API key secret watch in {namespace} stopped: {e}")
+            if self._watches.get(namespace) is asyncio.current_task():
+                del self._watches[namespace]
+                self.invalidate(namespace)
+
+
+_verified_keys: Optional[VerifiedAPIKeyCache] = None
+_verify_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_verified_key_cache() -> VerifiedAPIKeyCache:
+    """Process-wide cache of verified API key pairs."""
+    global _verified_keys
+    if _verified_keys is None:
+        _verified_keys = VerifiedAPIKeyCache()
+    return _verified_keys
+
+
+async def close_verified_key_cache() -> None:
+    """Stop the Secret watches of the shared cache and the bcrypt pool; call on shutdown."""
+    global _verified_keys, _verify_executor
+    if _verified_keys is not None:
+        await _verified_keys.close()
+        _verified_keys = None
+    if _verify_executor is not None:
+        _verify_executor.shutdown(wait=False, cancel_futures=True)
+        _verify_executor = None
+
+
+async def _run_bcrypt(func: Callable, *args: Any) -> Any:
+    """Run a bcrypt call on the bounded verification pool."""
+    global _verify_executor
+    if _verify_executor is None:
+        _verify_executor = ThreadPoolExecutor(max_workers=API_KEY_VERIFY_WORKERS, thread_name_prefix="api-key-bcrypt")
+    return await asyncio.get_running_loop().run_in_executor(_verify_executor, func, *args)
+
+
+class LastUsedRecorder:
+    """Write-behind table of API key last-used times.
+
+    Authentication only records the time in memory; a background task started on the
+    first record writes the latest time of every used key every `interval` seconds, so
+    a key busy with many requests costs one Secret patch per interval instead of one
+    per request. close() writes whatever is still pending.
+    """
+
+    def __init__(self, interval: float = API_KEY_LAST_USED_FLUSH_SECONDS):
+        self.interval = interval
+        self._pending: Dict[Tuple[str, str], Tuple["APIKeyService", datetime]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.writes = 0
+
+    def record(self, service: "APIKeyService", secret_name: str, used_at: Optional[datetime] = None) -> None:
+        self._pending[(service.namespace, secret_name)] = (service, used_at or datetime.now(timezone.utc))
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def flush(self) -> None:
+        """Write all recorded times now."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        self.writes += len(pending)
+        await asyncio.gather(*(
+            service._update_last_used(secret_name, used_at)
+            for (_, secret_name), (service, used_at) in pending.items()
+        ))
+
+    async def close(self) -> None:
+        """Stop the background task and flush pending times."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing API key last used times: {e}")
+
+
+_last_used: Optional[LastUsedRecorder] = None
+
+
+def get_last_used_recorder() -> LastUsedRecorder:
+    """Process-wide write-behind table of API key last-used times."""
+    global _last_used
+    if _last_used is None:
+        _last_used = LastUsedRecorder()
+    return _last_used
+
+
+async def close_last_used_recorder() -> None:
+    """Flush recorded last-used times; call on shutdown."""
+    global _last_used
+    if _last_used is not None:
+        await _last_used.close()
+        _last_used = None
+
 
 class APIKeyService:
     """Service for managing API keys stored as Kubernetes secrets."""
@@ -215,7 +561,7 @@ class APIKeyService:
         """
         # Generate key pair
         public_key, secret_key = self._generate_key_pair()
-        secret_key_hash = self._hash_secret_key(secret_key)
+        secret_key_hash = await _run_bcrypt(self._hash_secret_key, secret_key)
         
         # Prepare metadata
         now = datetime.now(timezone.utc)
@@ -336,6 +682,15 @@ class APIKeyService:
         Returns:
             Dictionary with API key data or None if not found
         """
+        found = await self._read_api_key(public_key)
+        return found[0] if found else None
+    
+    async def _read_api_key(self, public_key: str) -> Optional[Tuple[Dict[str, Any], Tuple, Optional[str]]]:
+        """Read an API key Secret.
+        
+        Returns:
+            Tuple of (API key data, credential fingerprint, resourceVersion) or None
+        """
         secret_name = self._secret_name_from_public_key(public_key)
         
         try:
@@ -376,7 +731,7 @@ class APIKeyService:
             if expires_at and expires_at < datetime.now(timezone.utc):
                 return None
             
-            return {
+            api_key_data = {
                 "id": str(secret.metadata.uid),
                 "name": metadata["name"],
                 "public_key": public_key,
@@ -385,6 +740,7 @@ class APIKeyService:
                 "expires_at": expires_at,
                 "secret_name": secret_name
             }
+            return api_key_data, _credential_fingerprint(data, annotations), secret.metadata.resource_version
             
         except client.rest.ApiException as e:
             if e.status == 404:
@@ -405,27 +761,49 @@ class APIKeyService:
         Returns:
             API key data if valid, None otherwise
         """
-        api_key_data = await self.get_api_key_by_public_key(public_key)
+        cache = get_verified_key_cache()
+        api_key_data = await cache.get(
+            cache.key(self.namespace, public_key, secret_key),
+            lambda: self._verify_uncached(public_key, secret_key)
+        )
         if not api_key_data:
             return None
         
-        # Verify secret key
-        if not self._verify_secret_key(secret_key, api_key_data["secret_key_hash"]):
+        # Record last used timestamp; written to the Secret by the next flush
+        get_last_used_recorder().record(self, api_key_data["secret_name"])
+        
+        return api_key_data
+    
+    async def _verify_uncached(self, public_key: str, secret_key: str) -> Optional[Tuple[Dict[str, Any], str, Tuple, Optional[str]]]:
+        """Read the key's Secret and check the secret key with bcrypt off the event loop.
+        
+        Returns:
+            The entry for VerifiedAPIKeyCache.get, or None if the credentials are invalid
+        """
+        found = await self._read_api_key(public_key)
+        if not found:
             return None
+        api_key_data, fingerprint, resource_version = found
         
-        # Update last used timestamp
-        await self._update_last_used(api_key_data["secret_name"])
+        # Verify secret key
+        if not await _run_bcrypt(self._verify_secret_key, secret_key, api_key_data["secret_key_hash"]):
+            return None
         
-        return api_key_data
+        return api_key_data, self.namespace, fingerprint, resource_version
     
-    async def _update_last_used(self, secret_name: str) -> None:
+    async def _update_last_used(self, secret_name: str, used_at: Optional[datetime] = None) -> None:
         """Update the last used timestamp for an API key.
         
+        Only the metadata annotation is patched, guarded by the resourceVersion that was
+        read, so a concurrent delete is never overwritten. Called by LastUsedRecorder.
+        
         Args:
             secret_name: The Kubernetes secret name
+            used_at: Time the key was last used, defaults to now
         """
         try:
             now = datetime.now(timezone.utc)
+            used_at = used_at or now
             
             async with ApiClient() as api:
                 v1 = client.CoreV1Api(api)
@@ -441,28 +819,39 @@ class APIKeyService:
                 api_key_json = annotations.get(API_KEY_ANNOTATION, "{}")
                 metadata = self._parse_api_key_annotation(api_key_json)
                 
+                # Deleted keys keep their last use; another replica may have written a later one
+                if metadata["deleted_at"] is not None:
+                    return
+                if metadata["last_used_at"] and metadata["last_used_at"] >= used_at:
+                    return
+                
                 # Update last used timestamp
                 updated_json = self._create_api_key_annotation(
                     name=metadata["name"],
                     created_at=metadata["created_at"] or now,
                     expires_at=metadata["expires_at"],
-                    last_used_at=now,
+                    last_used_at=used_at,
                     deleted_at=metadata["deleted_at"]
                 )
                 
-                # Update annotations
-                if not secret.metadata.annotations:
-                    secret.metadata.annotations = {}
-                
-                secret.metadata.annotations[API_KEY_ANNOTATION] = updated_json
-                
-                # Patch the secret
+                # Patch the annotation only
                 await v1.patch_namespaced_secret(
                     name=secret_name,
                     namespace=self.namespace,
-                    body=secret
+                    body={
+                        "metadata": {
+                            "resourceVersion": secret.metadata.resource_version,
+                            "annotations": {API_KEY_ANNOTATION: updated_json}
+                        }
+                    }
                 )
                 
+        except client.rest.ApiException as e:
+            if e.status in (404, 409):
+                # Key removed or changed since the read; its last use is not worth a retry
+                logger.debug(f"Skipped last used timestamp for {secret_name}: {e.status}")
+                return
+            logger.error(f"Error updating last used timestamp for {secret_name}: {e}")
         except Exception as e:
             logger.error(f"Error updating last used timestamp for {secret_name}: {e}")
     
@@ -521,6 +910,8 @@ class APIKeyService:
                     body=secret
                 )
             
+            # Revoke cached credentials now rather than when the watch event arrives
+            get_verified_key_cache().invalidate(self.namespace, secret_name)
             logger.info(f"Soft deleted API key {public_key}")
             return True
             
@@ -92,12 +92,12 @@ async def get_all_memory_resources(client, memory_filter: Optional[str] = None):
     Returns:
         List of memory resource dictionaries
     """
-    memories = await client.memories.a_list()
+    memories = await client.memories.a_list_raw()
     
     if memory_filter:
         memories = [
             m for m in memories 
-            if m.to_dict().get("metadata", {}).get("name") == memory_filter
+            if m.get("metadata", {}).get("name") == memory_filter
         ]
     
-    return [memory.to_dict() for memory in memories]
\ No newline at end of file
+    return memories
\ No newline at end of file
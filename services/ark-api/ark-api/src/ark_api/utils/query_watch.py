@@ -1,17 +1,30 @@
-"""Query polling utilities for waiting on query completion."""
+"""Utilities for waiting on query completion.
 
+Environment Variables:
+    ARK_QUERY_WATCH_IDLE_SECONDS: How long the query watch of a namespace is kept
+        open after its last waiter is done (default 300)
+"""
+
+import asyncio
 import logging
+import os
 import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
 from fastapi import HTTPException
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
 from openai.types.chat.chat_completion import Choice
 from openai.types.completion_usage import CompletionUsage
-from kubernetes_asyncio import client, watch
-
-from ark_api.core.constants import GROUP
 
 logger = logging.getLogger(__name__)
 
+# Keeping an idle watch open spares the next completion a new watch and its initial list
+QUERY_WATCH_IDLE_SECONDS = float(os.getenv("ARK_QUERY_WATCH_IDLE_SECONDS", "300"))
+# Finished queries nobody waits for yet, kept per namespace for waits that register late
+RECENTLY_FINISHED_SIZE = 1024
+
 
 def _create_chat_completion_response(query_name: str, model: str, content: str, messages: list, query_status: dict = None) -> ChatCompletion:
     """Create OpenAI-compatible chat completion response."""
@@ -75,46 +88,185 @@ def _get_error_detail(status: dict) -> dict:
     }
 
 
-async def watch_query_completion(ark_client, query_name: str, model: str, messages: list, timeout_seconds: int) -> ChatCompletion:
-    """Watch for query completion using Kubernetes watch API and return chat completion response."""
-    namespace = ark_client.namespace
+def _is_query_finished(query: dict) -> bool:
+    """Whether a raw query object has reached a terminal phase."""
+    return (query.get("status") or {}).get("phase") in ("done", "error")
 
-    api_client = client.ApiClient()
-    custom_api = client.CustomObjectsApi(api_client)
-    w = watch.Watch()
 
-    try:
-        async for event in w.stream(
-            custom_api.list_namespaced_custom_object,
-            group=GROUP,
-            version="v1alpha1",
-            namespace=namespace,
-            plural="queries",
-            field_selector=f"metadata.name={query_name}",
-            timeout_seconds=timeout_seconds
-        ):
-            event_type = event['type']
-            query_obj = event['object']
-
-            status = query_obj.get("status", {})
-            phase = status.get("phase", "pending")
-
-            if phase == "done":
-                response = status.get("response")
-                if not response:
-                    w.stop()
-                    raise HTTPException(status_code=500, detail="No response received")
-
-                content = response.get("content", "")
-                w.stop()
-                return _create_chat_completion_response(query_name, model, content, messages, status)
-
-            elif phase == "error":
-                error_detail = _get_error_detail(status)
-                w.stop()
-                raise HTTPException(status_code=500, detail=error_detail)
+@dataclass
+class _NamespaceWatch:
+    task: Optional[asyncio.Task] = None
+    waiters: Dict[str, List[asyncio.Future]] = field(default_factory=dict)
+    finished: "OrderedDict[str, Any]" = field(default_factory=OrderedDict)
+    idle_handle: Optional[asyncio.TimerHandle] = None
+
+
+class QueryCompletionWatcher:
+    """Waits for queries to finish using one shared watch per namespace.
+
+    The first wait in a namespace starts a watch on all of its queries; it begins with
+    the current queries, resumes from the last resourceVersion after a disconnect and
+    starts over from the current state when that version has expired (410 Gone).
+    Waits register a future under the query name, which is resolved by the first event
+    with a terminal phase. Queries that finish before anyone waits for them are kept
+    for a while, so a wait registered late still returns. The watch is stopped
+    `idle_seconds` after its last waiter is done. Events are kept as raw dicts: the
+    watch sees every update of every query in the namespace, including all of them
+    on each (re)start, and most are never waited for.
+    """
+
+    def __init__(self, idle_seconds: float = QUERY_WATCH_IDLE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self._watches: Dict[str, _NamespaceWatch] = {}
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    async def wait(self, queries, name: str, timeout: Optional[float] = None):
+        """Wait until query `name` is done or failed and return it as a raw dict.
+
+        `queries` is the SDK query client of the namespace to watch. Raises
+        TimeoutError when `timeout` seconds pass first, and an exception if the query
+        is deleted or the watch fails.
+        """
+        namespace = queries.namespace
+        watch = self._watches.get(namespace)
+        if watch is None:
+            watch = _NamespaceWatch()
+            watch.task = asyncio.ensure_future(self._watch(queries, namespace, watch))
+            self._watches[namespace] = watch
+        if watch.idle_handle is not None:
+            watch.idle_handle.cancel()
+            watch.idle_handle = None
+
+        future = asyncio.get_running_loop().create_future()
+        finished = watch.finished.pop(name, None)
+        if finished is not None:
+            future.set_result(finished)
+        else:
+            watch.waiters.setdefault(name, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out after {timeout}s waiting for Query '{name}' in namespace '{namespace}'")
+        finally:
+            self._release(namespace, watch, name, future)
+
+    async def close(self) -> None:
+        """Stop all watches; pending waits are cancelled."""
+        watches, self._watches = list(self._watches.values()), {}
+        for watch in watches:
+            if watch.idle_handle is not None:
+                watch.idle_handle.cancel()
+            for futures in watch.waiters.values():
+                for future in futures:
+                    future.cancel()
+            watch.waiters.clear()
+            watch.task.cancel()
+        await asyncio.gather(*(watch.task for watch in watches), return_exceptions=True)
 
+    async def _watch(self, queries, namespace: str, watch: _NamespaceWatch) -> None:
+        events = queries.a_watch(namespace=namespace, raw=True)
+        try:
+            async for event in events:
+                if event.type != "BOOKMARK":
+                    self._on_event(namespace, watch, event)
+            raise Exception("watch ended unexpectedly")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Waits fail rather than time out; the next wait starts a new watch
+            logger.warning(f"Query watch in namespace '{namespace}' failed: {e}")
+            if self._watches.get(namespace) is watch:
+                del self._watches[namespace]
+            for futures in watch.waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            watch.waiters.clear()
+        finally:
+            await events.aclose()
+
+    def _on_event(self, namespace: str, watch: _NamespaceWatch, event) -> None:
+        name = (event.raw_object.get("metadata") or {}).get("name")
+        if event.type == "DELETED":
+            watch.finished.pop(name, None)
+            self._resolve(watch, name, error=Exception(f"Query '{name}' was deleted in namespace '{namespace}'"))
+        elif _is_query_finished(event.raw_object):
+            if not self._resolve(watch, name, result=event.raw_object):
+                watch.finished[name] = event.raw_object
+                watch.finished.move_to_end(name)
+                while len(watch.finished) > RECENTLY_FINISHED_SIZE:
+                    watch.finished.popitem(last=False)
+        else:
+            watch.finished.pop(name, None)
+
+    def _resolve(self, watch: _NamespaceWatch, name: str, result: Any = None, error: Optional[Exception] = None) -> bool:
+        """Complete the waits for `name`; returns whether there were any."""
+        futures = watch.waiters.pop(name, None)
+        if not futures:
+            return False
+        for future in futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        return True
+
+    def _release(self, namespace: str, watch: _NamespaceWatch, name: str, future: asyncio.Future) -> None:
+        """Forget a finished wait and schedule the idle stop after the last one."""
+        futures = watch.waiters.get(name)
+        if futures is not None and future in futures:
+            futures.remove(future)
+            if not futures:
+                del watch.waiters[name]
+        if not watch.waiters and watch.idle_handle is None and self._watches.get(namespace) is watch:
+            watch.idle_handle = asyncio.get_running_loop().call_later(self.idle_seconds, self._stop_idle, namespace, watch)
+
+    def _stop_idle(self, namespace: str, watch: _NamespaceWatch) -> None:
+        watch.idle_handle = None
+        if watch.waiters or self._watches.get(namespace) is not watch:
+            return
+        logger.debug(f"Stopping idle query watch in namespace '{namespace}'")
+        del self._watches[namespace]
+        watch.task.cancel()
+
+
+_query_watcher: Optional[QueryCompletionWatcher] = None
+
+
+def get_query_watcher() -> QueryCompletionWatcher:
+    """Process-wide watcher shared by chat completion requests."""
+    global _query_watcher
+    if _query_watcher is None:
+        _query_watcher = QueryCompletionWatcher()
+    return _query_watcher
+
+
+async def close_query_watcher() -> None:
+    """Stop the shared watcher's query watches; call on shutdown."""
+    global _query_watcher
+    if _query_watcher is not None:
+        await _query_watcher.close()
+        _query_watcher = None
+
+
+async def watch_query_completion(ark_client, query_name: str, model: str, messages: list, timeout_seconds: int) -> ChatCompletion:
+    """Wait for query completion on the namespace's shared query watch and return chat completion response."""
+    try:
+        query = await get_query_watcher().wait(ark_client.queries, query_name, timeout=timeout_seconds)
+    except TimeoutError:
         raise HTTPException(status_code=504, detail=f"Query {query_name} timed out after {timeout_seconds} seconds")
 
-    finally:
-        await api_client.close()
\ No newline at end of file
+    status = query.get("status") or {}
+    if status.get("phase") == "error":
+        raise HTTPException(status_code=500, detail=_get_error_detail(status))
+
+    response = status.get("response")
+    if not response:
+        raise HTTPException(status_code=500, detail="No response received")
+
+    content = response.get("content", "")
+    return _create_chat_completion_response(query_name, model, content, messages, status)
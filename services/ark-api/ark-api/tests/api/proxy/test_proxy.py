@@ -332,62 +332,44 @@ class TestListServices(unittest.TestCase):
         self.client = TestClient(app)
 
     @patch('ark_api.api.v1.proxy.proxy.get_context')
-    @patch('ark_api.api.v1.proxy.ApiClient')
-    def test_list_services_success(self, mock_api_client, mock_get_context):
+    @patch('ark_api.api.v1.proxy.proxy.list_metadata', new_callable=AsyncMock)
+    @patch('ark_api.api.v1.proxy.proxy.ApiClient')
+    def test_list_services_success(self, mock_api_client, mock_list_metadata, mock_get_context):
         """Test listing available services."""
         mock_get_context.return_value = {"namespace": "default"}
-
-        mock_svc1 = MagicMock()
-        mock_svc1.metadata.name = "file-gateway-api"
-        mock_svc2 = MagicMock()
-        mock_svc2.metadata.name = "other-service"
-
-        mock_services = MagicMock()
-        mock_services.items = [mock_svc1, mock_svc2]
-
-        mock_v1 = MagicMock()
-        mock_v1.list_namespaced_service = AsyncMock(return_value=mock_services)
+        mock_list_metadata.return_value = [{"name": "file-gateway-api"}, {"name": "other-service"}]
 
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
         mock_client_instance.__aexit__ = AsyncMock(return_value=None)
         mock_api_client.return_value = mock_client_instance
 
-        with patch('ark_api.api.v1.proxy.client.CoreV1Api', return_value=mock_v1):
-            response = self.client.get("/v1/proxy/services")
+        response = self.client.get("/v1/proxy/services")
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertIn("services", data)
         self.assertEqual(data["services"], ["file-gateway-api", "other-service"])
+        mock_list_metadata.assert_awaited_once_with(mock_client_instance, "/api/v1/namespaces/default/services")
     
-    @patch('ark_api.api.v1.proxy.ApiClient')
-    def test_list_services_success_with_namespace(self, mock_api_client):
+    @patch('ark_api.api.v1.proxy.proxy.list_metadata', new_callable=AsyncMock)
+    @patch('ark_api.api.v1.proxy.proxy.ApiClient')
+    def test_list_services_success_with_namespace(self, mock_api_client, mock_list_metadata):
         """Test listing available services."""
-
-        mock_svc1 = MagicMock()
-        mock_svc1.metadata.name = "file-gateway-api"
-        mock_svc2 = MagicMock()
-        mock_svc2.metadata.name = "other-service"
-
-        mock_services = MagicMock()
-        mock_services.items = [mock_svc1, mock_svc2]
-
-        mock_v1 = MagicMock()
-        mock_v1.list_namespaced_service = AsyncMock(return_value=mock_services)
+        mock_list_metadata.return_value = [{"name": "file-gateway-api"}, {"name": "other-service"}]
 
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
         mock_client_instance.__aexit__ = AsyncMock(return_value=None)
         mock_api_client.return_value = mock_client_instance
 
-        with patch('ark_api.api.v1.proxy.client.CoreV1Api', return_value=mock_v1):
-            response = self.client.get("/v1/proxy/services?namespace=dev")
+        response = self.client.get("/v1/proxy/services?namespace=dev")
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertIn("services", data)
         self.assertEqual(data["services"], ["file-gateway-api", "other-service"])
+        mock_list_metadata.assert_awaited_once_with(mock_client_instance, "/api/v1/namespaces/dev/services")
 
 class TestServicesProxyEndpoint(unittest.TestCase):
     """Test cases for proxy endpoint."""
@@ -22,7 +22,7 @@ class TestA2ATasksEndpoint(unittest.TestCase):
         from kubernetes_asyncio.client.rest import ApiException
         
         mock_client = AsyncMock()
-        mock_client.a2atasks.a_list = AsyncMock(side_effect=ApiException(
+        mock_client.a2atasks.a_list_raw = AsyncMock(side_effect=ApiException(
             status=500,
             reason="Internal Server Error"
         ))
@@ -40,8 +40,7 @@ class TestA2ATasksEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        mock_task1 = Mock()
-        mock_task1.to_dict.return_value = {
+        mock_task1 = {
             "metadata": {
                 "name": "task-1",
                 "namespace": "default",
@@ -57,8 +56,7 @@ class TestA2ATasksEndpoint(unittest.TestCase):
             }
         }
         
-        mock_task2 = Mock()
-        mock_task2.to_dict.return_value = {
+        mock_task2 = {
             "metadata": {
                 "name": "task-2",
                 "namespace": "default",
@@ -74,7 +72,7 @@ class TestA2ATasksEndpoint(unittest.TestCase):
             }
         }
         
-        mock_client.a2atasks.a_list = AsyncMock(return_value=[mock_task1, mock_task2])
+        mock_client.a2atasks.a_list_raw = AsyncMock(return_value=[mock_task1, mock_task2])
         
         response = self.client.get("/v1/a2a-tasks?namespace=default")
         
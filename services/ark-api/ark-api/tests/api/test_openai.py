@@ -262,3 +262,32 @@ class TestOpenAIChatCompletions(unittest.TestCase):
         self.assertEqual(session_id, "test-session-123")
         self.assertEqual(conversation_id, "conv-456-789")
 
+
+
+class TestOpenAIListModels(unittest.TestCase):
+    """Test cases for the /openai/v1/models endpoint."""
+
+    def setUp(self):
+        """Set up test client."""
+        from ark_api.main import app
+        self.client = TestClient(app)
+
+    @patch('ark_api.api.v1.openai.with_ark_client')
+    def test_list_models_uses_metadata_only(self, mock_with_ark_client):
+        """Test agents, teams, models and tools are listed as metadata."""
+        mock_client = AsyncMock()
+        mock_with_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client.agents.a_list_metadata = AsyncMock(return_value=[
+            {"name": "helper", "creationTimestamp": "2025-01-01T00:00:00Z"}
+        ])
+        mock_client.teams.a_list_metadata = AsyncMock(return_value=[{"name": "crew"}])
+        mock_client.models.a_list_metadata = AsyncMock(return_value=[])
+        mock_client.tools.a_list_metadata = AsyncMock(side_effect=Exception("forbidden"))
+
+        response = self.client.get("/openai/v1/models")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual([model["id"] for model in data], ["agent/helper", "team/crew"])
+        self.assertEqual(data[0]["created"], 1735689600)
+        mock_client.agents.a_list.assert_not_called()
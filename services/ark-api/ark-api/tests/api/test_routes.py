@@ -756,8 +756,7 @@ class TestAgentsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock agent objects
-        mock_agent1 = Mock()
-        mock_agent1.to_dict.return_value = {
+        mock_agent1 = {
             "metadata": {"name": "test-agent", "namespace": "default"},
             "spec": {
                 "description": "Test agent",
@@ -767,8 +766,7 @@ class TestAgentsEndpoint(unittest.TestCase):
             "status": {"conditions": [{"type": "Available", "status": "True"}]}
         }
         
-        mock_agent2 = Mock()
-        mock_agent2.to_dict.return_value = {
+        mock_agent2 = {
             "metadata": {"name": "another-agent", "namespace": "default"},
             "spec": {
                 "description": "Another test agent",
@@ -778,7 +776,7 @@ class TestAgentsEndpoint(unittest.TestCase):
         }
         
         # Mock the API response
-        mock_client.agents.a_list = AsyncMock(return_value=[mock_agent1, mock_agent2])
+        mock_client.agents.a_list_raw = AsyncMock(return_value=[mock_agent1, mock_agent2])
         
         # Make the request
         response = self.client.get("/v1/agents?namespace=default")
@@ -809,7 +807,7 @@ class TestAgentsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock empty response
-        mock_client.agents.a_list = AsyncMock(return_value=[])
+        mock_client.agents.a_list_raw = AsyncMock(return_value=[])
         
         # Make the request
         response = self.client.get("/v1/agents?namespace=test-namespace")
@@ -940,17 +938,6 @@ class TestAgentsEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing agent
-        existing_agent = Mock()
-        existing_agent.to_dict.return_value = {
-            "metadata": {"name": "test-agent", "namespace": "default"},
-            "spec": {
-                "description": "Old description",
-                "prompt": "Old prompt"
-            },
-            "status": {"phase": "Ready"}
-        }
-        
         # Mock updated agent
         updated_agent = Mock()
         updated_agent.to_dict.return_value = {
@@ -963,8 +950,7 @@ class TestAgentsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_client.agents.a_get = AsyncMock(return_value=existing_agent)
-        mock_client.agents.a_update = AsyncMock(return_value=updated_agent)
+        mock_client.agents.a_merge_patch = AsyncMock(return_value=updated_agent)
         
         # Make the request
         request_data = {
@@ -989,18 +975,6 @@ class TestAgentsEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing agent
-        existing_agent = Mock()
-        existing_agent.to_dict.return_value = {
-            "metadata": {"name": "test-agent", "namespace": "default"},
-            "spec": {
-                "description": "Original description",
-                "prompt": "Original prompt",
-                "modelRef": {"name": "gpt-3.5-turbo"}
-            },
-            "status": {"phase": "Ready"}
-        }
-        
         # Mock updated agent
         updated_agent = Mock()
         updated_agent.to_dict.return_value = {
@@ -1013,8 +987,7 @@ class TestAgentsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_client.agents.a_get = AsyncMock(return_value=existing_agent)
-        mock_client.agents.a_update = AsyncMock(return_value=updated_agent)
+        mock_client.agents.a_merge_patch = AsyncMock(return_value=updated_agent)
         
         # Make the request - only update description
         request_data = {"description": "Updated description only"}
@@ -1026,6 +999,36 @@ class TestAgentsEndpoint(unittest.TestCase):
         self.assertEqual(data["description"], "Updated description only")
         self.assertEqual(data["prompt"], "Original prompt")
         self.assertEqual(data["modelRef"]["name"], "gpt-3.5-turbo")
+        mock_client.agents.a_merge_patch.assert_awaited_once_with(
+            "test-agent", {"spec": {"description": "Updated description only"}}
+        )
+    
+    @patch('ark_api.api.v1.agents.with_ark_client')
+    def test_update_agent_model_ref_replaces_namespace(self, mock_ark_client):
+        """Test that a modelRef with only a name clears the existing namespace."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        # Mock updated agent
+        updated_agent = Mock()
+        updated_agent.to_dict.return_value = {
+            "metadata": {"name": "test-agent", "namespace": "default"},
+            "spec": {"prompt": "Original prompt", "modelRef": {"name": "m2"}},
+            "status": {"phase": "Ready"}
+        }
+        mock_client.agents.a_merge_patch = AsyncMock(return_value=updated_agent)
+        
+        # Make the request - only set the model name
+        request_data = {"modelRef": {"name": "m2"}}
+        response = self.client.put("/v1/agents/test-agent?namespace=default", json=request_data)
+        
+        # Assert the namespace of the old reference is removed, not kept
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["modelRef"]["name"], "m2")
+        mock_client.agents.a_merge_patch.assert_awaited_once_with(
+            "test-agent", {"spec": {"modelRef": {"name": "m2", "namespace": None}}}
+        )
     
     @patch('ark_api.api.v1.agents.with_ark_client')
     def test_delete_agent_success(self, mock_ark_client):
@@ -1063,8 +1066,7 @@ class TestModelsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock model objects
-        mock_model1 = Mock()
-        mock_model1.to_dict.return_value = {
+        mock_model1 = {
             "metadata": {"name": "gpt-4-model", "namespace": "default"},
             "spec": {
                 "type": "openai",
@@ -1075,8 +1077,7 @@ class TestModelsEndpoint(unittest.TestCase):
             ]}
         }
         
-        mock_model2 = Mock()
-        mock_model2.to_dict.return_value = {
+        mock_model2 = {
             "metadata": {"name": "claude-model", "namespace": "default"},
             "spec": {
                 "type": "bedrock",
@@ -1088,7 +1089,7 @@ class TestModelsEndpoint(unittest.TestCase):
         }
         
         # Mock the API response
-        mock_client.models.a_list = AsyncMock(return_value=[mock_model1, mock_model2])
+        mock_client.models.a_list_raw = AsyncMock(return_value=[mock_model1, mock_model2])
         
         # Make the request
         response = self.client.get("/v1/models?namespace=default")
@@ -1121,7 +1122,7 @@ class TestModelsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock empty response
-        mock_client.models.a_list = AsyncMock(return_value=[])
+        mock_client.models.a_list_raw = AsyncMock(return_value=[])
         
         # Make the request
         response = self.client.get("/v1/models?namespace=test-namespace")
@@ -1376,7 +1377,7 @@ class TestModelsEndpoint(unittest.TestCase):
         }
 
         mock_client.models.a_get = AsyncMock(return_value=existing_model)
-        mock_client.models.a_update = AsyncMock(return_value=updated_model)
+        mock_client.models.a_merge_patch = AsyncMock(return_value=updated_model)
 
         # Make the request
         request_data = {
@@ -1396,6 +1397,11 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["name"], "gpt-model")
         self.assertEqual(data["model"], "gpt-4")
         self.assertEqual(data["config"]["openai"]["apiKey"]["value"], "new-key")
+        # Unchanged config values are left out of the patch
+        mock_client.models.a_merge_patch.assert_awaited_once_with("gpt-model", {"spec": {
+            "model": {"value": "gpt-4", "valueFrom": None},
+            "config": {"openai": {"apiKey": {"value": "new-key"}}}
+        }})
     
     @patch('ark_api.api.v1.models.with_ark_client')
     def test_update_model_partial(self, mock_ark_client):
@@ -1404,23 +1410,6 @@ class TestModelsEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
 
-        # Mock existing model
-        existing_model = Mock()
-        existing_model.to_dict.return_value = {
-            "metadata": {"name": "gpt-model", "namespace": "default"},
-            "spec": {
-                "provider": "openai",
-                "type": "completions",
-                "model": {"value": "gpt-3.5-turbo"},
-                "config": {
-                    "openai": {
-                        "apiKey": {"value": "test-key"},
-                        "baseUrl": {"value": "https://api.openai.com/v1"}
-                    }
-                }
-            }
-        }
-
         # Mock updated model
         updated_model = Mock()
         updated_model.to_dict.return_value = {
@@ -1438,8 +1427,7 @@ class TestModelsEndpoint(unittest.TestCase):
             }
         }
 
-        mock_client.models.a_get = AsyncMock(return_value=existing_model)
-        mock_client.models.a_update = AsyncMock(return_value=updated_model)
+        mock_client.models.a_merge_patch = AsyncMock(return_value=updated_model)
 
         # Make the request - only update model
         request_data = {"model": "gpt-4"}
@@ -1451,6 +1439,11 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["model"], "gpt-4")
         # Config should remain unchanged
         self.assertEqual(data["config"]["openai"]["apiKey"]["value"], "test-key")
+        # Only the model is patched, without reading the resource first
+        mock_client.models.a_get.assert_not_called()
+        mock_client.models.a_merge_patch.assert_awaited_once_with(
+            "gpt-model", {"spec": {"model": {"value": "gpt-4", "valueFrom": None}}}
+        )
     
     @patch('ark_api.api.v1.models.with_ark_client')
     def test_delete_model_success(self, mock_ark_client):
@@ -1488,8 +1481,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock query objects
-        mock_query1 = Mock()
-        mock_query1.to_dict.return_value = {
+        mock_query1 = {
             "metadata": {"name": "test-query", "namespace": "default"},
             "spec": {
                 "input": "What is the weather today?"
@@ -1510,8 +1502,7 @@ class TestQueriesEndpoint(unittest.TestCase):
             }
         }
         
-        mock_query2 = Mock()
-        mock_query2.to_dict.return_value = {
+        mock_query2 = {
             "metadata": {"name": "another-query", "namespace": "default"},
             "spec": {
                 "input": "Tell me a joke"
@@ -1532,7 +1523,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         }
         
         # Mock the API response
-        mock_client.queries.a_list = AsyncMock(return_value=[mock_query1, mock_query2])
+        mock_client.queries.a_list_raw = AsyncMock(return_value=[mock_query1, mock_query2])
         
         # Make the request
         response = self.client.get("/v1/queries?namespace=default")
@@ -1573,7 +1564,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock empty response
-        mock_client.queries.a_list = AsyncMock(return_value=[])
+        mock_client.queries.a_list_raw = AsyncMock(return_value=[])
         
         # Make the request
         response = self.client.get("/v1/queries?namespace=test-namespace")
@@ -1584,6 +1575,31 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["count"], 0)
         self.assertEqual(data["items"], [])
     
+    @patch('ark_api.api.v1.queries.with_ark_client')
+    def test_list_queries_paginated(self, mock_ark_client):
+        """Test listing queries one page at a time."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        mock_query = {
+            "metadata": {"name": "test-query", "namespace": "default"},
+            "spec": {"input": "hello"}
+        }
+        mock_page = Mock(items=[mock_query], continue_token="next-page")
+        mock_client.queries.a_list_page_raw = AsyncMock(return_value=mock_page)
+        
+        # Make the request
+        response = self.client.get("/v1/queries?namespace=default&limit=1&continue=this-page")
+        
+        # Assert response
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["continue"], "next-page")
+        mock_client.queries.a_list_page_raw.assert_called_once_with(limit=1, continue_token="this-page")
+        mock_client.queries.a_list_raw.assert_not_called()
+    
     @patch('ark_api.api.v1.queries.with_ark_client')
     def test_create_query_simple(self, mock_ark_client):
         """Test creating a simple query."""
@@ -1756,19 +1772,6 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing query
-        existing_query = Mock()
-        existing_query.to_dict.return_value = {
-            "metadata": {"name": "test-query", "namespace": "default"},
-            "spec": {
-                "input": "Old question"
-            },
-            "status": {"phase": "done"}
-        }
-        # Need to add other attributes to avoid KeyError
-        existing_query.metadata = {"name": "test-query", "namespace": "default"}
-        existing_query.spec = existing_query.to_dict()["spec"]
-        
         # Mock updated query
         updated_query = Mock()
         updated_query.to_dict.return_value = {
@@ -1780,8 +1783,7 @@ class TestQueriesEndpoint(unittest.TestCase):
             "status": {"phase": "pending"}
         }
         
-        mock_client.queries.a_get = AsyncMock(return_value=existing_query)
-        mock_client.queries.a_update = AsyncMock(return_value=updated_query)
+        mock_client.queries.a_merge_patch = AsyncMock(return_value=updated_query)
         
         # Make the request
         request_data = {
@@ -1804,21 +1806,6 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing query
-        existing_query = Mock()
-        existing_query.to_dict.return_value = {
-            "metadata": {"name": "test-query", "namespace": "default"},
-            "spec": {
-                "input": "Question",
-                "memory": {"name": "old-memory"},
-                "sessionId": "old-session"
-            },
-            "status": {"phase": "done"}
-        }
-        # Need to add other attributes to avoid KeyError
-        existing_query.metadata = {"name": "test-query", "namespace": "default"}
-        existing_query.spec = existing_query.to_dict()["spec"]
-        
         # Mock updated query
         updated_query = Mock()
         updated_query.to_dict.return_value = {
@@ -1831,8 +1818,7 @@ class TestQueriesEndpoint(unittest.TestCase):
             "status": {"phase": "pending"}
         }
         
-        mock_client.queries.a_get = AsyncMock(return_value=existing_query)
-        mock_client.queries.a_update = AsyncMock(return_value=updated_query)
+        mock_client.queries.a_merge_patch = AsyncMock(return_value=updated_query)
         
         # Make the request - only update memory
         request_data = {"memory": {"name": "new-memory"}}
@@ -1844,6 +1830,40 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["input"], "Question")  # Unchanged
         self.assertEqual(data["memory"]["name"], "new-memory")  # Updated
         self.assertEqual(data["sessionId"], "old-session")  # Unchanged
+        mock_client.queries.a_merge_patch.assert_awaited_once_with(
+            "test-query", {"spec": {"memory": {"name": "new-memory", "namespace": None}}}
+        )
+    
+    @patch('ark_api.api.v1.queries.with_ark_client')
+    def test_update_query_selector_replaces_labels(self, mock_ark_client):
+        """Test that an updated selector drops labels that are no longer given."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        existing_query = Mock()
+        existing_query.to_dict.return_value = {
+            "metadata": {"name": "test-query", "namespace": "default"},
+            "spec": {"input": "Question", "selector": {"matchLabels": {"team": "a", "tier": "gold"}}}
+        }
+        updated_query = Mock()
+        updated_query.to_dict.return_value = {
+            "metadata": {"name": "test-query", "namespace": "default"},
+            "spec": {"input": "Question", "selector": {"matchLabels": {"team": "b"}}},
+            "status": {"phase": "pending"}
+        }
+        mock_client.queries.a_get = AsyncMock(return_value=existing_query)
+        mock_client.queries.a_merge_patch = AsyncMock(return_value=updated_query)
+        
+        # Make the request - replace the selector labels
+        request_data = {"selector": {"matchLabels": {"team": "b"}}}
+        response = self.client.put("/v1/queries/test-query?namespace=default", json=request_data)
+        
+        # Assert the removed label is deleted rather than merged
+        self.assertEqual(response.status_code, 200)
+        mock_client.queries.a_merge_patch.assert_awaited_once_with(
+            "test-query", {"spec": {"selector": {"matchLabels": {"team": "b", "tier": None}}}}
+        )
     
     @patch('ark_api.api.v1.queries.with_ark_client')
     def test_delete_query_success(self, mock_ark_client):
@@ -1881,8 +1901,7 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock team objects
-        mock_team1 = Mock()
-        mock_team1.to_dict.return_value = {
+        mock_team1 = {
             "metadata": {"name": "dev-team", "namespace": "default"},
             "spec": {
                 "description": "Development team",
@@ -1895,8 +1914,7 @@ class TestTeamsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_team2 = Mock()
-        mock_team2.to_dict.return_value = {
+        mock_team2 = {
             "metadata": {"name": "research-team", "namespace": "default"},
             "spec": {
                 "strategy": "parallel",
@@ -1906,7 +1924,7 @@ class TestTeamsEndpoint(unittest.TestCase):
         }
         
         # Mock the API response
-        mock_client.teams.a_list = AsyncMock(return_value=[mock_team1, mock_team2])
+        mock_client.teams.a_list_raw = AsyncMock(return_value=[mock_team1, mock_team2])
         
         # Make the request
         response = self.client.get("/v1/teams?namespace=default")
@@ -1938,7 +1956,7 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
         # Mock empty response
-        mock_client.teams.a_list = AsyncMock(return_value=[])
+        mock_client.teams.a_list_raw = AsyncMock(return_value=[])
         
         # Make the request
         response = self.client.get("/v1/teams?namespace=test-namespace")
@@ -2215,18 +2233,6 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing team
-        existing_team = Mock()
-        existing_team.to_dict.return_value = {
-            "metadata": {"name": "test-team", "namespace": "default"},
-            "spec": {
-                "description": "Old description",
-                "members": [{"name": "agent1", "type": "agent"}],
-                "strategy": "sequential"
-            },
-            "status": {"phase": "Ready"}
-        }
-        
         # Mock updated team
         updated_team = Mock()
         updated_team.to_dict.return_value = {
@@ -2242,8 +2248,7 @@ class TestTeamsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_client.teams.a_get = AsyncMock(return_value=existing_team)
-        mock_client.teams.a_update = AsyncMock(return_value=updated_team)
+        mock_client.teams.a_merge_patch = AsyncMock(return_value=updated_team)
         
         # Make the request
         request_data = {
@@ -2271,19 +2276,6 @@ class TestTeamsEndpoint(unittest.TestCase):
         mock_client = AsyncMock()
         mock_ark_client.return_value.__aenter__.return_value = mock_client
         
-        # Mock existing team
-        existing_team = Mock()
-        existing_team.to_dict.return_value = {
-            "metadata": {"name": "test-team", "namespace": "default"},
-            "spec": {
-                "description": "Original description",
-                "members": [{"name": "agent1", "type": "agent"}],
-                "strategy": "sequential",
-                "maxTurns": 5
-            },
-            "status": {"phase": "Ready"}
-        }
-        
         # Mock updated team
         updated_team = Mock()
         updated_team.to_dict.return_value = {
@@ -2297,8 +2289,7 @@ class TestTeamsEndpoint(unittest.TestCase):
             "status": {"phase": "Ready"}
         }
         
-        mock_client.teams.a_get = AsyncMock(return_value=existing_team)
-        mock_client.teams.a_update = AsyncMock(return_value=updated_team)
+        mock_client.teams.a_merge_patch = AsyncMock(return_value=updated_team)
         
         # Make the request - only update maxTurns
         request_data = {"maxTurns": 10}
@@ -2310,6 +2301,37 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(data["description"], "Original description")  # Unchanged
         self.assertEqual(data["strategy"], "sequential")  # Unchanged
         self.assertEqual(data["maxTurns"], 10)  # Updated
+        mock_client.teams.a_merge_patch.assert_awaited_once_with("test-team", {"spec": {"maxTurns": 10}})
+    
+    @patch('ark_api.api.v1.teams.with_ark_client')
+    def test_update_team_selector_replaces_existing(self, mock_ark_client):
+        """Test that an updated selector drops fields that are no longer given."""
+        # Setup async context manager mock
+        mock_client = AsyncMock()
+        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        
+        existing_team = Mock()
+        existing_team.to_dict.return_value = {
+            "metadata": {"name": "test-team", "namespace": "default"},
+            "spec": {"strategy": "selector", "selector": {"agent": "picker", "selectorPrompt": "Pick one"}}
+        }
+        updated_team = Mock()
+        updated_team.to_dict.return_value = {
+            "metadata": {"name": "test-team", "namespace": "default"},
+            "spec": {"strategy": "selector", "selector": {"agent": "chooser"}},
+            "status": {"phase": "Ready"}
+        }
+        mock_client.teams.a_get = AsyncMock(return_value=existing_team)
+        mock_client.teams.a_merge_patch = AsyncMock(return_value=updated_team)
+        
+        # Make the request - only set the selector agent
+        response = self.client.put("/v1/teams/test-team?namespace=default", json={"selector": {"agent": "chooser"}})
+        
+        # Assert the old prompt is removed rather than merged
+        self.assertEqual(response.status_code, 200)
+        mock_client.teams.a_merge_patch.assert_awaited_once_with(
+            "test-team", {"spec": {"selector": {"agent": "chooser", "selectorPrompt": None}}}
+        )
     
     @patch('ark_api.api.v1.teams.with_ark_client')
     def test_delete_team_success(self, mock_ark_client):
@@ -1,12 +1,20 @@
 """Test cases for API key service."""
 
+import asyncio
 import unittest
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime, timezone, timedelta
 import base64
 import json
 
-from ark_api.services.api_keys import APIKeyService, API_KEY_TYPE, API_KEY_ANNOTATION
+from ark_api.services.api_keys import (
+    APIKeyService,
+    API_KEY_TYPE,
+    API_KEY_ANNOTATION,
+    LastUsedRecorder,
+    VerifiedAPIKeyCache,
+    _credential_fingerprint
+)
 from ark_api.models.auth import APIKeyCreateRequest
 
 
@@ -228,50 +236,6 @@ class TestAPIKeyServiceIntegration(unittest.TestCase):
         self.assertIn("deletedAt", annotation_data)
         self.assertEqual(patched_secret.string_data["is_active"], "false")
     
-    @patch('ark_api.services.api_keys.ApiClient')
-    @patch('ark_api.services.api_keys.client.CoreV1Api')
-    async def test_verify_api_key_success(self, mock_v1_api, mock_api_client):
-        """Test successful API key verification."""
-        # Setup async context manager mock
-        mock_api_client_instance = AsyncMock()
-        mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
-        
-        # Create a real hash for testing
-        secret_key = "sk-ark-test-secret"
-        hashed = self.service._hash_secret_key(secret_key)
-        
-        # Mock secret response with JSON annotation
-        mock_secret = Mock()
-        mock_secret.type = "ark.mckinsey.com/api-key"
-        mock_secret.metadata.uid = "test-uid-123"
-        mock_secret.metadata.annotations = {
-            API_KEY_ANNOTATION: json.dumps({
-                "name": "Test Key",
-                "createdAt": "2024-01-01T00:00:00+00:00"
-            })
-        }
-        mock_secret.data = {
-            "public_key": base64.b64encode(b"pk-ark-test").decode(),
-            "secret_key_hash": base64.b64encode(hashed.encode()).decode(),
-            "is_active": base64.b64encode(b"true").decode()
-        }
-        
-        mock_api_instance = mock_v1_api.return_value
-        mock_api_instance.read_namespaced_secret = AsyncMock(return_value=mock_secret)
-        mock_api_instance.patch_namespaced_secret = AsyncMock(return_value=mock_secret)
-        
-        # Test verification
-        result = await self.service.verify_api_key("pk-ark-test", secret_key)
-        
-        # Verify result
-        self.assertIsNotNone(result)
-        self.assertEqual(result["public_key"], "pk-ark-test")
-        self.assertEqual(result["name"], "Test Key")
-        self.assertTrue(result["is_active"])
-        
-        # Verify last used timestamp was updated
-        mock_api_instance.patch_namespaced_secret.assert_called_once()
-    
     @patch('ark_api.services.api_keys.ApiClient')
     @patch('ark_api.services.api_keys.client.CoreV1Api')
     async def test_verify_api_key_invalid_secret(self, mock_v1_api, mock_api_client):
@@ -451,5 +415,373 @@ class TestAPIKeyNamespaceScoping(unittest.TestCase):
         self.assertIsNone(result_b)
 
 
+
+def _b64(value: str) -> str:
+    return base64.b64encode(value.encode()).decode()
+
+
+class TestVerifiedAPIKeyCache(unittest.IsolatedAsyncioTestCase):
+    """Test caching of verified API key pairs."""
+    
+    def setUp(self):
+        self.now = 0.0
+        self.cache = VerifiedAPIKeyCache(ttl=60, max_size=2, watch_changes=False, clock=lambda: self.now)
+        self.data = {"public_key": _b64("pk-ark-a"), "secret_key_hash": _b64("hash"), "is_active": _b64("true")}
+    
+    def entry(self, secret_name="api-key-a", expires_at=None):
+        value = {"public_key": "pk-ark-a", "secret_name": secret_name, "expires_at": expires_at}
+        return value, "ns", _credential_fingerprint(self.data, {}), "1"
+    
+    async def test_hit_skips_verification(self):
+        """Test that a verified key pair is answered from memory until the TTL passes."""
+        verify = AsyncMock(return_value=self.entry())
+        key = self.cache.key("ns", "pk-ark-a", "sk-ark-a")
+        
+        self.assertEqual((await self.cache.get(key, verify))["public_key"], "pk-ark-a")
+        self.assertIsNotNone(await self.cache.get(key, verify))
+        self.assertEqual(verify.await_count, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        
+        self.now = 61
+        await self.cache.get(key, verify)
+        self.assertEqual(verify.await_count, 2)
+    
+    async def test_key_covers_secret_key_and_namespace(self):
+        """Test that a different secret key or namespace is not a hit."""
+        key = self.cache.key("ns", "pk-ark-a", "sk-ark-a")
+        
+        self.assertNotEqual(key, self.cache.key("ns", "pk-ark-a", "sk-ark-b"))
+        self.assertNotEqual(key, self.cache.key("other", "pk-ark-a", "sk-ark-a"))
+        self.assertNotIn(b"sk-ark-a", key)
+    
+    async def test_failures_are_not_cached(self):
+        """Test that invalid credentials are verified again on every request."""
+        verify = AsyncMock(return_value=None)
+        key = self.cache.key("ns", "pk-ark-a", "wrong")
+        
+        self.assertIsNone(await self.cache.get(key, verify))
+        self.assertIsNone(await self.cache.get(key, verify))
+        self.assertEqual(verify.await_count, 2)
+        self.assertEqual(len(self.cache), 0)
+    
+    async def test_concurrent_misses_share_verification(self):
+        """Test that concurrent requests with the same key pair run bcrypt once."""
+        release = asyncio.Event()
+        
+        async def verify():
+            await release.wait()
+            return self.entry()
+        
+        verify_mock = AsyncMock(side_effect=verify)
+        key = self.cache.key("ns", "pk-ark-a", "sk-ark-a")
+        tasks = [asyncio.ensure_future(self.cache.get(key, verify_mock)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        
+        self.assertTrue(all(r["public_key"] == "pk-ark-a" for r in results))
+        self.assertEqual(verify_mock.await_count, 1)
+    
+    async def test_entry_does_not_outlive_key_expiry(self):
+        """Test that keys expiring soon are cached only until they expire."""
+        soon = datetime.now(timezone.utc) + timedelta(seconds=5)
+        key = self.cache.key("ns", "pk-ark-a", "sk-ark-a")
+        await self.cache.get(key, AsyncMock(return_value=self.entry(expires_at=soon)))
+        
+        self.now = 10
+        verify = AsyncMock(return_value=None)
+        self.assertIsNone(await self.cache.get(key, verify))
+        verify.assert_awaited_once()
+    
+    async def test_oldest_entry_is_evicted(self):
+        """Test that the cache holds at most max_size key pairs."""
+        keys = [self.cache.key("ns", "pk-ark-a", f"sk-{i}") for i in range(3)]
+        for key in keys:
+            await self.cache.get(key, AsyncMock(return_value=self.entry()))
+        
+        self.assertEqual(len(self.cache), 2)
+        verify = AsyncMock(return_value=self.entry())
+        await self.cache.get(keys[0], verify)
+        verify.assert_awaited_once()
+    
+    async def test_secret_changes_invalidate_entries(self):
+        """Test that revoking or re-hashing a key drops it while usage updates do not."""
+        key = self.cache.key("ns", "pk-ark-a", "sk-ark-a")
+        await self.cache.get(key, AsyncMock(return_value=self.entry()))
+        secret = {"metadata": {"name": "api-key-a", "annotations": {
+            API_KEY_ANNOTATION: json.dumps({"name": "a", "lastUsedAt": "2024-01-01T00:00:00+00:00"})
+        }}, "data": dict(self.data)}
+        
+        self.cache._on_event("ns", "MODIFIED", secret)
+        self.assertEqual(len(self.cache), 1)
+        
+        self.cache._on_event("other", "MODIFIED", {**secret, "data": {**self.data, "is_active": _b64("false")}})
+        self.assertEqual(len(self.cache), 1)
+        
+        self.cache._on_event("ns", "MODIFIED", {**secret, "data": {**self.data, "is_active": _b64("false")}})
+        self.assertEqual(len(self.cache), 0)
+        
+        await self.cache.get(key, AsyncMock(return_value=self.entry()))
+        self.cache._on_event("ns", "DELETED", secret)
+        self.assertEqual(len(self.cache), 0)
+    
+    async def test_watch_stops_with_last_entry(self):
+        """Test that a namespace's Secrets are watched only while it has entries."""
+        cache = VerifiedAPIKeyCache(ttl=60, clock=lambda: self.now)
+        started = []
+        
+        async def watch(namespace, resource_version):
+            started.append((namespace, resource_version))
+            await asyncio.Event().wait()
+        
+        with patch.object(cache, "_watch", watch):
+            keys = [cache.key("ns", "pk-ark-a", f"sk-{i}") for i in range(2)]
+            for key in keys:
+                await cache.get(key, AsyncMock(return_value=self.entry()))
+            task = cache._watches["ns"]
+            await asyncio.sleep(0)
+            self.assertEqual(started, [("ns", "1")])
+            
+            cache._drop(keys[0])
+            self.assertIs(cache._watches["ns"], task)
+            
+            cache.invalidate("ns", "api-key-a")
+            await asyncio.sleep(0)
+            self.assertEqual(cache._watches, {})
+            self.assertTrue(task.cancelled())
+    
+    async def test_change_during_verification_is_not_cached(self):
+        """Test that a key revoked while bcrypt runs is not cached from the stale read."""
+        started, release = asyncio.Event(), asyncio.Event()
+        
+        async def verify():
+            started.set()
+            await release.wait()
+            return self.entry()
+        
+        key = self.cache.key("ns", "pk-ark-a", "sk-ark-a")
+        pending = asyncio.ensure_future(self.cache.get(key, verify))
+        await started.wait()
+        revoked = {"metadata": {"name": "api-key-a"}, "data": {**self.data, "is_active": _b64("false")}}
+        self.cache._on_event("ns", "MODIFIED", revoked)
+        release.set()
+        await pending
+        
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache._changed, {})
+        
+        # Without a change in between the verification is cached
+        await self.cache.get(key, AsyncMock(return_value=self.entry()))
+        self.assertEqual(len(self.cache), 1)
+
+
+class TestVerifyAPIKeyCached(unittest.IsolatedAsyncioTestCase):
+    """Test API key verification through the verified key cache."""
+    
+    @patch('ark_api.services.api_keys.get_context')
+    def setUp(self, mock_get_context):
+        mock_get_context.return_value = {"namespace": "test-namespace", "cluster": "test"}
+        self.service = APIKeyService()
+        self.cache = VerifiedAPIKeyCache(watch_changes=False)
+        patcher = patch('ark_api.services.api_keys._verified_keys', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.secret_key = "sk-ark-test-secret"
+        self.api_key_data = {
+            "id": "uid",
+            "name": "Test Key",
+            "public_key": "pk-ark-test",
+            "secret_key_hash": self.service._hash_secret_key(self.secret_key),
+            "is_active": True,
+            "expires_at": None,
+            "secret_name": "api-key-test"
+        }
+        self.service._read_api_key = AsyncMock(return_value=(self.api_key_data, ("fingerprint",), "1"))
+        self.service._update_last_used = AsyncMock()
+        self.recorder = LastUsedRecorder()
+        patcher = patch('ark_api.services.api_keys._last_used', self.recorder)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    async def asyncTearDown(self):
+        await self.recorder.close()
+    
+    async def test_repeated_verification_reads_secret_once(self):
+        """Test that bcrypt and the Secret read run once for repeated requests."""
+        with patch.object(self.service, '_verify_secret_key', wraps=self.service._verify_secret_key) as verify:
+            first = await self.service.verify_api_key("pk-ark-test", self.secret_key)
+            second = await self.service.verify_api_key("pk-ark-test", self.secret_key)
+        
+        self.assertEqual(first["name"], "Test Key")
+        self.assertEqual(second, first)
+        self.service._read_api_key.assert_awaited_once()
+        verify.assert_called_once()
+        self.assertEqual(len(self.recorder), 1)
+    
+    async def test_wrong_secret_is_rejected_after_cache_hit(self):
+        """Test that a cached key pair does not admit a different secret key."""
+        await self.service.verify_api_key("pk-ark-test", self.secret_key)
+        
+        self.assertIsNone(await self.service.verify_api_key("pk-ark-test", "sk-ark-wrong"))
+    
+    @patch('ark_api.services.api_keys.ApiClient')
+    @patch('ark_api.services.api_keys.client.CoreV1Api')
+    async def test_delete_invalidates_cached_credentials(self, mock_v1_api, mock_api_client):
+        """Test that deleting a key revokes its cached credentials immediately."""
+        mock_api_client.return_value.__aenter__.return_value = AsyncMock()
+        mock_secret = Mock()
+        mock_secret.metadata.annotations = {API_KEY_ANNOTATION: json.dumps({"name": "Test Key"})}
+        mock_secret.string_data = None
+        mock_v1_api.return_value.read_namespaced_secret = AsyncMock(return_value=mock_secret)
+        mock_v1_api.return_value.patch_namespaced_secret = AsyncMock(return_value=mock_secret)
+        
+        await self.service.verify_api_key("pk-ark-test", self.secret_key)
+        self.assertEqual(len(self.cache), 1)
+        
+        self.assertTrue(await self.service.delete_api_key("pk-ark-test"))
+        self.assertEqual(len(self.cache), 0)
+        
+        self.service._read_api_key.return_value = None
+        self.assertIsNone(await self.service.verify_api_key("pk-ark-test", self.secret_key))
+
+
+
+class TestLastUsedRecorder(unittest.IsolatedAsyncioTestCase):
+    """Test write-behind of API key last-used times."""
+    
+    def service(self, namespace="test-namespace"):
+        service = Mock(namespace=namespace)
+        service._update_last_used = AsyncMock()
+        return service
+    
+    async def test_one_write_per_key_per_flush(self):
+        """Test that many uses of a key are written once with the latest time."""
+        recorder = LastUsedRecorder(interval=3600)
+        service = self.service()
+        first = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        latest = first + timedelta(seconds=30)
+        
+        recorder.record(service, "api-key-a", first)
+        recorder.record(service, "api-key-a", latest)
+        recorder.record(service, "api-key-b", first)
+        await recorder.flush()
+        
+        service._update_last_used.assert_any_await("api-key-a", latest)
+        service._update_last_used.assert_any_await("api-key-b", first)
+        self.assertEqual(service._update_last_used.await_count, 2)
+        
+        await recorder.flush()
+        self.assertEqual(service._update_last_used.await_count, 2)
+        await recorder.close()
+    
+    async def test_background_flush(self):
+        """Test that recorded times are written after the interval."""
+        recorder = LastUsedRecorder(interval=0.01)
+        service = self.service()
+        
+        recorder.record(service, "api-key-a")
+        await asyncio.sleep(0.05)
+        
+        service._update_last_used.assert_awaited_once()
+        self.assertEqual(len(recorder), 0)
+        await recorder.close()
+    
+    async def test_close_flushes_pending(self):
+        """Test that shutdown writes times recorded since the last flush."""
+        recorder = LastUsedRecorder(interval=3600)
+        service = self.service()
+        
+        recorder.record(service, "api-key-a")
+        await recorder.close()
+        
+        service._update_last_used.assert_awaited_once()
+    
+    @patch('ark_api.services.api_keys.get_context')
+    @patch('ark_api.services.api_keys.ApiClient')
+    @patch('ark_api.services.api_keys.client.CoreV1Api')
+    async def test_verify_api_key_success(self, mock_v1_api, mock_api_client, mock_get_context):
+        """Test successful API key verification, with the last-used time written behind."""
+        mock_get_context.return_value = {"namespace": "test-namespace", "cluster": "test"}
+        service = APIKeyService()
+        
+        # Setup async context manager mock
+        mock_api_client_instance = AsyncMock()
+        mock_api_client.return_value.__aenter__.return_value = mock_api_client_instance
+        
+        # Create a real hash for testing
+        secret_key = "sk-ark-test-secret"
+        hashed = service._hash_secret_key(secret_key)
+        
+        # Mock secret response with JSON annotation
+        mock_secret = Mock()
+        mock_secret.type = "ark.mckinsey.com/api-key"
+        mock_secret.metadata.uid = "test-uid-123"
+        mock_secret.metadata.resource_version = "7"
+        mock_secret.metadata.annotations = {
+            API_KEY_ANNOTATION: json.dumps({
+                "name": "Test Key",
+                "createdAt": "2024-01-01T00:00:00+00:00"
+            })
+        }
+        mock_secret.data = {
+            "public_key": base64.b64encode(b"pk-ark-test").decode(),
+            "secret_key_hash": base64.b64encode(hashed.encode()).decode(),
+            "is_active": base64.b64encode(b"true").decode()
+        }
+        
+        mock_api_instance = mock_v1_api.return_value
+        mock_api_instance.read_namespaced_secret = AsyncMock(return_value=mock_secret)
+        mock_api_instance.patch_namespaced_secret = AsyncMock(return_value=mock_secret)
+        
+        # Test verification
+        recorder = LastUsedRecorder(interval=3600)
+        cache = VerifiedAPIKeyCache(watch_changes=False)
+        with patch('ark_api.services.api_keys._last_used', recorder), \
+                patch('ark_api.services.api_keys._verified_keys', cache):
+            result = await service.verify_api_key("pk-ark-test", secret_key)
+            
+            # Verify result
+            self.assertIsNotNone(result)
+            self.assertEqual(result["public_key"], "pk-ark-test")
+            self.assertEqual(result["name"], "Test Key")
+            self.assertTrue(result["is_active"])
+            
+            # Verify last used timestamp was recorded, not written per request
+            mock_api_instance.patch_namespaced_secret.assert_not_called()
+            await recorder.close()
+            mock_api_instance.patch_namespaced_secret.assert_awaited_once()
+            body = mock_api_instance.patch_namespaced_secret.call_args[1]["body"]
+            self.assertEqual(body["metadata"]["resourceVersion"], "7")
+    
+    @patch('ark_api.services.api_keys.get_context')
+    @patch('ark_api.services.api_keys.ApiClient')
+    @patch('ark_api.services.api_keys.client.CoreV1Api')
+    async def test_update_patches_annotation_with_resource_version(self, mock_v1_api, mock_api_client, mock_get_context):
+        """Test that the write patches only the annotation and skips deleted keys."""
+        mock_get_context.return_value = {"namespace": "test-namespace", "cluster": "test"}
+        mock_api_client.return_value.__aenter__.return_value = AsyncMock()
+        service = APIKeyService()
+        mock_secret = Mock()
+        mock_secret.metadata.resource_version = "42"
+        mock_secret.metadata.annotations = {API_KEY_ANNOTATION: json.dumps({"name": "Test Key"})}
+        mock_api_instance = mock_v1_api.return_value
+        mock_api_instance.read_namespaced_secret = AsyncMock(return_value=mock_secret)
+        mock_api_instance.patch_namespaced_secret = AsyncMock()
+        used_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        await service._update_last_used("api-key-a", used_at)
+        
+        body = mock_api_instance.patch_namespaced_secret.call_args[1]["body"]
+        self.assertEqual(body["metadata"]["resourceVersion"], "42")
+        self.assertEqual(json.loads(body["metadata"]["annotations"][API_KEY_ANNOTATION])["lastUsedAt"], used_at.isoformat())
+        
+        mock_secret.metadata.annotations = {API_KEY_ANNOTATION: json.dumps({
+            "name": "Test Key", "deletedAt": used_at.isoformat()
+        })}
+        await service._update_last_used("api-key-a", used_at)
+        mock_api_instance.patch_namespaced_secret.assert_awaited_once()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,117 @@
+"""Test cases for the non-blocking logging pipeline."""
+
+import io
+import json
+import logging
+import unittest
+
+from ark_api.core import log_pipeline
+from ark_api.core.log_pipeline import JSONFormatter, RateLimitFilter
+
+
+def make_record(msg="hello %s", args=("world",), level=logging.INFO, lineno=10, **extra):
+    record = logging.LogRecord("ark-api", level, "/app/module.py", lineno, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJSONFormatter(unittest.TestCase):
+    """Test cases for structured JSON output."""
+
+    def test_format_includes_extra_fields(self):
+        """Test that the message is merged and extra fields become keys."""
+        entry = json.loads(JSONFormatter().format(make_record(status=200, path="/v1/agents")))
+
+        self.assertEqual(entry["message"], "hello world")
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["logger"], "ark-api")
+        self.assertEqual((entry["status"], entry["path"]), (200, "/v1/agents"))
+        self.assertNotIn("args", entry)
+        self.assertNotIn("lineno", entry)
+
+    def test_format_exception(self):
+        """Test that exceptions are rendered into an exception key."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            import sys
+            record = make_record()
+            record.exc_info = sys.exc_info()
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        self.assertIn("ValueError: boom", entry["exception"])
+
+
+class TestRateLimitFilter(unittest.TestCase):
+    """Test cases for rate limiting of repetitive lines."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.filter = RateLimitFilter(rate=2, clock=lambda: self.now)
+
+    def test_limits_each_call_site(self):
+        """Test that a call site gets `rate` records per second and others are independent."""
+        results = [self.filter.filter(make_record()) for _ in range(4)]
+
+        self.assertEqual(results, [True, True, False, False])
+        self.assertTrue(self.filter.filter(make_record(lineno=20)))
+
+    def test_reports_suppressed_count(self):
+        """Test that the first record of the next window notes how many were dropped."""
+        for _ in range(5):
+            self.filter.filter(make_record())
+
+        self.now = 1.0
+        record = make_record()
+        self.assertTrue(self.filter.filter(record))
+        self.assertEqual(record.getMessage(), "hello world (3 similar messages suppressed)")
+
+    def test_warnings_are_never_limited(self):
+        """Test that WARNING and above always pass."""
+        results = [self.filter.filter(make_record(level=logging.WARNING)) for _ in range(5)]
+
+        self.assertTrue(all(results))
+
+
+class TestStartLogging(unittest.TestCase):
+    """Test cases for records written through the queue."""
+
+    def setUp(self):
+        root = logging.getLogger()
+        self.addCleanup(setattr, root, "handlers", root.handlers)
+        self.addCleanup(root.setLevel, root.level)
+        self.addCleanup(log_pipeline.stop_logging)
+        self.stream = io.StringIO()
+
+    def test_json_exception_survives_the_queue(self):
+        """Test that a logged exception keeps its own key and the message stays plain."""
+        log_pipeline.start_logging(logging.INFO, "json", self.stream)
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logging.getLogger("ark-api").exception("boom")
+        log_pipeline.stop_logging()
+
+        entry = json.loads(self.stream.getvalue())
+
+        self.assertEqual(entry["message"], "boom")
+        self.assertIn("ZeroDivisionError", entry["exception"])
+
+    def test_text_output_includes_traceback(self):
+        """Test that text output still appends the traceback to the line."""
+        log_pipeline.start_logging(logging.INFO, "text", self.stream)
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logging.getLogger("ark-api").exception("boom %s", 1)
+        log_pipeline.stop_logging()
+
+        output = self.stream.getvalue()
+
+        self.assertIn("boom 1\nTraceback", output)
+        self.assertIn("ZeroDivisionError", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Test cases for the request logging middleware."""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from ark_api.core.middleware import RequestLoggingMiddleware, parse_sampling
+
+
+def make_scope(path="/v1/agents", headers=None, query_string=b""):
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query_string,
+        "headers": headers or [],
+    }
+
+
+class TestRequestLoggingMiddleware(unittest.IsolatedAsyncioTestCase):
+    """Test cases for RequestLoggingMiddleware."""
+
+    async def test_logs_request_and_response(self):
+        """Test that request and response lines carry session, status and query."""
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 201, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = RequestLoggingMiddleware(app)
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = make_scope(headers=[(b"x-session-id", b"abc")], query_string=b"namespace=default")
+        with self.assertLogs("ark-api", level="INFO") as logs:
+            await middleware(scope, None, send)
+
+        self.assertIn("Request: GET /v1/agents - session=abc - Query: namespace=default", logs.output[0])
+        self.assertIn("Response: GET /v1/agents - session=abc - Status: 201", logs.output[1])
+        self.assertEqual(logs.records[1].status, 201)
+        self.assertEqual(logs.records[1].session_id, "abc")
+        self.assertEqual([m["type"] for m in sent], ["http.response.start", "http.response.body"])
+
+    async def test_streaming_messages_are_forwarded_as_sent(self):
+        """Test that each streamed chunk reaches the server before the app finishes."""
+        sent = []
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for chunk in (b"data: 1\n\n", b"data: 2\n\n"):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                # The chunk was delivered immediately, not buffered until the end
+                self.assertEqual(sent[-1]["body"], chunk)
+            await send({"type": "http.response.body", "body": b""})
+
+        async def send(message):
+            sent.append(message)
+
+        async def receive():
+            return {"type": "http.request"}
+
+        middleware = RequestLoggingMiddleware(app)
+        await middleware(make_scope(), receive, send)
+
+        self.assertEqual(len(sent), 4)
+
+    async def test_failed_request_is_logged_as_500(self):
+        """Test that an exception in the app is logged and re-raised."""
+        async def app(scope, receive, send):
+            raise RuntimeError("boom")
+
+        middleware = RequestLoggingMiddleware(app)
+        with self.assertLogs("ark-api", level="INFO") as logs:
+            with self.assertRaises(RuntimeError):
+                await middleware(make_scope(), None, None)
+
+        self.assertIn("Status: 500", logs.output[-1])
+
+    async def test_non_http_scopes_pass_through(self):
+        """Test that lifespan events are not logged."""
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append(scope["type"])
+
+        await RequestLoggingMiddleware(app)({"type": "lifespan"}, None, None)
+
+        self.assertEqual(calls, ["lifespan"])
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def noop_send(message):
+    pass
+
+
+class TestRequestSampling(unittest.IsolatedAsyncioTestCase):
+    """Test cases for per-route sampling and the slow-request log."""
+
+    def test_parse_sampling(self):
+        """Test that the longest matching prefix decides and rates are clamped."""
+        middleware = RequestLoggingMiddleware(ok_app, sampling="/v1=0.5, /v1/queries=2,/health=0,bad")
+
+        self.assertEqual(parse_sampling("/a=0.1,/a/b=0")[0], ("/a/b", 0.0))
+        self.assertEqual(middleware.sample_rate("/v1/queries/q1"), 1.0)
+        self.assertEqual(middleware.sample_rate("/v1/agents"), 0.5)
+        self.assertEqual(middleware.sample_rate("/health"), 0.0)
+        self.assertEqual(middleware.sample_rate("/docs"), 1.0)
+
+    async def test_unsampled_requests_are_not_logged(self):
+        """Test that a zero rate silences a route."""
+        middleware = RequestLoggingMiddleware(ok_app, sampling="/health=0")
+
+        with patch('ark_api.core.middleware.logger') as mock_logger:
+            await middleware(make_scope(path="/health"), None, noop_send)
+            await middleware(make_scope(path="/v1/agents"), None, noop_send)
+
+        self.assertEqual(mock_logger.info.call_count, 2)
+        self.assertTrue(all("/v1/agents" in c.args[0] for c in mock_logger.info.call_args_list))
+
+    async def test_slow_requests_are_always_logged(self):
+        """Test that a slow response is logged at WARNING even when not sampled."""
+        async def slow_app(scope, receive, send):
+            await asyncio.sleep(0.02)
+            await ok_app(scope, receive, send)
+
+        middleware = RequestLoggingMiddleware(slow_app, sampling="/v1=0", slow_request_seconds=0.01)
+
+        with self.assertLogs("ark-api", level="INFO") as logs:
+            await middleware(make_scope(), None, noop_send)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].levelname, "WARNING")
+        self.assertIn("Slow request: GET /v1/agents", logs.output[0])
+
+    async def test_long_streams_are_not_slow(self):
+        """Test that slowness of a streaming response is its time to first byte."""
+        async def stream_app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await asyncio.sleep(0.02)
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = RequestLoggingMiddleware(stream_app, sampling="", slow_request_seconds=0.01)
+
+        with self.assertLogs("ark-api", level="INFO") as logs:
+            await middleware(make_scope(), None, noop_send)
+
+        self.assertEqual([r.levelname for r in logs.records], ["INFO", "INFO"])
+
+
+if __name__ == '__main__':
+    unittest.main()
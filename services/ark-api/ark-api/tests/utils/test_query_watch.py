@@ -0,0 +1,186 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from ark_api.utils.query_watch import QueryCompletionWatcher, _is_query_finished, watch_query_completion
+
+
+def make_client(status=None, side_effect=None):
+    query = {"metadata": {"name": "q"}, "status": status or {}}
+    watcher = SimpleNamespace(wait=AsyncMock(return_value=query, side_effect=side_effect))
+    ark_client = SimpleNamespace(queries=SimpleNamespace(namespace="default"))
+    return ark_client, watcher
+
+
+class FakeQueries:
+    """Query client whose a_watch streams events put on a queue; exceptions are raised."""
+
+    def __init__(self, namespace="default"):
+        self.namespace = namespace
+        self.events = asyncio.Queue()
+        self.watches = 0
+        self.raw = None
+
+    async def a_watch(self, namespace=None, raw=False):
+        self.watches += 1
+        self.raw = raw
+        while True:
+            event = await self.events.get()
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+def query_event(event_type, name, phase=None):
+    query = {"metadata": {"name": name}}
+    if phase:
+        query["status"] = {"phase": phase}
+    return SimpleNamespace(type=event_type, object=None, raw_object=query)
+
+
+def test_is_query_finished():
+    assert not _is_query_finished({"status": None})
+    assert not _is_query_finished({"status": {"phase": "running"}})
+    assert _is_query_finished({"status": {"phase": "done"}})
+    assert _is_query_finished({"status": {"phase": "error"}})
+
+
+@pytest.mark.asyncio
+async def test_watch_query_completion_returns_response():
+    ark_client, watcher = make_client({"phase": "done", "response": {"content": "hello there"}})
+
+    with patch("ark_api.utils.query_watch.get_query_watcher", return_value=watcher):
+        completion = await watch_query_completion(ark_client, "q", "agent/a", [{"content": "hi"}], 30)
+
+    assert completion.choices[0].message.content == "hello there"
+    assert completion.ark["queryStatus"]["phase"] == "done"
+    watcher.wait.assert_awaited_once_with(ark_client.queries, "q", timeout=30)
+
+
+@pytest.mark.asyncio
+async def test_watch_query_completion_error_phase():
+    ark_client, watcher = make_client({"phase": "error", "response": {"content": "model unavailable"}})
+
+    with patch("ark_api.utils.query_watch.get_query_watcher", return_value=watcher):
+        with pytest.raises(HTTPException) as exc_info:
+            await watch_query_completion(ark_client, "q", "agent/a", [], 30)
+
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.detail["message"] == "model unavailable"
+
+
+@pytest.mark.asyncio
+async def test_watch_query_completion_timeout():
+    ark_client, watcher = make_client(side_effect=TimeoutError("timed out"))
+
+    with patch("ark_api.utils.query_watch.get_query_watcher", return_value=watcher):
+        with pytest.raises(HTTPException) as exc_info:
+            await watch_query_completion(ark_client, "q", "agent/a", [], 5)
+
+    assert exc_info.value.status_code == 504
+
+
+@pytest.mark.asyncio
+async def test_watcher_shares_one_watch_per_namespace():
+    watcher = QueryCompletionWatcher()
+    queries = FakeQueries()
+
+    waits = [asyncio.ensure_future(watcher.wait(queries, name, timeout=5)) for name in ("a", "b")]
+    await asyncio.sleep(0)
+    for event in (query_event("ADDED", "a"), query_event("MODIFIED", "b", "running"),
+                  query_event("MODIFIED", "b", "error"), query_event("MODIFIED", "a", "done")):
+        queries.events.put_nowait(event)
+
+    a, b = await asyncio.gather(*waits)
+
+    assert (a["metadata"]["name"], a["status"]["phase"]) == ("a", "done")
+    assert (b["metadata"]["name"], b["status"]["phase"]) == ("b", "error")
+    assert queries.watches == 1
+    await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_watcher_returns_queries_that_finished_before_the_wait():
+    watcher = QueryCompletionWatcher()
+    queries = FakeQueries()
+    first = asyncio.ensure_future(watcher.wait(queries, "a", timeout=5))
+    queries.events.put_nowait(query_event("MODIFIED", "b", "done"))
+    queries.events.put_nowait(query_event("MODIFIED", "a", "done"))
+    await first
+
+    query = await watcher.wait(queries, "b", timeout=5)
+
+    assert query["metadata"]["name"] == "b"
+    assert queries.watches == 1
+    await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_watcher_skips_unfinished_queries_without_models():
+    watcher = QueryCompletionWatcher()
+    queries = FakeQueries()
+    wait = asyncio.ensure_future(watcher.wait(queries, "a", timeout=5))
+    queries.events.put_nowait(query_event("ADDED", "b", "running"))
+    queries.events.put_nowait(query_event("ADDED", "c"))
+    queries.events.put_nowait(query_event("MODIFIED", "a", "done"))
+    await wait
+
+    assert queries.raw is True
+    assert watcher._watches["default"].finished == {}
+    await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_watcher_fails_wait_for_deleted_query():
+    watcher = QueryCompletionWatcher()
+    queries = FakeQueries()
+    queries.events.put_nowait(query_event("DELETED", "a"))
+
+    with pytest.raises(Exception, match="was deleted"):
+        await watcher.wait(queries, "a", timeout=5)
+    await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_watcher_timeout_removes_waiter():
+    watcher = QueryCompletionWatcher()
+    queries = FakeQueries()
+
+    with pytest.raises(TimeoutError):
+        await watcher.wait(queries, "a", timeout=0.01)
+
+    assert watcher._watches["default"].waiters == {}
+    await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_watcher_failure_fails_waits_and_restarts():
+    watcher = QueryCompletionWatcher()
+    queries = FakeQueries()
+    queries.events.put_nowait(Exception("Failed to watch Querys: forbidden"))
+
+    with pytest.raises(Exception, match="forbidden"):
+        await watcher.wait(queries, "a", timeout=5)
+    assert len(watcher) == 0
+
+    queries.events.put_nowait(query_event("MODIFIED", "a", "done"))
+    assert (await watcher.wait(queries, "a", timeout=5))["metadata"]["name"] == "a"
+    assert queries.watches == 2
+    await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_watcher_stops_idle_watch():
+    watcher = QueryCompletionWatcher(idle_seconds=0.01)
+    queries = FakeQueries()
+    queries.events.put_nowait(query_event("MODIFIED", "a", "done"))
+    await watcher.wait(queries, "a", timeout=5)
+    task = watcher._watches["default"].task
+
+    await asyncio.sleep(0.05)
+
+    assert len(watcher) == 0
+    assert task.cancelled()
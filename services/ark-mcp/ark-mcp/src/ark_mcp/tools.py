@@ -2,7 +2,6 @@
 
 import os
 import logging
-import asyncio
 from typing import Annotated, List, Dict, Any, Optional
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError, NotFoundError, ValidationError
@@ -19,6 +18,9 @@ VERSION = "v1alpha1"
 # Default namespace from environment variable
 DEFAULT_NAMESPACE = os.getenv("ARK_MCP_DEFAULT_NAMESPACE", "default")
 
+# Query phases after which a query no longer changes
+TERMINAL_PHASES = ("done", "error", "canceled")
+
 
 class Agent(BaseModel):
     """Agent response model."""
@@ -126,38 +128,38 @@ async def get_query_sdk(name: str, namespace: str = DEFAULT_NAMESPACE) -> Dict[s
 async def wait_for_query_completion_sdk(
     name: str, 
     namespace: str = DEFAULT_NAMESPACE, 
-    timeout_seconds: int = 300,
-    poll_interval: float = 2.0
+    timeout_seconds: int = 300
 ) -> Dict[str, Any]:
     """Wait for query to complete and return final status with results."""
-    start_time = asyncio.get_event_loop().time()
+    try:
+        async with with_ark_client(namespace, VERSION) as ark_client:
+            query = await ark_client.queries.a_wait_for(
+                name,
+                lambda q: q.status is not None and q.status.phase in TERMINAL_PHASES,
+                timeout=timeout_seconds
+            )
+    except TimeoutError as e:
+        raise ToolError(f"Query '{name}' timed out after {timeout_seconds} seconds") from e
+    except Exception as e:
+        if "not found" in str(e).lower():
+            raise NotFoundError(f"Query '{name}' not found in namespace '{namespace}'") from e
+        logger.error(f"Failed to wait for query '{name}': {e}")
+        raise ToolError(f"Could not wait for query '{name}': {str(e)}") from e
     
-    while True:
-        current_time = asyncio.get_event_loop().time()
-        if current_time - start_time > timeout_seconds:
-            raise ToolError(f"Query '{name}' timed out after {timeout_seconds} seconds")
-        
-        query_result = await get_query_sdk(name, namespace)
-        status = query_result.get("status", {})
-        phase = status.get("phase", "pending")
-        
-        logger.info(f"Query {name} status: {phase}")
-        
-        # Terminal phases
-        if phase in ["done", "error", "canceled"]:
-            return {
-                "name": name,
-                "namespace": namespace,
-                "phase": phase,
-                "status": status,
-                "responses": status.get("responses", []),
-                "evaluations": status.get("evaluations", []),
-                "tokenUsage": status.get("tokenUsage", {}),
-                "success": phase == "done"
-            }
-        
-        # Wait before next poll
-        await asyncio.sleep(poll_interval)
+    status = query.to_dict().get("status", {})
+    phase = status.get("phase", "pending")
+    logger.info(f"Query {name} status: {phase}")
+    
+    return {
+        "name": name,
+        "namespace": namespace,
+        "phase": phase,
+        "status": status,
+        "responses": status.get("responses", []),
+        "evaluations": status.get("evaluations", []),
+        "tokenUsage": status.get("tokenUsage", {}),
+        "success": phase == "done"
+    }
 
 
 def register_tools(mcp: FastMCP):
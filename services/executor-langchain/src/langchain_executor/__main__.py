@@ -22,8 +22,8 @@ def main() -> None:
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
 
-    # Start the web server
-    app_instance.run(host=host, port=port)
+    # Start the web server; with EXECUTOR_WORKERS > 1 each worker builds the app from the factory
+    app_instance.run(host=host, port=port, factory="langchain_executor.app:create_app")
 
 
 if __name__ == "__main__":